@@ -0,0 +1,119 @@
+"""Configuration and fixtures for the benchmark suite.
+
+Run with ``tox -e benchmark`` or ``pytest benchmarks/``. Use ``--sizes`` to
+choose the number of authors, e.g., ``pytest benchmarks/ --sizes 10,1000``.
+"""
+
+import tracemalloc
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Callable
+
+import pandas as pd
+import pytest
+
+from authorship.models import Authorship
+from authorship.readers import SheetReader
+from benchmarks.synthetic import get_hoyt_df, get_obo_df
+
+DEFAULT_SIZES = "10,1000,10000,100000"
+#: The number of extra columns, e.g., for notes, in exported sheets
+N_EXTRA_COLUMNS = 20
+
+
+def pytest_addoption(parser):
+    """Add an option for the number of authors in the synthetic sheets."""
+    parser.addoption(
+        "--sizes",
+        default=DEFAULT_SIZES,
+        help=f"Comma-separated numbers of authors to benchmark. Defaults to {DEFAULT_SIZES}",
+    )
+
+
+def pytest_generate_tests(metafunc):
+    """Parametrize benchmarks that take a size with the numbers of authors."""
+    if "size" in metafunc.fixturenames:
+        sizes = [int(size) for size in metafunc.config.getoption("sizes").split(",")]
+        metafunc.parametrize("size", sizes)
+
+
+@lru_cache(maxsize=None)
+def cached_hoyt_df(size: int) -> pd.DataFrame:
+    """Get a synthetic Hoyt-style sheet, shared between benchmarks."""
+    return get_hoyt_df(size)
+
+
+@lru_cache(maxsize=None)
+def cached_obo_df(size: int) -> pd.DataFrame:
+    """Get a synthetic OBO-style sheet, shared between benchmarks."""
+    return get_obo_df(size)
+
+
+@lru_cache(maxsize=None)
+def cached_authorship(size: int) -> Authorship:
+    """Get the authorship for a synthetic Hoyt-style sheet, shared between benchmarks."""
+    return SheetReader(cached_hoyt_df(size)).get_authorship()
+
+
+def get_rounds(size: int) -> int:
+    """Get a number of rounds that keeps large benchmarks reasonably fast."""
+    if size >= 100_000:
+        return 1
+    if size >= 10_000:
+        return 3
+    return 10
+
+
+def run(benchmark, func: Callable[..., Any], size: int, setup: Callable[[], Any]) -> Any:
+    """Benchmark a function and record its peak memory use in the extra info.
+
+    :param benchmark: The pytest-benchmark fixture
+    :param func: The function to benchmark, which takes the arguments returned by ``setup``
+    :param size: The number of authors
+    :param setup: A function run before each round (outside the timing) that returns
+        the positional arguments for ``func``. This is where caches should be cleared.
+    :returns: The result of the function
+    """
+    args = setup()
+    tracemalloc.start()
+    try:
+        func(*args)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    benchmark.extra_info["authors"] = size
+    benchmark.extra_info["peak_memory_mb"] = round(peak / 2**20, 3)
+    return benchmark.pedantic(
+        func, setup=lambda: (setup(), {}), rounds=get_rounds(size), iterations=1
+    )
+
+
+@pytest.fixture
+def hoyt_df(size: int) -> pd.DataFrame:
+    """Get a synthetic Hoyt-style sheet with the given number of authors."""
+    return cached_hoyt_df(size)
+
+
+@pytest.fixture
+def obo_df(size: int) -> pd.DataFrame:
+    """Get a synthetic OBO-style sheet with the given number of authors."""
+    return cached_obo_df(size)
+
+
+@pytest.fixture
+def hoyt_path(size: int, tmp_path_factory) -> Path:
+    """Get a TSV export of a synthetic Hoyt-style sheet with extra columns for notes.
+
+    Like the template, the first row has instructions.
+    """
+    df = cached_hoyt_df(size)
+    df = df.assign(**{f"Notes {i}": "Lorem ipsum dolor sit amet" for i in range(N_EXTRA_COLUMNS)})
+    path = tmp_path_factory.mktemp("sheets").joinpath("sheet.tsv")
+    path.write_text("Instructions\n" + df.to_csv(sep="\t", index=False))
+    return path
+
+
+@pytest.fixture
+def authorship(size: int) -> Authorship:
+    """Get a synthetic authorship with the given number of authors."""
+    return cached_authorship(size)
@@ -0,0 +1,69 @@
+"""Benchmark merging similar institution names.
+
+Makes author lists with many distinct institutions, each spelled in a few ways
+(e.g., with a city after a comma, in a different case, or abbreviated), and prints
+the time :func:`authorship.dedupe.dedupe_institutions` takes and how many pairs of
+names it compares, against the number of pairs there are.
+
+Run with ``python -m benchmarks.dedupe``.
+"""
+
+import random
+import time
+
+import click
+
+from authorship.dedupe import dedupe_institutions
+from authorship.models import Author, Authorship, Institution
+from benchmarks.synthetic import _word
+
+SIZES = [1_000, 5_000, 20_000]
+
+
+def _get_authorship(n_institutions: int, seed: int = 0) -> Authorship:
+    rng = random.Random(seed)  # noqa:S311
+    names = []
+    for _ in range(n_institutions):
+        name = (
+            f"{rng.choice(['Institute', 'University', 'Laboratory'])} of {_word(rng)} {_word(rng)}"
+        )
+        names.append(name)
+        if rng.random() < 0.5:
+            names.append(f"{name}, {_word(rng, 6).title()}")
+        if rng.random() < 0.3:
+            names.append(name.upper().replace("UNIVERSITY", "UNIV.").replace("LABORATORY", "LAB"))
+    institutions = [Institution(name=name) for name in names]
+    authors = [
+        Author(first="A", last=str(i), email="", orcid="", institutions=[institution])
+        for i, institution in enumerate(institutions)
+    ]
+    return Authorship.model_construct(authors=authors, institutions=institutions)
+
+
+@click.command()
+@click.option("--repeat", type=int, default=3, show_default=True)
+def main(repeat: int):
+    """Time merging similar institution names."""
+    from authorship.instrument import Profile
+
+    click.echo(
+        f"{'names':>7}  {'merged into':>11}  {'time (s)':>8}  {'compared':>10}  {'pairs':>12}"
+    )
+    for size in SIZES:
+        authorship = _get_authorship(size)
+        best = float("inf")
+        for _ in range(repeat):
+            start = time.perf_counter()
+            _, report = dedupe_institutions(authorship)
+            best = min(best, time.perf_counter() - start)
+        with Profile() as profile:
+            dedupe_institutions(authorship)
+        n = report.n_before
+        click.echo(
+            f"{n:>7}  {report.n_after:>11}  {best:>8.3f}"
+            f"  {profile.counters['institution_comparisons']:>10,.0f}  {n * (n - 1) // 2:>12,}"
+        )
+
+
+if __name__ == "__main__":
+    main()
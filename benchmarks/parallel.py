@@ -0,0 +1,61 @@
+"""Benchmark sharding the construction of authors between processes.
+
+Prints the time :class:`authorship.readers.SheetReader` takes for each number of
+processes and the speedup over constructing the authors in this process.
+
+Run with ``python -m benchmarks.parallel``.
+"""
+
+import os
+import time
+
+import click
+
+from authorship.memo import clear_caches
+from authorship.readers import SheetReader
+from benchmarks.synthetic import get_hoyt_df
+
+SIZES = [10_000, 100_000]
+
+
+def _time(reader: SheetReader, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        clear_caches()
+        start = time.perf_counter()
+        reader.get_authorship()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+@click.command()
+@click.option("--repeat", type=int, default=3, show_default=True)
+@click.option(
+    "--max-jobs",
+    type=int,
+    default=os.cpu_count() or 1,
+    show_default=True,
+    help="The largest number of processes. Powers of two up to it are tried.",
+)
+def main(repeat: int, max_jobs: int):
+    """Compare the sheet reader with different numbers of processes."""
+    n_jobs_list = sorted({1, max_jobs, *(2**i for i in range(max_jobs.bit_length()))})
+    n_jobs_list = [n_jobs for n_jobs in n_jobs_list if n_jobs <= max_jobs]
+    click.echo(f"{os.cpu_count()} CPUs available")
+    click.echo(f"{'authors':>8}  {'n_jobs':>6}  {'time (s)':>8}  {'speedup':>7}")
+    for size in SIZES:
+        df = get_hoyt_df(size)
+        expected = SheetReader(df).get_authorship()
+        baseline = None
+        for n_jobs in n_jobs_list:
+            reader = SheetReader(df, n_jobs=n_jobs)
+            clear_caches()
+            if reader.get_authorship() != expected:
+                raise ValueError(f"output differs with n_jobs={n_jobs} for n={size}")
+            seconds = _time(reader, repeat)
+            baseline = baseline or seconds
+            click.echo(f"{size:>8}  {n_jobs:>6}  {seconds:>8.4f}  {baseline / seconds:>6.2f}x")
+
+
+if __name__ == "__main__":
+    main()
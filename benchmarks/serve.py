@@ -0,0 +1,79 @@
+"""Benchmark the latency of the render server against the command line interface.
+
+Each cold request runs ``authorship render`` in a new process, which imports the
+package and reads the sheet. Each warm request is served from memory by a server
+started with :func:`authorship.server.make_server`.
+
+Run with ``python -m benchmarks.serve``.
+"""
+
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+from urllib.parse import urlencode
+from urllib.request import urlopen
+
+import click
+
+from authorship.server import RenderService, make_server
+from benchmarks.synthetic import get_hoyt_df
+
+
+def _percentiles(seconds: list[float]) -> tuple[float, float]:
+    """Get the 50th and 99th percentiles, in milliseconds."""
+    quantiles = statistics.quantiles(seconds, n=100, method="inclusive")
+    return 1000 * quantiles[49], 1000 * quantiles[98]
+
+
+def _time(func, repeat: int) -> list[float]:
+    rv = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        rv.append(time.perf_counter() - start)
+    return rv
+
+
+@click.command()
+@click.option("--size", type=int, default=1_000, show_default=True, help="The number of authors")
+@click.option("--writer", default="biorxiv", show_default=True)
+@click.option("--cold-repeat", type=int, default=20, show_default=True)
+@click.option("--warm-repeat", type=int, default=1_000, show_default=True)
+def main(size: int, writer: str, cold_repeat: int, warm_repeat: int):
+    """Compare the latency of cold command line renderings and warm server requests."""
+    with tempfile.TemporaryDirectory() as directory:
+        path = Path(directory).joinpath("sheet.tsv")
+        path.write_text("Instructions\n" + get_hoyt_df(size).to_csv(sep="\t", index=False))
+
+        command = [sys.executable, "-m", "authorship", "render", str(path), "-w", writer]
+        cold = _time(lambda: subprocess.run(command, check=True, capture_output=True), cold_repeat)
+
+        server = make_server(RenderService(root_directory=directory), port=0)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        query = urlencode({"sheet": path, "writer": writer})
+        url = f"http://127.0.0.1:{server.server_address[1]}/render?{query}"
+        try:
+            with urlopen(url) as response:  # noqa:S310
+                first = response.read()
+            warm = _time(lambda: urlopen(url).read(), warm_repeat)  # noqa:S310
+        finally:
+            server.shutdown()
+            server.server_close()
+
+        if first.decode("utf-8") + "\n" != subprocess.check_output(command).decode("utf-8"):
+            raise ValueError("the server's output differs from the command line's output")
+
+    click.echo(f"{size:,} authors rendered with {writer}")
+    click.echo(f"{'path':>6}  {'requests':>8}  {'p50 (ms)':>9}  {'p99 (ms)':>9}")
+    for name, seconds in [("cold", cold), ("warm", warm)]:
+        p50, p99 = _percentiles(seconds)
+        click.echo(f"{name:>6}  {len(seconds):>8}  {p50:>9.2f}  {p99:>9.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+"""Benchmark :class:`authorship.readers.SheetReader` against the row-wise implementation.
+
+Run with ``python -m benchmarks.sheet_reader``.
+"""
+
+import time
+
+import click
+import pandas as pd
+
+from authorship.constants import hoyt_sort_key, safe
+from authorship.models import Author, Authorship, Institution
+from authorship.readers import SheetReader
+from benchmarks.synthetic import get_hoyt_df
+
+SIZES = [100, 1_000, 5_000, 10_000, 20_000, 50_000]
+
+
+def get_authorship_rowwise(df: pd.DataFrame) -> Authorship:
+    """Get authors and institutions with the original row-by-row implementation."""
+    column_to_idx = {column: i for i, column in enumerate(df.columns)}
+    rows = sorted(df.values, key=hoyt_sort_key)
+    institutions = {}
+    for row in rows:
+        for keys in [
+            ("Affiliation", "Affiliation Address", "Affiliation ROR/Wikidata"),
+            ("Affiliation 2", "Affiliation 2 Address", "Affiliation 2 ROR/Wikidata"),
+        ]:
+            name, address, uri = (safe(row[column_to_idx[key]]) for key in keys)
+            if name is None:
+                continue
+            if pd.isna(uri):
+                ror = None
+                wikidata = None
+            elif uri.startswith("https://ror.org/"):
+                ror = uri.removeprefix("https://ror.org/")
+                wikidata = None
+            elif uri.startswith("https://www.wikidata.org/wiki/"):
+                ror = None
+                wikidata = uri.removeprefix("https://www.wikidata.org/wiki/Q10279363")
+            else:
+                ror = None
+                wikidata = None
+            institutions[name] = Institution(name=name, address=address, wikidata=wikidata, ror=ror)
+    authors = [
+        Author(
+            first=safe(row[0]),
+            middle=safe(row[1]),
+            last=safe(row[2]),
+            role=safe(row[3]),
+            email=safe(row[4]),
+            orcid=safe(row[5]),
+            wikidata=(
+                row[6].removeprefix("https://www.wikidata.org/wiki/") if pd.notna(row[6]) else None
+            ),
+            twitter=row[7].removeprefix("@") if pd.notna(row[7]) else None,
+            institutions=[
+                institutions[row[column_to_idx[key]]]
+                for key in ["Affiliation", "Affiliation 2"]
+                if pd.notna(row[column_to_idx[key]])
+            ],
+            conflict=safe(row[14]),
+        )
+        for row in rows
+    ]
+    return Authorship(authors=authors, institutions=list(institutions.values()))
+
+
+def _time(func, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+@click.command()
+@click.option("--repeat", type=int, default=3, show_default=True)
+def main(repeat: int):
+    """Compare the row-wise and vectorized sheet readers."""
+    click.echo(f"{'authors':>8}  {'row-wise (s)':>12}  {'vectorized (s)':>14}  {'speedup':>7}")
+    for size in SIZES:
+        df = get_hoyt_df(size)
+        reader = SheetReader(df)
+        if reader.get_authorship() != get_authorship_rowwise(df):
+            raise ValueError(f"vectorized output differs from row-wise output for n={size}")
+        rowwise = _time(lambda: get_authorship_rowwise(df), repeat)  # noqa:B023
+        vectorized = _time(reader.get_authorship, repeat)
+        click.echo(
+            f"{size:>8}  {rowwise:>12.4f}  {vectorized:>14.4f}  {rowwise / vectorized:>6.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
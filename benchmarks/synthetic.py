@@ -0,0 +1,155 @@
+"""Generate synthetic author sheets for benchmarking."""
+
+import random
+import string
+from typing import Optional
+
+import pandas as pd
+
+from authorship.readers.obo_sheet import COLUMNS as OBO_COLUMNS
+
+__all__ = [
+    "HOYT_COLUMNS",
+    "get_hoyt_df",
+    "get_obo_df",
+]
+
+HOYT_COLUMNS = [
+    "First Name",
+    "Middle Name",
+    "Last Name",
+    "Role",
+    "Email",
+    "ORCID",
+    "Wikidata",
+    "Twitter",
+    "Affiliation",
+    "Affiliation Address",
+    "Affiliation ROR/Wikidata",
+    "Affiliation 2",
+    "Affiliation 2 Address",
+    "Affiliation 2 ROR/Wikidata",
+    "Conflicts of Interest",
+]
+
+
+def _word(rng: random.Random, length: int = 8) -> str:
+    return rng.choice(string.ascii_uppercase) + "".join(
+        rng.choices(string.ascii_lowercase, k=length - 1)
+    )
+
+
+def _orcid(rng: random.Random) -> str:
+    digits = "".join(rng.choices(string.digits, k=15))
+    total = 0
+    for digit in digits:
+        total = (total + int(digit)) * 2
+    check = (12 - total % 11) % 11
+    full = digits + ("X" if check == 10 else str(check))
+    return "-".join(full[i : i + 4] for i in range(0, 16, 4))
+
+
+def get_hoyt_df(n: int, *, n_institutions: Optional[int] = None, seed: int = 0) -> pd.DataFrame:
+    """Get a synthetic dataframe following the Hoyt-style sheet layout.
+
+    :param n: The number of authors
+    :param n_institutions: The number of distinct institutions. Defaults to a tenth of
+        the number of authors, which is typical for consortium papers.
+    :param seed: The random seed
+    :returns: A dataframe with string values and NaNs for missing values, like the
+        one returned by :func:`authorship.constants.get_hoyt_google_sheets_df`
+    """
+    rng = random.Random(seed)  # noqa:S311
+    if n_institutions is None:
+        n_institutions = max(1, n // 10)
+    institutions = [
+        (
+            f"Institute of {_word(rng)} {_word(rng)}",
+            f"{_word(rng, 6)}, {_word(rng, 5)}",
+            rng.choice(
+                [
+                    f"https://ror.org/0{''.join(rng.choices(string.ascii_lowercase, k=8))}",
+                    f"https://www.wikidata.org/wiki/Q{rng.randint(1, 10**8)}",
+                    None,
+                ]
+            ),
+        )
+        for _ in range(n_institutions)
+    ]
+    rows = []
+    for i in range(n):
+        first, last = _word(rng, 6), _word(rng, 9)
+        if i == 0:
+            role = "Lead"
+        elif i == n - 1:
+            role = "Senior"
+        else:
+            role = rng.choice([None] * 18 + ["Lead", "Senior"])
+        affiliation = rng.choice(institutions)
+        affiliation_2 = rng.choice(institutions) if rng.random() < 0.3 else (None, None, None)
+        rows.append(
+            (
+                first,
+                _word(rng, 1) if rng.random() < 0.3 else None,
+                last,
+                role,
+                f"{first.lower()}.{last.lower()}@example.org",
+                _orcid(rng),
+                (
+                    f"https://www.wikidata.org/wiki/Q{rng.randint(1, 10**8)}"
+                    if rng.random() < 0.5
+                    else None
+                ),
+                f"@{first.lower()}" if rng.random() < 0.3 else None,
+                *affiliation,
+                *affiliation_2,
+                "None declared" if rng.random() < 0.1 else None,
+            )
+        )
+    return pd.DataFrame(rows, columns=HOYT_COLUMNS, dtype=str)
+
+
+def get_obo_df(n: int, *, n_institutions: Optional[int] = None, seed: int = 0) -> pd.DataFrame:
+    """Get a synthetic dataframe following the OBO community-style sheet layout.
+
+    :param n: The number of authors
+    :param n_institutions: The number of institutions in the organization table on the
+        right side of the sheet. Defaults to a tenth of the number of authors.
+    :param seed: The random seed
+    :returns: A dataframe with string values and NaNs for missing values, like the
+        one returned by :func:`authorship.constants.get_obo_google_sheets_df`
+    """
+    rng = random.Random(seed)  # noqa:S311
+    if n_institutions is None:
+        n_institutions = max(1, n // 10)
+    rows = []
+    for i in range(max(n, n_institutions)):
+        if i < n:
+            first, last = _word(rng, 6), _word(rng, 9)
+            codes = rng.sample(
+                range(1, n_institutions + 1), k=min(n_institutions, rng.randint(1, 3))
+            )
+            author = [
+                first,
+                _word(rng, 1) if rng.random() < 0.3 else None,
+                last,
+                str(i + 1),
+                "y",
+                f"{first.lower()}.{last.lower()}@example.org",
+                _orcid(rng),
+                (
+                    f"https://www.wikidata.org/wiki/Q{rng.randint(1, 10**8)}"
+                    if rng.random() < 0.5
+                    else None
+                ),
+                f"@{first.lower()}" if rng.random() < 0.3 else None,
+                ", ".join(map(str, codes)),
+            ]
+        else:
+            author = [None] * len(OBO_COLUMNS)
+        if i < n_institutions:
+            organization = [str(i + 1), f"Institute of {_word(rng)}, {_word(rng, 6)}"]
+        else:
+            organization = [None, None]
+        rows.append(author + organization)
+    return pd.DataFrame(rows, columns=[*OBO_COLUMNS, "Code", "Organization"], dtype=str)
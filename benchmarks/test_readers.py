@@ -0,0 +1,48 @@
+"""Benchmarks for readers."""
+
+from authorship.constants import read_sheet
+from authorship.memo import clear_caches
+from authorship.readers import ArrowReader, OboSheetReader, SheetFileReader, SheetReader
+from authorship.writers import ArrowWriter
+from benchmarks.conftest import run
+
+
+def _cleared(reader):
+    def _setup():
+        clear_caches()
+        return (reader,)
+
+    return _setup
+
+
+def test_sheet_reader(benchmark, hoyt_df, size):
+    """Benchmark parsing a Hoyt-style sheet."""
+    authorship = run(benchmark, SheetReader.get_authorship, size, _cleared(SheetReader(hoyt_df)))
+    assert len(authorship.authors) == size
+
+
+def test_obo_sheet_reader(benchmark, obo_df, size):
+    """Benchmark parsing an OBO community-style sheet."""
+    authorship = run(
+        benchmark, OboSheetReader.get_authorship, size, _cleared(OboSheetReader(obo_df))
+    )
+    assert len(authorship.authors) == size
+
+
+def test_arrow_reader(benchmark, authorship, size, tmp_path):
+    """Benchmark reloading an authorship from memory-mapped Arrow tables."""
+    ArrowWriter().write(authorship, path=tmp_path)
+    rv = run(benchmark, ArrowReader.get_authorship, size, lambda: (ArrowReader(tmp_path),))
+    assert len(rv.authors) == size
+
+
+def test_read_sheet(benchmark, hoyt_path, size):
+    """Benchmark loading an exported sheet by parsing all columns, like for google sheets."""
+    df = run(benchmark, read_sheet, size, lambda: (hoyt_path, 1))
+    assert len(df) == size
+
+
+def test_sheet_file_reader(benchmark, hoyt_path, size):
+    """Benchmark loading an exported sheet by only parsing the needed columns."""
+    df = run(benchmark, SheetFileReader.load_df, size, lambda: (SheetFileReader(hoyt_path),))
+    assert len(df) == size
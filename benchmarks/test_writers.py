@@ -0,0 +1,24 @@
+"""Benchmarks for writers."""
+
+import pytest
+
+from authorship.models import Authorship
+from authorship.writers import writer_resolver
+from benchmarks.conftest import run
+
+
+@pytest.mark.parametrize("writer", sorted(writer_resolver.lookup_dict))
+def test_writer(benchmark, authorship, size, writer):
+    """Benchmark rendering an authorship with each writer."""
+    _writer = writer_resolver.make(writer)
+
+    def _setup():
+        # a fresh copy, so the affiliation index isn't cached between rounds
+        return (
+            Authorship.model_construct(
+                authors=authorship.authors, institutions=authorship.institutions
+            ),
+        )
+
+    lines = run(benchmark, _writer.to_lines, size, _setup)
+    assert len(lines) >= size
@@ -1,39 +1,58 @@
 # -*- coding: utf-8 -*-
 
-"""Format author lists for academic texts and journal submissions."""
-
-from .models import Author, Authorship, Institution
-from .readers import (
-    GoogleSheetReader,
-    OboGoogleSheetReader,
-    OboSheetReader,
-    PreparedReader,
-    Reader,
-    SheetReader,
-    reader_resolver,
-)
-from .writers import (
-    BiorxivWriter,
-    CitationCFFWriter,
-    ScientificDataWriter,
-    TextWriter,
-    Writer,
-    writer_resolver,
-)
+"""Format author lists for academic texts and journal submissions.
+
+The names below are imported from their submodules on first access, so that
+``import authorship`` (e.g., for the command line interface) stays fast.
+"""
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .corpus import AuthorshipCorpus
+    from .models import AffiliationIndex, Author, Authorship, Institution, InstitutionRegistry
+    from .readers import (
+        ArrowReader,
+        GoogleSheetReader,
+        OboGoogleSheetReader,
+        OboSheetFileReader,
+        OboSheetReader,
+        PreparedReader,
+        Reader,
+        SheetFileReader,
+        SheetReader,
+        reader_resolver,
+    )
+    from .writers import (
+        ArrowWriter,
+        BiorxivWriter,
+        CitationCFFWriter,
+        ParquetWriter,
+        ScientificDataWriter,
+        TextWriter,
+        Writer,
+        writer_resolver,
+    )
 
 __all__ = [
     # Models
     "Institution",
     "Author",
     "Authorship",
+    "AffiliationIndex",
+    "InstitutionRegistry",
     # Readers
     "reader_resolver",
     "Reader",
     "PreparedReader",
     "OboSheetReader",
     "OboGoogleSheetReader",
+    "OboSheetFileReader",
     "SheetReader",
     "GoogleSheetReader",
+    "SheetFileReader",
+    "ArrowReader",
     # Writers
     "writer_resolver",
     "Writer",
@@ -41,4 +60,42 @@ __all__ = [
     "TextWriter",
     "ScientificDataWriter",
     "CitationCFFWriter",
+    "ArrowWriter",
+    "ParquetWriter",
+    # Corpus
+    "AuthorshipCorpus",
 ]
+
+#: A dictionary from the names in :data:`__all__` to the submodules they're imported from
+_SUBMODULES = {
+    **dict.fromkeys(
+        ["Institution", "Author", "Authorship", "AffiliationIndex", "InstitutionRegistry"],
+        ".models",
+    ),
+    "AuthorshipCorpus": ".corpus",
+    **dict.fromkeys(
+        (name for name in __all__ if name.endswith(("Reader", "reader_resolver"))), ".readers"
+    ),
+    **dict.fromkeys(
+        (name for name in __all__ if name.endswith(("Writer", "writer_resolver"))), ".writers"
+    ),
+}
+
+
+def __getattr__(name: str) -> Any:
+    submodule = _SUBMODULES.get(name)
+    if submodule is None:
+        # submodules, like authorship.readers, can also be accessed as attributes
+        try:
+            return import_module(f".{name}", __name__)
+        except ModuleNotFoundError as e:
+            if e.name != f"{__name__}.{name}":
+                raise
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(submodule, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted([*globals(), *__all__])
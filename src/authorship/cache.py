@@ -0,0 +1,180 @@
+"""A persistent, on-disk cache for Google Sheets exports.
+
+The raw TSV export of each sheet is stored under a configurable directory
+alongside a small JSON file with its HTTP validators (``ETag`` and
+``Last-Modified``). This means that, depending on the time-to-live, a cached
+export is either served directly or cheaply revalidated with a conditional
+request before being served.
+
+.. code-block:: python
+
+    from authorship.cache import SheetCache
+    from authorship.readers import GoogleSheetReader
+
+    cache = SheetCache(ttl=60 * 60)
+    reader = GoogleSheetReader("1Fo1YH3ZzOVrQ4wzKnBm6sPha5hZG66-u-uSMDGUvguI", cache=cache)
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import re
+import tempfile
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Optional, Union
+
+from .client import SheetClient
+from .constants import GOOGLE_SHEETS_URL, read_sheet
+from .instrument import count, span
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+__all__ = [
+    "SheetCache",
+    "get_default_directory",
+]
+
+logger = logging.getLogger(__name__)
+
+#: The environment variable for overriding the default cache directory
+ENV_VAR = "AUTHORSHIP_HOME"
+#: The pattern for google sheet and sheet identifiers, which are used in file names
+IDENTIFIER_PATTERN = re.compile(r"[\w-]+")
+
+
+def get_default_directory() -> Path:
+    """Get the default cache directory, which can be overridden with ``AUTHORSHIP_HOME``."""
+    home = os.environ.get(ENV_VAR)
+    if home:
+        return Path(home).expanduser().resolve().joinpath("sheets")
+    return Path.home().joinpath(".data", "authorship", "sheets")
+
+
+class SheetCache:
+    """A persistent cache for Google Sheets TSV exports."""
+
+    def __init__(
+        self,
+        directory: Union[None, str, Path] = None,
+        *,
+        ttl: Optional[float] = None,
+        offline: bool = False,
+        url_template: str = GOOGLE_SHEETS_URL,
+        client: Optional[SheetClient] = None,
+    ):
+        """Initialize the cache.
+
+        :param directory: The directory in which exports are stored. Defaults to
+            the one given by :func:`get_default_directory`.
+        :param ttl: The number of seconds during which a cached export is served
+            without contacting the server. Defaults to none, meaning that cached exports
+            are always revalidated with a conditional request.
+        :param offline: If true, never contact the server and serve cached exports
+            regardless of their age
+        :param url_template: The template for the export URL, which gets formatted with
+            ``google_sheet`` and ``gid``. This can be changed to point to a local server
+            for testing.
+        :param client: The HTTP client used for downloading. Defaults to a new client
+            with its own connection pool.
+        """
+        self.directory = get_default_directory() if directory is None else Path(directory)
+        self.ttl = ttl
+        self.offline = offline
+        self.url_template = url_template
+        self.client = SheetClient() if client is None else client
+
+    def get_url(self, google_sheet: str, gid: Union[str, int] = 0) -> str:
+        """Get the URL for the TSV export of a sheet."""
+        return self.url_template.format(google_sheet=google_sheet, gid=gid)
+
+    def _get_paths(self, google_sheet: str, gid: Union[str, int]) -> tuple[Path, Path]:
+        # identifiers become file names, so they can't have path separators or dots
+        for value in (google_sheet, str(gid)):
+            if not IDENTIFIER_PATTERN.fullmatch(value):
+                raise ValueError(f"invalid google sheet identifier: {value!r}")
+        stem = f"{google_sheet}_{gid}"
+        return self.directory.joinpath(f"{stem}.tsv"), self.directory.joinpath(f"{stem}.json")
+
+    @span("fetch")
+    def get_path(self, google_sheet: str, gid: Union[str, int] = 0) -> Path:
+        """Get the path to an up-to-date export of a sheet, downloading it if necessary.
+
+        :param google_sheet: The identifier of the google sheet
+        :param gid: The sheet identifier (in case there are more than one)
+        :returns: The path to the cached TSV export
+        :raises ValueError: If an identifier isn't made of letters, digits, ``_``, and ``-``
+        :raises FileNotFoundError: If the cache is offline and the sheet has never been downloaded
+        :raises OSError: If the sheet can't be downloaded and it has never been downloaded
+        """
+        path, metadata_path = self._get_paths(google_sheet, gid)
+        metadata: dict[str, Any] = (
+            json.loads(metadata_path.read_text()) if metadata_path.is_file() else {}
+        )
+        cached = path.is_file() and bool(metadata)
+        if self.offline:
+            if not cached:
+                raise FileNotFoundError(f"{google_sheet} (gid={gid}) is not cached at {path}")
+            count("sheet_cache_hits")
+            return path
+        if cached and self.ttl is not None and time.time() - metadata["fetched"] < self.ttl:
+            count("sheet_cache_hits")
+            return path
+
+        url = self.get_url(google_sheet, gid)
+        headers = {}
+        if cached and metadata.get("etag"):
+            headers["If-None-Match"] = metadata["etag"]
+        if cached and metadata.get("last_modified"):
+            headers["If-Modified-Since"] = metadata["last_modified"]
+        try:
+            response = self.client.get(url, headers)
+        except OSError as e:
+            if not cached:
+                raise
+            logger.warning("[%s] failed to revalidate (%s), serving stale export", url, e)
+            count("sheet_cache_hits")
+            return path
+        if response.status == 304:
+            count("sheet_cache_hits")
+            metadata["fetched"] = time.time()
+            _write(metadata_path, json.dumps(metadata).encode())
+            return path
+
+        count("sheet_cache_misses")
+        _write(path, response.body)
+        metadata = {
+            "url": url,
+            "etag": response.headers.get("ETag"),
+            "last_modified": response.headers.get("Last-Modified"),
+            "fetched": time.time(),
+        }
+        _write(metadata_path, json.dumps(metadata).encode())
+        return path
+
+    def get_df(self, google_sheet: str, gid: Union[str, int] = 0, *, skiprows=None) -> pd.DataFrame:
+        """Get the dataframe for a sheet.
+
+        :param google_sheet: The identifier of the google sheet
+        :param gid: The sheet identifier (in case there are more than one)
+        :param skiprows: Should rows be skipped? Since the raw export is cached,
+            the same cache entry is shared between different values for this argument.
+        :returns: A dataframe with all columns read as strings
+        """
+        return read_sheet(self.get_path(google_sheet, gid), skiprows=skiprows)
+
+    def invalidate(self, google_sheet: str, gid: Union[str, int] = 0) -> None:
+        """Remove the cached export for a sheet, if it exists."""
+        for path in self._get_paths(google_sheet, gid):
+            path.unlink(missing_ok=True)
+
+
+def _write(path: Path, content: bytes) -> None:
+    """Write atomically so concurrent readers never see a partially written file."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with tempfile.NamedTemporaryFile(dir=path.parent, prefix=f".{path.name}", delete=False) as file:
+        file.write(content)
+    os.replace(file.name, path)
@@ -14,6 +14,9 @@ later, but that will cause problems--the code will get executed twice:
 """
 
 import logging
+import sys
+import time
+from typing import Optional
 
 import click
 
@@ -26,8 +29,289 @@ logger = logging.getLogger(__name__)
 
 @click.group()
 @click.version_option()
-def main():
+@click.option(
+    "--profile",
+    is_flag=True,
+    help="Write the time spent in each stage (e.g., download, parse, and render) and counters"
+    " (e.g., rows, authors, and cache hits) to stderr.",
+)
+@click.option(
+    "--profile-output",
+    type=click.Path(dir_okay=False),
+    help="Also write cProfile statistics to this file, e.g., for pstats or snakeviz.",
+)
+@click.pass_context
+def main(ctx: click.Context, profile: bool, profile_output: Optional[str]):
     """CLI for authorship."""
+    if not profile and profile_output is None:
+        return
+    from .instrument import Profile
+
+    _profile = ctx.with_resource(Profile(cprofile=profile_output is not None))
+
+    def _report() -> None:
+        if profile_output is not None:
+            _profile.dump_stats(profile_output)
+        click.echo(_profile.to_str(), err=True)
+
+    ctx.call_on_close(_report)
+
+
+def _parse_options(options: tuple[str, ...]) -> dict:
+    """Parse ``key=value`` pairs, where values are parsed as YAML (e.g., for numbers)."""
+    import yaml
+
+    rv = {}
+    for option in options:
+        key, sep, value = option.partition("=")
+        if not sep:
+            raise click.BadParameter(f"expected key=value, got {option}", param_hint="--option")
+        rv[key.strip().replace("-", "_")] = yaml.safe_load(value)
+    return rv
+
+
+cache_directory_option = click.option(
+    "--cache-directory",
+    type=click.Path(file_okay=False),
+    help="The directory of a cache for google sheets. By default, sheets aren't cached.",
+)
+
+
+@main.command()
+@click.argument("source")
+@click.option(
+    "-r",
+    "--reader",
+    help="The name of the reader, e.g., google_sheet, obo_google_sheet, sheet_file, or arrow."
+    " Guessed from the source if not given.",
+)
+@click.option(
+    "-O",
+    "--option",
+    "options",
+    multiple=True,
+    help="A keyword argument for the reader like gid=1 or skiprows=1. Can be given many times.",
+)
+@click.option(
+    "-w",
+    "--writer",
+    "writers",
+    multiple=True,
+    help="The name of a writer, e.g., text, biorxiv, scientific_data, or citation_cff."
+    " Can be given many times. Defaults to text.",
+)
+@click.option(
+    "-d",
+    "--directory",
+    type=click.Path(file_okay=False),
+    help="A directory to write the output of each writer to, using their default file names.",
+)
+@click.option(
+    "-o",
+    "--output",
+    type=click.File("w"),
+    default="-",
+    help="The file for the output of a single writer. Defaults to stdout.",
+)
+@click.option(
+    "--snapshot",
+    type=click.Path(dir_okay=False),
+    help="A JSON file with the previous rendering, so only the lines of changed authors are"
+    " made again. It's updated and a report of the changes is written to stderr.",
+)
+@click.option(
+    "--enrich",
+    is_flag=True,
+    help="Fill in missing homepages, addresses, and identifiers from ORCID, Wikidata, and ROR."
+    " Lookups are cached in the authorship home directory.",
+)
+@click.option(
+    "--dedupe",
+    is_flag=True,
+    help="Merge institutions with similar names, e.g., with and without a city, and write a"
+    " report of the merges to stderr.",
+)
+@cache_directory_option
+def render(
+    source, reader, options, writers, directory, output, snapshot, enrich, dedupe, cache_directory
+):
+    """Render the authorship from a SOURCE, like a google sheet identifier or a file.
+
+    For example: authorship render 1Fo1YH3ZzOVrQ4wzKnBm6sPha5hZG66-u-uSMDGUvguI -w biorxiv
+    """
+    from .manifest import make_reader
+
+    writers = writers or ("text",)
+    _reader = make_reader(source, reader, _parse_options(options), cache_directory=cache_directory)
+    if enrich:
+        from .enrich import Enricher, MetadataCache
+        from .readers import PreparedReader
+
+        _reader = PreparedReader(Enricher(cache=MetadataCache()).enrich(_reader.get_authorship()))
+    if dedupe:
+        from .dedupe import dedupe_institutions
+        from .readers import PreparedReader
+
+        authorship, report = dedupe_institutions(_reader.get_authorship())
+        click.echo(report.to_str(), err=True)
+        _reader = PreparedReader(authorship)
+    if directory is not None:
+        if snapshot is not None:
+            raise click.UsageError("--snapshot can't be used with --directory")
+        _reader.export_all(writers, directory=directory)
+    elif len(writers) > 1:
+        raise click.UsageError("use --directory when rendering with several writers")
+    elif snapshot is not None:
+        from .diff import IncrementalRenderer
+
+        renderer = IncrementalRenderer(writers[0], path=snapshot)
+        _diff = renderer.render(_reader.get_authorship())
+        click.echo(renderer.to_str(), file=output)
+        click.echo(_diff.to_str(), err=True)
+    else:
+        _reader.print(writers[0], file=output)
+
+
+@main.command()
+@click.argument("previous")
+@click.argument("source")
+@click.option(
+    "-r",
+    "--reader",
+    help="The name of the reader for both sources. Guessed from each source if not given.",
+)
+@click.option(
+    "-O",
+    "--option",
+    "options",
+    multiple=True,
+    help="A keyword argument for the reader like gid=1 or skiprows=1. Can be given many times.",
+)
+@click.option("--json", "as_json", is_flag=True, help="Output a structured report as JSON.")
+@cache_directory_option
+def diff(previous, source, reader, options, as_json, cache_directory):
+    """Report the changes to the authorship from a PREVIOUS source to a new SOURCE.
+
+    For example: authorship diff authors_old.tsv authors.tsv
+    """
+    from .diff import diff_authorships
+    from .manifest import make_reader
+
+    kwargs = _parse_options(options)
+    previous_authorship, authorship = (
+        make_reader(_source, reader, kwargs, cache_directory=cache_directory).get_authorship()
+        for _source in (previous, source)
+    )
+    _diff = diff_authorships(previous_authorship, authorship)
+    click.echo(_diff.model_dump_json(indent=2) if as_json else _diff.to_str())
+
+
+@main.command()
+@click.argument("source")
+@click.option(
+    "-r",
+    "--reader",
+    help="The name of the reader. Guessed from the source if not given.",
+)
+@click.option(
+    "-O",
+    "--option",
+    "options",
+    multiple=True,
+    help="A keyword argument for the reader like gid=1 or skiprows=1. Can be given many times.",
+)
+@click.option("--json", "as_json", is_flag=True, help="Output a structured report as JSON.")
+@cache_directory_option
+def validate(source, reader, options, as_json, cache_directory):
+    """Report all the problems in a SOURCE at once, e.g., invalid ORCIDs or missing affiliations.
+
+    Fails if there are any problems. For example: authorship validate authors.tsv
+    """
+    from .manifest import make_reader
+
+    _reader = make_reader(source, reader, _parse_options(options), cache_directory=cache_directory)
+    report = _reader.validate()
+    click.echo(report.model_dump_json(indent=2) if as_json else report.to_str())
+    if not report.is_valid():
+        sys.exit(1)
+
+
+@main.command()
+@click.argument("manifest", type=click.Path(exists=True, dir_okay=False))
+@click.option(
+    "-j",
+    "--jobs",
+    "max_workers",
+    type=click.IntRange(min=1),
+    default=1,
+    show_default=True,
+    help="The number of processes that run jobs in parallel.",
+)
+@cache_directory_option
+def batch(manifest, max_workers, cache_directory):
+    """Render the authorships of many manuscripts listed in a YAML MANIFEST.
+
+    See the authorship.manifest module for the format of the manifest. The time each
+    job took is reported, and the command fails if any job failed.
+    """
+    from .manifest import load_manifest, run_jobs
+
+    _manifest = load_manifest(manifest)
+    start = time.perf_counter()
+    results = run_jobs(
+        _manifest.jobs,
+        cache_directory=cache_directory or _manifest.cache,
+        max_workers=max_workers,
+    )
+    width = max((len(result.name) for result in results), default=0)
+    for result in results:
+        status = "ok" if result.error is None else f"failed ({result.error})"
+        click.echo(f"{result.name:<{width}}  {result.seconds:8.3f}s  {status}")
+    n_failed = sum(result.error is not None for result in results)
+    click.echo(
+        f"ran {len(results)} jobs in {time.perf_counter() - start:.3f}s"
+        f" with {max_workers} worker(s), {n_failed} failed"
+    )
+    if n_failed:
+        sys.exit(1)
+
+
+@main.command()
+@click.option("--host", default="127.0.0.1", show_default=True, help="The host to bind to.")
+@click.option("--port", type=int, default=8000, show_default=True, help="The port to bind to.")
+@click.option(
+    "--socket",
+    type=click.Path(dir_okay=False),
+    help="The path of a unix socket to bind to instead of a host and port.",
+)
+@click.option(
+    "--root",
+    type=click.Path(exists=True, file_okay=False),
+    help="The directory from which local exports can be read. Without it, only google sheets"
+    " are read.",
+)
+@cache_directory_option
+def serve(host, port, socket, root, cache_directory):
+    """Run a local server that keeps authorships and their renderings in memory.
+
+    For example, after running authorship serve --root ., use
+    curl "localhost:8000/render?sheet=authors.tsv&writer=biorxiv". See the
+    authorship.server module for the endpoints.
+    """
+    from .server import RenderService, make_server
+
+    service = RenderService(cache_directory=cache_directory, root_directory=root)
+    server = make_server(service, host=host, port=port, socket=socket)
+    if socket is None:
+        click.echo(f"serving on http://{host}:{server.server_address[1]}")
+    else:
+        click.echo(f"serving on {socket}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
 
 
 if __name__ == "__main__":
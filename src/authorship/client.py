@@ -0,0 +1,165 @@
+"""A small HTTP client with pooled keep-alive connections and retries.
+
+This is used for downloading google sheets exports, where many sheets are usually
+served by the same few hosts, so reusing connections avoids a TCP and TLS
+handshake per sheet.
+"""
+
+import logging
+import threading
+import time
+from collections import defaultdict
+from email.message import Message
+from http.client import HTTPConnection, HTTPException, HTTPResponse, HTTPSConnection
+from typing import NamedTuple, Optional
+from urllib.error import HTTPError, URLError
+from urllib.parse import urljoin, urlsplit
+
+from .instrument import count
+
+__all__ = [
+    "SheetClient",
+    "Response",
+]
+
+logger = logging.getLogger(__name__)
+
+#: Statuses that are worth retrying, since they're usually transient
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+REDIRECT_STATUSES = {301, 302, 303, 307, 308}
+
+
+class Response(NamedTuple):
+    """A response from :meth:`SheetClient.get`."""
+
+    status: int
+    headers: Message
+    body: bytes
+
+
+class SheetClient:
+    """A thread-safe HTTP client that keeps a pool of keep-alive connections per host."""
+
+    def __init__(
+        self,
+        *,
+        retries: int = 3,
+        backoff: float = 0.5,
+        timeout: Optional[float] = 30,
+        max_redirects: int = 5,
+    ):
+        """Initialize the client.
+
+        :param retries: The number of times a request is retried after a connection error
+            or a transient error status (e.g., 503)
+        :param backoff: The number of seconds to wait before the first retry, which
+            doubles on each subsequent retry
+        :param timeout: The timeout, in seconds, for connecting and for each read, so a
+            stalled download fails (and is retried) instead of hanging. None means no
+            timeout.
+        :param max_redirects: The maximum number of redirects to follow. Google sheets
+            exports are redirected to a different host before being served.
+        """
+        self.retries = retries
+        self.backoff = backoff
+        self.timeout = timeout
+        self.max_redirects = max_redirects
+        self._idle: defaultdict[tuple[str, str, Optional[int]], list[HTTPConnection]] = defaultdict(
+            list
+        )
+        self._lock = threading.Lock()
+
+    def get(self, url: str, headers: Optional[dict[str, str]] = None) -> Response:
+        """Get a URL, following redirects and retrying transient errors.
+
+        :param url: The URL to get
+        :param headers: Additional request headers, e.g., for conditional requests
+        :returns: The response, whose status is either successful or 304 (not modified)
+        :raises HTTPError: If the final response has an error status
+        :raises URLError: If the server couldn't be reached after all retries
+        """
+        for attempt in range(self.retries + 1):
+            if attempt:
+                delay = self.backoff * 2 ** (attempt - 1)
+                logger.debug("[%s] retrying in %.2f seconds", url, delay)
+                time.sleep(delay)
+            try:
+                response = self._get(url, headers or {})
+            except (OSError, HTTPException) as e:
+                count("http_errors")
+                if attempt == self.retries:
+                    raise URLError(e) from e
+                continue
+            if response.status in RETRY_STATUSES and attempt < self.retries:
+                continue
+            if response.status >= 400:
+                raise HTTPError(
+                    url, response.status, f"HTTP {response.status}", response.headers, None
+                )
+            count("bytes_fetched", len(response.body))
+            return response
+        raise RuntimeError("unreachable")
+
+    def _get(self, url: str, headers: dict[str, str]) -> Response:
+        for _ in range(self.max_redirects + 1):
+            parts = urlsplit(url)
+            key = (parts.scheme, parts.hostname or "", parts.port)
+            path = f"{parts.path or '/'}?{parts.query}" if parts.query else parts.path or "/"
+            connection, reused = self._acquire(key)
+            try:
+                res, body = _request(connection, path, headers)
+            except (OSError, HTTPException):
+                connection.close()
+                if not reused:
+                    raise
+                # the server might have closed an idle connection, so try a fresh one
+                connection, _ = self._acquire(key, reuse=False)
+                try:
+                    res, body = _request(connection, path, headers)
+                except BaseException:
+                    connection.close()
+                    raise
+            except BaseException:
+                connection.close()
+                raise
+            if res.will_close:
+                connection.close()
+            else:
+                self._release(key, connection)
+            location = res.headers.get("Location")
+            if res.status in REDIRECT_STATUSES and location:
+                url = urljoin(url, location)
+                continue
+            return Response(res.status, res.headers, body)
+        raise URLError(f"too many redirects for {url}")
+
+    def _acquire(
+        self, key: tuple[str, str, Optional[int]], reuse: bool = True
+    ) -> tuple[HTTPConnection, bool]:
+        if reuse:
+            with self._lock:
+                if self._idle[key]:
+                    return self._idle[key].pop(), True
+        scheme, host, port = key
+        cls = HTTPSConnection if scheme == "https" else HTTPConnection
+        return cls(host, port, timeout=self.timeout), False
+
+    def _release(self, key: tuple[str, str, Optional[int]], connection: HTTPConnection) -> None:
+        with self._lock:
+            self._idle[key].append(connection)
+
+    def close(self) -> None:
+        """Close all idle connections."""
+        with self._lock:
+            for connections in self._idle.values():
+                for connection in connections:
+                    connection.close()
+            self._idle.clear()
+
+
+def _request(
+    connection: HTTPConnection, path: str, headers: dict[str, str]
+) -> tuple[HTTPResponse, bytes]:
+    connection.request("GET", path, headers=headers)
+    res = connection.getresponse()
+    return res, res.read()
@@ -0,0 +1,251 @@
+"""A normalized, columnar form of authorships for fast reloading.
+
+An authorship is split into three tables:
+
+1. ``authors``, with one row per author and a column for each field of
+   :class:`authorship.models.Author` except its institutions
+2. ``institutions``, with one row per unique institution and a column for each field
+   of :class:`authorship.models.Institution`. The ``listed`` column marks the rows
+   that make up :attr:`authorship.models.Authorship.institutions`, in order.
+3. ``links``, with one row per affiliation. The ``author`` and ``institution``
+   columns refer to the positions of rows in the other two tables and the
+   ``position`` column gives the order of the affiliations of each author.
+
+The tables are saved with :mod:`pyarrow` as uncompressed Arrow IPC (Feather v2)
+files, which can be memory-mapped, or as Parquet files. Install it with
+``pip install authorship[arrow]``.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Iterable, Optional, Union
+
+from .models import Author, Authorship, Institution, InstitutionRegistry, construct_many
+
+if TYPE_CHECKING:
+    import pyarrow
+
+__all__ = [
+    "to_columns",
+    "from_columns",
+    "iter_tsv_lines",
+    "write_tables",
+    "read_tables",
+    "read_authorship",
+]
+
+AUTHOR_FIELDS = [field for field in Author.model_fields if field != "institutions"]
+INSTITUTION_FIELDS = list(Institution.model_fields)
+LINK_FIELDS = ["author", "institution", "position"]
+#: The names of the tables
+TABLES = ["authors", "institutions", "links"]
+#: A dictionary from formats to file extensions
+FORMATS = {"arrow": ".arrow", "parquet": ".parquet"}
+
+Columns = dict[str, dict[str, list[Any]]]
+
+
+def to_columns(authorship: Authorship) -> Columns:
+    """Get the normalized columnar form of an authorship.
+
+    :param authorship: An authorship
+    :returns: A dictionary from the names of the tables to dictionaries from
+        column names to lists of values
+    """
+    institutions: dict[str, list[Any]] = {field: [] for field in [*INSTITUTION_FIELDS, "listed"]}
+    institution_to_id: dict[tuple[Optional[str], ...], int] = {}
+
+    def _add(institution: Institution, listed: bool) -> int:
+        for field in INSTITUTION_FIELDS:
+            institutions[field].append(getattr(institution, field))
+        institutions["listed"].append(listed)
+        return len(institutions["listed"]) - 1
+
+    for institution in authorship.institutions:
+        institution_id = _add(institution, True)
+        institution_to_id.setdefault(_get_key(institution), institution_id)
+
+    links: dict[str, list[int]] = {field: [] for field in LINK_FIELDS}
+    for author_id, author in enumerate(authorship.authors):
+        for position, institution in enumerate(author.institutions):
+            key = _get_key(institution)
+            institution_id = institution_to_id.get(key)
+            if institution_id is None:
+                institution_id = institution_to_id[key] = _add(institution, False)
+            links["author"].append(author_id)
+            links["institution"].append(institution_id)
+            links["position"].append(position)
+
+    authors = {
+        field: [getattr(author, field) for author in authorship.authors] for field in AUTHOR_FIELDS
+    }
+    return {"authors": authors, "institutions": institutions, "links": links}
+
+
+def _get_key(institution: Institution) -> tuple[Optional[str], ...]:
+    return tuple(getattr(institution, field) for field in INSTITUTION_FIELDS)
+
+
+def from_columns(columns: Columns, *, registry: Optional[InstitutionRegistry] = None) -> Authorship:
+    """Get an authorship from its normalized columnar form.
+
+    :param columns: A dictionary like the one returned by :func:`to_columns`. The
+        columns can be any sequences, e.g., lists or numpy arrays.
+    :param registry: A registry in which the institutions are interned
+    :returns: An authorship
+    """
+    import numpy as np
+
+    institution_columns = {field: columns["institutions"][field] for field in INSTITUTION_FIELDS}
+    if registry is None:
+        institutions = construct_many(Institution, institution_columns)
+    else:
+        institutions = registry.intern_many(institution_columns)
+
+    author_columns: dict[str, Any] = {field: columns["authors"][field] for field in AUTHOR_FIELDS}
+    n_authors = len(author_columns["first"])
+    author_ids = np.asarray(columns["links"]["author"], dtype=np.int64)
+    order = np.lexsort((np.asarray(columns["links"]["position"]), author_ids))
+    linked = [
+        institutions[i]
+        for i in np.asarray(columns["links"]["institution"], dtype=np.int64)[order].tolist()
+    ]
+    ends = np.cumsum(np.bincount(author_ids, minlength=n_authors)).tolist()
+    author_columns["institutions"] = [
+        linked[start:end] for start, end in zip([0, *ends[:-1]], ends)
+    ]
+    return Authorship(
+        authors=construct_many(Author, author_columns),
+        institutions=[
+            institution
+            for institution, listed in zip(institutions, columns["institutions"]["listed"])
+            if listed
+        ],
+    )
+
+
+def iter_tsv_lines(columns: Columns) -> Iterable[str]:
+    """Iterate over the lines of a plain text projection of the tables.
+
+    Each table is written as tab-separated values with a header, preceded
+    by a line with the name of the table like ``# authors``.
+    """
+    for i, (name, table) in enumerate(columns.items()):
+        if i:
+            yield ""
+        yield f"# {name}"
+        yield "\t".join(table)
+        for row in zip(*table.values()):
+            yield "\t".join("" if value is None else str(value) for value in row)
+
+
+def _import_pyarrow():
+    try:
+        import pyarrow
+    except ImportError as e:
+        raise ImportError(
+            "reading and writing columnar authorships requires pyarrow."
+            " Install it with `pip install authorship[arrow]`"
+        ) from e
+    return pyarrow
+
+
+def _get_schema(pa, name: str) -> "pyarrow.Schema":
+    if name == "authors":
+        return pa.schema([(field, pa.string()) for field in AUTHOR_FIELDS])
+    if name == "institutions":
+        return pa.schema(
+            [*((field, pa.string()) for field in INSTITUTION_FIELDS), ("listed", pa.bool_())]
+        )
+    return pa.schema([(field, pa.int32()) for field in LINK_FIELDS])
+
+
+def write_tables(
+    authorship: Authorship, directory: Union[str, Path], *, format: str = "arrow"
+) -> None:
+    """Write the tables of the columnar form of an authorship to a directory.
+
+    :param authorship: An authorship
+    :param directory: The directory, which is created if it doesn't exist. One
+        file is written for each table, e.g., ``authors.arrow``.
+    :param format: Either ``arrow`` for uncompressed Arrow IPC (Feather v2) files,
+        which can be memory-mapped, or ``parquet`` for smaller Parquet files
+    :raises ValueError: If the format is unknown
+    """
+    if format not in FORMATS:
+        raise ValueError(f"unknown format: {format}. Use one of {sorted(FORMATS)}")
+    pa = _import_pyarrow()
+    directory = Path(directory).expanduser().resolve()
+    directory.mkdir(parents=True, exist_ok=True)
+    for name, columns in to_columns(authorship).items():
+        table = pa.table(columns, schema=_get_schema(pa, name))
+        path = directory.joinpath(name).with_suffix(FORMATS[format])
+        if format == "parquet":
+            import pyarrow.parquet
+
+            pyarrow.parquet.write_table(table, path)
+        else:
+            import pyarrow.feather
+
+            pyarrow.feather.write_feather(table, path, compression="uncompressed")
+
+
+def read_tables(
+    directory: Union[str, Path], *, memory_map: bool = True
+) -> dict[str, "pyarrow.Table"]:
+    """Read the tables of the columnar form of an authorship from a directory.
+
+    :param directory: A directory written by :func:`write_tables`
+    :param memory_map: Should Arrow IPC files be memory-mapped instead of read? This
+        has no effect for Parquet files.
+    :returns: A dictionary from the names of the tables to :class:`pyarrow.Table` objects
+    :raises FileNotFoundError: If the directory doesn't contain the tables
+    """
+    _import_pyarrow()
+    directory = Path(directory).expanduser().resolve()
+    for format, suffix in FORMATS.items():
+        paths = {name: directory.joinpath(name).with_suffix(suffix) for name in TABLES}
+        if all(path.is_file() for path in paths.values()):
+            break
+    else:
+        raise FileNotFoundError(f"no columnar authorship tables in {directory}")
+    if format == "parquet":
+        import pyarrow.parquet
+
+        return {name: pyarrow.parquet.read_table(path) for name, path in paths.items()}
+
+    import pyarrow.feather
+
+    return {
+        name: pyarrow.feather.read_table(path, memory_map=memory_map)
+        for name, path in paths.items()
+    }
+
+
+def read_authorship(
+    directory: Union[str, Path],
+    *,
+    memory_map: bool = True,
+    registry: Optional[InstitutionRegistry] = None,
+) -> Authorship:
+    """Read an authorship from a directory written by :func:`write_tables`.
+
+    :param directory: A directory written by :func:`write_tables`
+    :param memory_map: Should Arrow IPC files be memory-mapped instead of read?
+    :param registry: A registry in which the institutions are interned
+    :returns: An authorship
+
+    The integer columns of the links are used as numpy arrays over the Arrow
+    buffers, so they aren't copied. The string columns are still converted to
+    Python strings once, since the models hold them.
+    """
+    tables = read_tables(directory, memory_map=memory_map)
+    columns = {
+        name: {
+            column: table.column(column).to_numpy(zero_copy_only=False)
+            for column in table.column_names
+        }
+        for name, table in tables.items()
+    }
+    return from_columns(columns, registry=registry)
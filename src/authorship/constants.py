@@ -1,8 +1,17 @@
 """Constants."""
 
-from typing import Literal, Union, cast
+from __future__ import annotations
 
-import pandas as pd
+from pathlib import Path
+from typing import TYPE_CHECKING, Callable, Literal, Optional, Sequence, Union, cast
+
+from .instrument import span
+
+if TYPE_CHECKING:
+    import numpy as np
+    import pandas as pd
+
+    from .cache import SheetCache
 
 __all__ = [
     "ROLE",
@@ -10,6 +19,12 @@ __all__ = [
     "SUPERSCRIPTS_TRANS",
     "hoyt_sort_key",
     "get_hoyt_google_sheets_df",
+    "get_obo_google_sheets_df",
+    "get_google_sheets_url",
+    "read_sheet",
+    "read_sheet_file",
+    "get_hoyt_file_df",
+    "get_obo_file_df",
 ]
 
 ROLES = Literal["Lead", "Senior"]
@@ -30,6 +45,15 @@ SUPERSCRIPTS = {
 }
 SUPERSCRIPTS_TRANS = str.maketrans(SUPERSCRIPTS)
 
+#: The number of columns read from a hoyt-style sheet, from first name to conflicts of interest
+HOYT_N_COLUMNS = 15
+#: File extensions read with :func:`pandas.read_excel`
+EXCEL_SUFFIXES = {".xlsx", ".xlsm", ".xls", ".ods"}
+
+GOOGLE_SHEETS_URL = (
+    "https://docs.google.com/spreadsheets/d/{google_sheet}/export?format=tsv&gid={gid}"
+)
+
 
 def hoyt_sort_key(row: tuple[str, ...]) -> tuple[int, str]:
     """Sort a row by author role.
@@ -42,20 +66,159 @@ def hoyt_sort_key(row: tuple[str, ...]) -> tuple[int, str]:
     return ROLE.get(cast(ROLES, row[3]), 1), row[2]
 
 
-def get_hoyt_google_sheets_df(google_sheet: str, gid: Union[str, int] = 0) -> pd.DataFrame:
-    """Get the dataframe from google."""
-    url = f"https://docs.google.com/spreadsheets/d/{google_sheet}/export?format=tsv&gid={gid}"
-    return pd.read_csv(url, sep="\t", skiprows=1, dtype=str)
+def get_google_sheets_url(google_sheet: str, gid: Union[str, int] = 0) -> str:
+    """Get the URL for the TSV export of a google sheet."""
+    return GOOGLE_SHEETS_URL.format(google_sheet=google_sheet, gid=gid)
+
+
+@span("download")
+def get_hoyt_google_sheets_df(
+    google_sheet: str, gid: Union[str, int] = 0, *, cache: Optional["SheetCache"] = None
+) -> pd.DataFrame:
+    """Get the dataframe from google.
+
+    :param google_sheet: The identifier of the google sheet
+    :param gid: The sheet identifier (in case there are more than one)
+    :param cache: A cache for the export. If none is given, downloads the export directly.
+    :returns: A dataframe with all columns read as strings
+    """
+    if cache is not None:
+        return cache.get_df(google_sheet, gid, skiprows=1)
+    return read_sheet(get_google_sheets_url(google_sheet, gid), skiprows=1)
 
 
+@span("download")
 def get_obo_google_sheets_df(
-    google_sheet: str, gid: Union[str, int] = 0, skiprows=None
+    google_sheet: str,
+    gid: Union[str, int] = 0,
+    skiprows=None,
+    *,
+    cache: Optional["SheetCache"] = None,
+) -> pd.DataFrame:
+    """Get the dataframe from google.
+
+    :param google_sheet: The identifier of the google sheet
+    :param gid: The sheet identifier (in case there are more than one)
+    :param skiprows: Should rows be skipped?
+    :param cache: A cache for the export. If none is given, downloads the export directly.
+    :returns: A dataframe with all columns read as strings
+    """
+    if cache is not None:
+        return cache.get_df(google_sheet, gid, skiprows=skiprows)
+    return read_sheet(get_google_sheets_url(google_sheet, gid), skiprows=skiprows)
+
+
+@span("parse")
+def read_sheet(source, skiprows=None) -> pd.DataFrame:
+    """Read a TSV export of a google sheet.
+
+    :param source: A URL, path, or file-like object
+    :param skiprows: Should rows be skipped?
+    :returns: A dataframe with all columns read as strings
+    """
+    import pandas as pd
+
+    return pd.read_csv(source, sep="\t", skiprows=skiprows, dtype=str)
+
+
+@span("read_file")
+def read_sheet_file(
+    path: Union[str, Path],
+    *,
+    usecols: Optional[Callable[[pd.Index], Sequence[int]]] = None,
+    skiprows=None,
+    sep: Optional[str] = None,
+    sheet_name: Union[str, int] = 0,
 ) -> pd.DataFrame:
-    """Get the dataframe from google."""
-    url = f"https://docs.google.com/spreadsheets/d/{google_sheet}/export?format=tsv&gid={gid}"
-    return pd.read_csv(url, sep="\t", skiprows=skiprows, dtype=str)
+    """Read a local export of a sheet, only parsing the needed columns.
+
+    :param path: The path to a TSV, CSV, or Excel file. Excel files need
+        :mod:`openpyxl`, which can be installed with ``pip install authorship[excel]``.
+    :param usecols: A function from the header of the sheet to the positions of the
+        columns that should be parsed. If none is given, all columns are parsed.
+    :param skiprows: Should rows be skipped?
+    :param sep: The separator for text files. Defaults to a comma for files ending in
+        ``.csv`` and a tab otherwise.
+    :param sheet_name: The name or position of the sheet in an Excel file
+    :returns: A dataframe with the selected columns read as strings
+    """
+    import pandas as pd
+
+    path = Path(path).expanduser().resolve()
+    if path.suffix.lower() in EXCEL_SUFFIXES:
+        if usecols is not None:
+            header = pd.read_excel(path, sheet_name=sheet_name, skiprows=skiprows, nrows=0)
+            usecols = list(usecols(header.columns))
+        return pd.read_excel(
+            path, sheet_name=sheet_name, skiprows=skiprows, usecols=usecols, dtype=str
+        )
+
+    if sep is None:
+        sep = "," if path.suffix.lower() == ".csv" else "\t"
+    if usecols is not None:
+        header = pd.read_csv(path, sep=sep, skiprows=skiprows, nrows=0)
+        usecols = list(usecols(header.columns))
+    # read as strings explicitly, so pandas doesn't have to infer types
+    dtype = str if usecols is None else dict.fromkeys(usecols, str)
+    return pd.read_csv(path, sep=sep, skiprows=skiprows, usecols=usecols, dtype=dtype)
+
+
+def _get_hoyt_usecols(columns: pd.Index) -> Sequence[int]:
+    return range(min(HOYT_N_COLUMNS, len(columns)))
+
+
+def get_hoyt_file_df(path: Union[str, Path], skiprows=1, **kwargs) -> pd.DataFrame:
+    """Get the dataframe from a local export of a hoyt-style sheet.
+
+    :param path: The path to a TSV, CSV, or Excel file
+    :param skiprows: Should rows be skipped? Defaults to 1, which skips the
+        instructions at the top of the template.
+    :param kwargs: Keyword arguments passed to :func:`read_sheet_file`
+    :returns: A dataframe with the columns used by :class:`authorship.readers.SheetReader`
+    """
+    return read_sheet_file(path, usecols=_get_hoyt_usecols, skiprows=skiprows, **kwargs)
+
+
+def _get_obo_usecols(columns: pd.Index) -> Sequence[int]:
+    from .readers.obo_sheet import COLUMNS
+
+    n = len(columns)
+    return [i for i, column in enumerate(columns) if column in COLUMNS or i >= n - 2]
+
+
+def get_obo_file_df(path: Union[str, Path], skiprows=None, **kwargs) -> pd.DataFrame:
+    """Get the dataframe from a local export of an OBO community-style sheet.
+
+    :param path: The path to a TSV, CSV, or Excel file
+    :param skiprows: Should rows be skipped?
+    :param kwargs: Keyword arguments passed to :func:`read_sheet_file`
+    :returns: A dataframe with the author columns and the organization table (i.e., the
+        last two columns) used by :class:`authorship.readers.OboSheetReader`
+    """
+    return read_sheet_file(path, usecols=_get_obo_usecols, skiprows=skiprows, **kwargs)
 
 
 def safe(y):
     """Get a value or convert NaN to none."""
+    import pandas as pd
+
     return None if pd.isna(y) else y
+
+
+def get_values(df: pd.DataFrame) -> np.ndarray:
+    """Get the values of a dataframe with all NaNs converted to none.
+
+    This is the vectorized version of applying :func:`safe` to each cell.
+    """
+    import pandas as pd
+
+    values = df.to_numpy(dtype=object, copy=True)
+    values[pd.isna(values)] = None
+    return values
+
+
+def remove_prefix(values: np.ndarray, prefix: str) -> np.ndarray:
+    """Remove a prefix from each string in an object array, leaving nones in place."""
+    import pandas as pd
+
+    return pd.Series(values, dtype=object).str.removeprefix(prefix).to_numpy()
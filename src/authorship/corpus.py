@@ -0,0 +1,294 @@
+"""Index the authorships of many papers to look up authors and institutions across them.
+
+.. code-block:: python
+
+    from authorship.corpus import AuthorshipCorpus
+
+    corpus = AuthorshipCorpus()
+    corpus.add("sssom", sssom_reader.get_authorship())
+    corpus.add("bioregistry", bioregistry_reader.get_authorship())
+
+    # every paper an ORCID is on
+    corpus.find_papers(orcid="0000-0003-4423-4370")
+    # all authors at an institution, with the papers they're on
+    corpus.find_authors(ror="02jqj7156")
+
+    corpus.save("papers.sqlite")
+    corpus = AuthorshipCorpus.load("papers.sqlite")
+
+Lookups use hash indexes, so they take time proportional to the number of results
+rather than to the size of the corpus.
+"""
+
+import os
+import sqlite3
+import tempfile
+from collections import defaultdict
+from pathlib import Path
+from typing import Iterator, NamedTuple, Optional, Union
+
+from .models import Author, Authorship, InstitutionRegistry, normalize_name
+
+__all__ = [
+    "AuthorshipCorpus",
+    "AuthorHit",
+]
+
+#: The fields that authors are indexed by
+FIELDS = ["orcid", "email", "wikidata", "ror", "institution"]
+
+IndexKey = tuple[str, str]
+
+
+class AuthorHit(NamedTuple):
+    """An author found in a corpus."""
+
+    #: The identifier of the paper
+    paper: str
+    #: The position of the author in the paper's authorship
+    position: int
+    author: Author
+
+
+class AuthorshipCorpus:
+    """The authorships of many papers, indexed by ORCID, email, Wikidata, and institution."""
+
+    def __init__(self, *, registry: Optional[InstitutionRegistry] = None):
+        """Initialize an empty corpus.
+
+        :param registry: A registry in which the institutions of authorships loaded
+            from a file are interned, so they're shared between papers
+        """
+        self.registry = registry
+        self._papers: dict[str, Authorship] = {}
+        # authorships loaded from a file, which are only parsed when they're needed
+        self._pending: dict[str, str] = {}
+        # from (field, value) to papers to the positions of the matching authors
+        self._index: defaultdict[IndexKey, dict[str, list[int]]] = defaultdict(dict)
+
+    def __len__(self) -> int:
+        return len(self._papers) + len(self._pending)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter([*self._papers, *self._pending])
+
+    def __contains__(self, paper: str) -> bool:
+        return paper in self._papers or paper in self._pending
+
+    def __getitem__(self, paper: str) -> Authorship:
+        rv = self._papers.get(paper)
+        if rv is not None:
+            return rv
+        rv = Authorship.model_validate_json(self._pending.pop(paper))
+        if self.registry is not None:
+            rv = self.registry.intern_authorship(rv)
+        self._papers[paper] = rv
+        return rv
+
+    def add(self, paper: str, authorship: Authorship) -> None:
+        """Add the authorship of a paper, replacing the previous one if there is one.
+
+        :param paper: An identifier for the paper, e.g., a DOI or a short name
+        :param authorship: The authorship of the paper
+        """
+        if paper in self:
+            self.remove(paper)
+        self._papers[paper] = authorship
+        for position, author in enumerate(authorship.authors):
+            for key in _get_keys(author):
+                self._index[key].setdefault(paper, []).append(position)
+
+    def remove(self, paper: str) -> Authorship:
+        """Remove the authorship of a paper.
+
+        :param paper: The identifier of the paper
+        :returns: The authorship that was removed
+        :raises KeyError: If the paper isn't in the corpus
+        """
+        authorship = self[paper]
+        del self._papers[paper]
+        for author in authorship.authors:
+            for key in _get_keys(author):
+                papers = self._index.get(key)
+                if papers is None:
+                    continue
+                papers.pop(paper, None)
+                if not papers:
+                    del self._index[key]
+        return authorship
+
+    def _get_positions(self, **values: Optional[str]) -> dict[str, list[int]]:
+        """Get the positions of the authors matching all the values, grouped by paper."""
+        matches = sorted(
+            (
+                self._index.get(_normalize(field, value), {})
+                for field, value in values.items()
+                if value is not None
+            ),
+            key=len,
+        )
+        if not matches:
+            raise ValueError(f"give at least one of {', '.join(FIELDS)}")
+        # start from the smallest match, so intersecting is proportional to its size
+        rv = matches[0]
+        for other in matches[1:]:
+            intersection = {}
+            for paper, positions in rv.items():
+                other_positions = other.get(paper, [])
+                kept = [position for position in positions if position in other_positions]
+                if kept:
+                    intersection[paper] = kept
+            rv = intersection
+        return rv
+
+    def find_papers(
+        self,
+        *,
+        orcid: Optional[str] = None,
+        email: Optional[str] = None,
+        wikidata: Optional[str] = None,
+        ror: Optional[str] = None,
+        institution: Optional[str] = None,
+    ) -> list[str]:
+        """Find the papers with an author that matches all the given values.
+
+        :param orcid: The ORCID identifier of an author
+        :param email: The email of an author, compared case-insensitively
+        :param wikidata: The Wikidata identifier of an author
+        :param ror: The ROR identifier of one of the author's institutions
+        :param institution: The name of one of the author's institutions, compared
+            case-insensitively and ignoring whitespace
+        :returns: The identifiers of the papers, in the order they were added
+        :raises ValueError: If no values are given
+        """
+        return list(
+            self._get_positions(
+                orcid=orcid, email=email, wikidata=wikidata, ror=ror, institution=institution
+            )
+        )
+
+    def find_authors(
+        self,
+        *,
+        orcid: Optional[str] = None,
+        email: Optional[str] = None,
+        wikidata: Optional[str] = None,
+        ror: Optional[str] = None,
+        institution: Optional[str] = None,
+    ) -> list[AuthorHit]:
+        """Find the authors that match all the given values, in all papers.
+
+        The values have the same meaning as for :meth:`find_papers`.
+
+        :returns: The matching authors, with their papers and positions in them
+        :raises ValueError: If no values are given
+        """
+        return [
+            AuthorHit(paper, position, self[paper].authors[position])
+            for paper, positions in self._get_positions(
+                orcid=orcid, email=email, wikidata=wikidata, ror=ror, institution=institution
+            ).items()
+            for position in positions
+        ]
+
+    def save(self, path: Union[str, Path]) -> None:
+        """Save the corpus to a SQLite database, replacing the file if it exists.
+
+        The index is saved too, so :meth:`load` doesn't need to parse the authorships.
+        The database can also be queried directly, e.g., with
+        ``SELECT paper FROM keys WHERE field = 'orcid' AND value = ?``.
+
+        :param path: The path to the database
+        """
+        path = Path(path).expanduser().resolve()
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+        os.close(fd)
+        try:
+            with sqlite3.connect(tmp) as connection:
+                connection.executescript("""
+                    CREATE TABLE papers (paper TEXT PRIMARY KEY, authorship TEXT NOT NULL);
+                    CREATE TABLE keys (
+                        field TEXT NOT NULL,
+                        value TEXT NOT NULL,
+                        paper TEXT NOT NULL,
+                        position INTEGER NOT NULL
+                    );
+                    """)
+                connection.executemany(
+                    "INSERT INTO papers VALUES (?, ?)",
+                    (
+                        (
+                            paper,
+                            self._pending.get(paper) or self._papers[paper].model_dump_json(),
+                        )
+                        for paper in self
+                    ),
+                )
+                connection.executemany(
+                    "INSERT INTO keys VALUES (?, ?, ?, ?)",
+                    (
+                        (field, value, paper, position)
+                        for (field, value), papers in self._index.items()
+                        for paper, positions in papers.items()
+                        for position in positions
+                    ),
+                )
+                connection.execute("CREATE INDEX keys_lookup ON keys (field, value)")
+            connection.close()
+            os.replace(tmp, path)
+        finally:
+            Path(tmp).unlink(missing_ok=True)
+
+    @classmethod
+    def load(
+        cls, path: Union[str, Path], *, registry: Optional[InstitutionRegistry] = None
+    ) -> "AuthorshipCorpus":
+        """Load a corpus saved with :meth:`save`.
+
+        :param path: The path to the database
+        :param registry: A registry in which the institutions are interned
+        :returns: A corpus, whose authorships are parsed when they're first needed
+        :raises FileNotFoundError: If the database doesn't exist
+        """
+        path = Path(path).expanduser().resolve()
+        if not path.is_file():
+            raise FileNotFoundError(path)
+        rv = cls(registry=registry)
+        connection = sqlite3.connect(path)
+        try:
+            rv._pending.update(connection.execute("SELECT paper, authorship FROM papers"))
+            index = rv._index
+            for field, value, paper, position in connection.execute(
+                "SELECT field, value, paper, position FROM keys ORDER BY rowid"
+            ):
+                index[field, value].setdefault(paper, []).append(position)
+        finally:
+            connection.close()
+        return rv
+
+
+def _normalize(field: str, value: str) -> IndexKey:
+    if field == "email":
+        return field, value.casefold()
+    if field == "institution":
+        return field, normalize_name(value)
+    return field, value
+
+
+def _get_keys(author: Author) -> set[IndexKey]:
+    """Get the index keys of an author, without duplicates."""
+    rv = {
+        _normalize(field, value)
+        for field, value in [
+            ("orcid", author.orcid),
+            ("email", author.email),
+            ("wikidata", author.wikidata),
+        ]
+        if value
+    }
+    for institution in author.institutions:
+        if institution.ror:
+            rv.add(("ror", institution.ror))
+        rv.add(_normalize("institution", institution.name))
+    return rv
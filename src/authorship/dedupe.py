@@ -0,0 +1,319 @@
+"""Merge institutions whose names are spelled differently but mean the same place.
+
+Readers deduplicate institutions by their exact names, so e.g. "Harvard Medical
+School" and "Harvard Medical School, Boston" get separate affiliation numbers.
+:func:`dedupe_institutions` normalizes names (case, accents, punctuation, and
+common abbreviations like "Univ." and "Lab") and then matches them fuzzily:
+
+.. code-block:: python
+
+    from authorship.dedupe import dedupe_institutions
+
+    authorship, report = dedupe_institutions(reader.get_authorship())
+    print(report.to_str())  # review what was merged
+
+The part of a name before the first comma is compared by the similarity of its
+character trigrams. The rest is usually a location, which has to match too if both
+names have one, so "University of California, Berkeley" and "University of
+California, San Diego" aren't merged, not even through "University of California".
+Institutions with different ROR identifiers are never merged.
+
+Candidate pairs are found with a prefix-filtered trigram index, which gives the
+same result as comparing all pairs but only compares names that share one of
+their rarest trigrams, so thousands of distinct names are deduplicated quickly.
+"""
+
+import math
+import re
+import unicodedata
+from collections import Counter, defaultdict
+from typing import Iterable, Optional
+
+from pydantic import BaseModel, Field
+
+from .instrument import count, span
+from .models import Authorship, Institution
+
+__all__ = [
+    "InstitutionMerge",
+    "MergeReport",
+    "dedupe_institutions",
+    "normalize_institution",
+]
+
+#: Abbreviations that are expanded when normalizing the names of institutions
+ABBREVIATIONS = {
+    "univ": "university",
+    "uni": "university",
+    "inst": "institute",
+    "lab": "laboratory",
+    "labs": "laboratories",
+    "natl": "national",
+    "nat": "national",
+    "dept": "department",
+    "ctr": "center",
+    "cntr": "center",
+    "centre": "center",
+    "hosp": "hospital",
+    "med": "medical",
+    "sch": "school",
+    "coll": "college",
+    "res": "research",
+    "sci": "science",
+    "tech": "technology",
+    "st": "saint",
+    "&": "and",
+}
+#: Words that are dropped when normalizing the names of institutions
+STOPWORDS = {"the"}
+
+_TOKEN_RE = re.compile(r"\w+|&")
+
+
+class InstitutionMerge(BaseModel):
+    """Institutions that were merged into one."""
+
+    #: The name that was kept
+    name: str
+    #: The names that were merged into it
+    merged: list[str]
+    #: The lowest similarity of a pair of merged names that was matched
+    similarity: float
+    #: The number of authors affiliated with any of the institutions
+    n_authors: int
+
+
+class MergeReport(BaseModel):
+    """A report of the institutions merged by :func:`dedupe_institutions`."""
+
+    merges: list[InstitutionMerge] = Field(default_factory=list)
+    #: The number of distinct institution names before merging
+    n_before: int = 0
+    #: The number of distinct institution names after merging
+    n_after: int = 0
+
+    def iter_lines(self) -> Iterable[str]:
+        """Iterate over the lines of a report of the merges for review."""
+        for merge in self.merges:
+            yield f"{merge.name} ({merge.n_authors} authors, similarity {merge.similarity:.2f})"
+            for name in merge.merged:
+                yield f"  <- {name}"
+
+    def to_str(self) -> str:
+        """Make a report of the merges for review."""
+        if not self.merges:
+            return "no institutions merged"
+        return "\n".join(
+            [*self.iter_lines(), f"{self.n_before} institutions merged into {self.n_after}"]
+        )
+
+
+def normalize_institution(name: str) -> str:
+    """Normalize the name of an institution for matching.
+
+    Accents, case, punctuation, and stopwords are removed and common
+    abbreviations are expanded, e.g., "Lawrence Berkeley Nat'l Lab." becomes
+    "lawrence berkeley national laboratory".
+    """
+    name = unicodedata.normalize("NFKD", name)
+    name = "".join(c for c in name if not unicodedata.combining(c)).casefold()
+    # so contractions are one token, e.g., "Nat'l"
+    name = name.replace("'", "").replace("\u2019", "")
+    tokens = (ABBREVIATIONS.get(token, token) for token in _TOKEN_RE.findall(name))
+    return " ".join(token for token in tokens if token not in STOPWORDS)
+
+
+def _split(name: str) -> tuple[str, str]:
+    head, _, tail = name.partition(",")
+    return normalize_institution(head), normalize_institution(tail)
+
+
+def _trigrams(text: str) -> frozenset[str]:
+    padded = f"  {text} "
+    return frozenset(padded[i : i + 3] for i in range(len(padded) - 2))
+
+
+def _jaccard(left: frozenset[str], right: frozenset[str]) -> float:
+    if not left and not right:
+        return 1.0
+    overlap = len(left & right)
+    return overlap / (len(left) + len(right) - overlap)
+
+
+class _DisjointSet:
+    """Union-find over institutions, which refuses to join different ROR identifiers.
+
+    It also refuses to join clusters with dissimilar tails, so that e.g. a name
+    without a location doesn't join two names with different locations.
+    """
+
+    def __init__(self, rors: list[Optional[str]], tails: list[frozenset[str]], threshold: float):
+        self.parent = list(range(len(rors)))
+        self.rors = list(rors)
+        self.tails = [{tail} if tail else set() for tail in tails]
+        self.threshold = threshold
+
+    def find(self, i: int) -> int:
+        while self.parent[i] != i:
+            self.parent[i] = self.parent[self.parent[i]]
+            i = self.parent[i]
+        return i
+
+    def union(self, i: int, j: int) -> bool:
+        i, j = self.find(i), self.find(j)
+        if i == j:
+            return False
+        if self.rors[i] and self.rors[j] and self.rors[i] != self.rors[j]:
+            return False
+        if any(
+            _jaccard(left, right) < self.threshold
+            for left in self.tails[i]
+            for right in self.tails[j]
+        ):
+            return False
+        # keep the earlier institution as the root, so clusters are ordered
+        if j < i:
+            i, j = j, i
+        self.parent[j] = i
+        self.rors[i] = self.rors[i] or self.rors[j]
+        self.tails[i] |= self.tails[j]
+        return True
+
+
+def _find_pairs(keys: list[tuple[str, str]], threshold: float) -> Iterable[tuple[int, int, float]]:
+    """Find the pairs of keys whose heads and tails are similar enough.
+
+    Uses prefix filtering: if the trigram sets of two heads have a Jaccard
+    similarity of at least the threshold, then they share one of the first
+    ``|x| - ceil(threshold * |x|) + 1`` trigrams of each set ``x`` when the
+    trigrams are sorted from rarest to most common. So only these prefixes are
+    indexed and probed.
+    """
+    heads = [_trigrams(head) for head, _ in keys]
+    tails = [_trigrams(tail) if tail else frozenset() for _, tail in keys]
+    frequency = Counter(trigram for trigrams in heads for trigram in trigrams)
+    index: defaultdict[str, list[int]] = defaultdict(list)
+    for i, trigrams in enumerate(heads):
+        ordered = sorted(trigrams, key=lambda trigram: (frequency[trigram], trigram))
+        prefix = ordered[: len(ordered) - math.ceil(threshold * len(ordered)) + 1]
+        candidates = {j for trigram in prefix for j in index[trigram]}
+        count("institution_comparisons", len(candidates))
+        for j in sorted(candidates):
+            # the length filter is cheaper than computing the similarity
+            smaller, larger = sorted([len(trigrams), len(heads[j])])
+            if smaller < threshold * larger:
+                continue
+            similarity = _jaccard(trigrams, heads[j])
+            if similarity < threshold:
+                continue
+            # tails are usually locations, which have to match if both are given
+            if tails[i] and tails[j] and _jaccard(tails[i], tails[j]) < threshold:
+                continue
+            yield j, i, similarity
+        for trigram in prefix:
+            index[trigram].append(i)
+
+
+def dedupe_institutions(
+    authorship: Authorship, *, threshold: float = 0.8
+) -> tuple[Authorship, MergeReport]:
+    """Merge institutions whose names are similar.
+
+    :param authorship: An authorship
+    :param threshold: The minimum Jaccard similarity of the trigrams of the names
+        (before their first comma) for institutions to be merged, between 0 and 1
+    :returns: A new authorship in which each group of similar institutions is replaced
+        by one institution, and a report of the merges. The kept institution is the
+        one with the most authors (the first in case of ties), and its missing
+        address and identifiers are filled in from the ones merged into it.
+    """
+    if not 0 < threshold <= 1:
+        raise ValueError(f"threshold should be between 0 and 1, got {threshold}")
+
+    # distinct names, in order of appearance
+    n_authors: Counter[str] = Counter(
+        institution.name for author in authorship.authors for institution in author.institutions
+    )
+    by_name: dict[str, list[Institution]] = defaultdict(list)
+    for institution in [
+        *(i for author in authorship.authors for i in author.institutions),
+        *authorship.institutions,
+    ]:
+        by_name[institution.name].append(institution)
+    names = list(by_name)
+    rors = [next((i.ror for i in by_name[name] if i.ror), None) for name in names]
+
+    with span("dedupe"):
+        keys = [_split(name) for name in names]
+        clusters = _DisjointSet(
+            rors, [_trigrams(tail) if tail else frozenset() for _, tail in keys], threshold
+        )
+        similarities = {}
+        for i, j, similarity in _find_pairs(keys, threshold):
+            if clusters.union(i, j):
+                similarities[i, j] = similarity
+
+    members: defaultdict[int, list[int]] = defaultdict(list)
+    for i in range(len(names)):
+        members[clusters.find(i)].append(i)
+    lowest: dict[int, float] = {}
+    for (i, _), similarity in similarities.items():
+        root = clusters.find(i)
+        lowest[root] = min(lowest.get(root, 1.0), similarity)
+
+    report = MergeReport(n_before=len(names), n_after=len(members))
+    replacements: dict[str, Institution] = {}
+    for root, cluster in members.items():
+        if len(cluster) == 1:
+            continue
+        kept = max(cluster, key=lambda i: (n_authors[names[i]], -i))
+        institution = _merge([by_name[names[i]][0] for i in [kept, *cluster]])
+        for i in cluster:
+            replacements[names[i]] = institution
+        report.merges.append(
+            InstitutionMerge(
+                name=names[kept],
+                merged=[names[i] for i in cluster if i != kept],
+                similarity=lowest[root],
+                n_authors=sum(n_authors[names[i]] for i in cluster),
+            )
+        )
+    count("institutions_merged", report.n_before - report.n_after)
+    if not replacements:
+        return authorship, report
+
+    def _replace(institutions: list[Institution]) -> list[Institution]:
+        # merging can make an author's institutions the same, so they're deduplicated
+        rv: dict[int, Institution] = {}
+        for institution in institutions:
+            institution = replacements.get(institution.name, institution)
+            rv.setdefault(id(institution), institution)
+        return list(rv.values())
+
+    return (
+        Authorship.model_construct(
+            authors=[
+                (
+                    author.model_copy(update={"institutions": _replace(author.institutions)})
+                    if any(institution.name in replacements for institution in author.institutions)
+                    else author
+                )
+                for author in authorship.authors
+            ],
+            institutions=_replace(authorship.institutions),
+        ),
+        report,
+    )
+
+
+def _merge(institutions: list[Institution]) -> Institution:
+    """Fill in the missing fields of the first institution from the others."""
+    first, *rest = institutions
+    update = {}
+    for field in Institution.model_fields:
+        if getattr(first, field):
+            continue
+        value = next((getattr(i, field) for i in rest if getattr(i, field)), None)
+        if value:
+            update[field] = value
+    return first.model_copy(update=update) if update else first
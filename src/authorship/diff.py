@@ -0,0 +1,306 @@
+"""Compare two versions of an authorship and re-render only what changed.
+
+Author sheets usually change a few rows at a time. :func:`diff_authorships` finds
+the authors that were added, removed, modified, or moved and the affiliations that
+were renumbered, e.g., for reviewing a change to a sheet:
+
+.. code-block:: python
+
+    from authorship.diff import diff_authorships
+
+    diff = diff_authorships(previous, authorship)
+    print(diff.to_str())  # or diff.model_dump_json() for a structured report
+
+Writers use the diff in :meth:`authorship.writers.Writer.update_lines` to reuse the
+lines of unchanged authors. :class:`IncrementalRenderer` keeps the previous snapshot
+of an authorship and its lines, optionally in a file, so they can be updated.
+"""
+
+import bisect
+import json
+from collections import Counter
+from pathlib import Path
+from typing import Iterable, Literal, Optional, Union
+
+from pydantic import BaseModel, Field
+
+from .models import Author, Authorship
+from .writers import Writer
+
+__all__ = [
+    "AuthorChange",
+    "InstitutionChange",
+    "AuthorshipDiff",
+    "diff_authorships",
+    "IncrementalRenderer",
+]
+
+
+class AuthorChange(BaseModel):
+    """A change to an author between two versions of an authorship."""
+
+    #: Moved authors are unchanged, but their order relative to other authors changed
+    kind: Literal["added", "removed", "modified", "moved"]
+    #: The name of the author, from the new version unless the author was removed
+    name: str
+    #: The position of the author in the previous version, unless the author was added
+    previous_position: Optional[int] = None
+    #: The position of the author in the new version, unless the author was removed
+    position: Optional[int] = None
+    #: The names of the fields that changed, for modified authors
+    fields: list[str] = Field(default_factory=list)
+
+
+class InstitutionChange(BaseModel):
+    """A change to the numbering of an institution between two versions of an authorship."""
+
+    kind: Literal["added", "removed", "renumbered"]
+    #: The name of the institution, which identifies it
+    name: str
+    #: The number of the affiliation in the previous version, unless it was added
+    previous_number: Optional[int] = None
+    #: The number of the affiliation in the new version, unless it was removed
+    number: Optional[int] = None
+
+
+class AuthorshipDiff(BaseModel):
+    """The difference between two versions of an authorship."""
+
+    #: The changes to authors, in order of their position in the new version
+    #: followed by the removed authors
+    authors: list[AuthorChange] = Field(default_factory=list)
+    #: The changes to the affiliation numbers of institutions, as given by
+    #: :attr:`authorship.models.Authorship.affiliation_index`
+    institutions: list[InstitutionChange] = Field(default_factory=list)
+    #: The position in the previous version of each author in the new version, or
+    #: none if the author was added or modified
+    previous_positions: list[Optional[int]] = Field(default_factory=list)
+
+    def is_empty(self) -> bool:
+        """Check that nothing changed, including the order of the authors."""
+        return not self.authors and not self.institutions and not self.n_shifted
+
+    @property
+    def n_shifted(self) -> int:
+        """Get the number of unchanged authors whose position changed."""
+        return sum(
+            previous_position is not None and previous_position != position
+            for position, previous_position in enumerate(self.previous_positions)
+        )
+
+    def iter_lines(self) -> Iterable[str]:
+        """Iterate over the lines of a report of the changes for review."""
+        for change in self.authors:
+            if change.kind == "added":
+                yield f"+ {change.name} (added at {change.position + 1})"
+            elif change.kind == "removed":
+                yield f"- {change.name} (removed from {change.previous_position + 1})"
+            elif change.kind == "modified":
+                yield f"~ {change.name} (modified {', '.join(change.fields)})"
+            else:
+                yield (
+                    f"> {change.name} (moved from {change.previous_position + 1}"
+                    f" to {change.position + 1})"
+                )
+        for institution_change in self.institutions:
+            if institution_change.kind == "added":
+                yield f"+ {institution_change.name} (added as {institution_change.number})"
+            elif institution_change.kind == "removed":
+                yield (
+                    f"- {institution_change.name}"
+                    f" (removed, was {institution_change.previous_number})"
+                )
+            else:
+                yield (
+                    f"# {institution_change.name} (renumbered from"
+                    f" {institution_change.previous_number} to {institution_change.number})"
+                )
+
+    def to_str(self) -> str:
+        """Make a report of the changes for review."""
+        if self.is_empty():
+            return "no changes"
+        return "\n".join(self.iter_lines())
+
+
+def _get_key(author: Author) -> str:
+    return author.orcid or author.email or author.name
+
+
+def diff_authorships(previous: Authorship, authorship: Authorship) -> AuthorshipDiff:
+    """Compare two versions of an authorship.
+
+    Authors are matched by their ORCID, falling back to their email or name. Authors
+    with the same key are matched in order. Matched authors are modified if any of
+    their fields differ. Unmodified authors are moved if their order relative to
+    other matched authors changed, and otherwise shifting them along with other
+    additions and removals isn't reported.
+
+    :param previous: The previous version of the authorship
+    :param authorship: The new version of the authorship
+    :returns: The difference between the versions
+    """
+    key_to_positions: dict[tuple[str, int], int] = {}
+    counter: Counter[str] = Counter()
+    for previous_position, author in enumerate(previous.authors):
+        key = _get_key(author)
+        key_to_positions[key, counter[key]] = previous_position
+        counter[key] += 1
+
+    counter.clear()
+    changes: dict[int, AuthorChange] = {}
+    matched: dict[int, int] = {}
+    previous_positions: list[Optional[int]] = []
+    for position, author in enumerate(authorship.authors):
+        key = _get_key(author)
+        previous_position = key_to_positions.pop((key, counter[key]), None)
+        counter[key] += 1
+        if previous_position is None:
+            changes[position] = AuthorChange(kind="added", name=author.name, position=position)
+            previous_positions.append(None)
+            continue
+        previous_author = previous.authors[previous_position]
+        if previous_author == author:
+            matched[position] = previous_position
+            previous_positions.append(previous_position)
+            continue
+        changes[position] = AuthorChange(
+            kind="modified",
+            name=author.name,
+            previous_position=previous_position,
+            position=position,
+            fields=[
+                field
+                for field in Author.model_fields
+                if getattr(previous_author, field) != getattr(author, field)
+            ],
+        )
+        previous_positions.append(None)
+
+    for position in _get_moved(matched):
+        changes[position] = AuthorChange(
+            kind="moved",
+            name=authorship.authors[position].name,
+            previous_position=matched[position],
+            position=position,
+        )
+
+    author_changes = [changes[position] for position in sorted(changes)]
+    author_changes.extend(
+        AuthorChange(
+            kind="removed",
+            name=previous.authors[previous_position].name,
+            previous_position=previous_position,
+        )
+        for previous_position in sorted(key_to_positions.values())
+    )
+    return AuthorshipDiff(
+        authors=author_changes,
+        institutions=_diff_institutions(previous, authorship),
+        previous_positions=previous_positions,
+    )
+
+
+def _get_moved(matched: dict[int, int]) -> set[int]:
+    """Get the positions of matched authors outside a longest run in the previous order."""
+    positions = list(matched)
+    # patience sorting, where tails[k] is the index into positions of the smallest
+    # tail of an increasing run of length k + 1
+    tails: list[int] = []
+    tail_values: list[int] = []
+    parents: list[Optional[int]] = []
+    for i, position in enumerate(positions):
+        k = bisect.bisect_left(tail_values, matched[position])
+        parents.append(tails[k - 1] if k else None)
+        if k == len(tails):
+            tails.append(i)
+            tail_values.append(matched[position])
+        else:
+            tails[k] = i
+            tail_values[k] = matched[position]
+    kept = set()
+    i = tails[-1] if tails else None
+    while i is not None:
+        kept.add(positions[i])
+        i = parents[i]
+    return set(positions) - kept
+
+
+def _diff_institutions(previous: Authorship, authorship: Authorship) -> list[InstitutionChange]:
+    previous_numbers = {
+        institution.name: number
+        for number, institution in enumerate(previous.affiliation_index.institutions, start=1)
+    }
+    rv = []
+    for number, institution in enumerate(authorship.affiliation_index.institutions, start=1):
+        previous_number = previous_numbers.pop(institution.name, None)
+        if previous_number is None:
+            rv.append(InstitutionChange(kind="added", name=institution.name, number=number))
+        elif previous_number != number:
+            rv.append(
+                InstitutionChange(
+                    kind="renumbered",
+                    name=institution.name,
+                    previous_number=previous_number,
+                    number=number,
+                )
+            )
+    rv.extend(
+        InstitutionChange(kind="removed", name=name, previous_number=previous_number)
+        for name, previous_number in previous_numbers.items()
+    )
+    return rv
+
+
+class IncrementalRenderer:
+    """Render successive versions of an authorship, only making the lines that changed."""
+
+    def __init__(self, writer: Union[str, Writer] = "text", path: Union[None, str, Path] = None):
+        """Initialize the renderer.
+
+        :param writer: The writer (or its name)
+        :param path: If given, the previous snapshot of the authorship and its lines are
+            loaded from and saved to this JSON file, so they're kept between processes
+        """
+        from .writers import writer_resolver
+
+        self.writer = writer_resolver.make(writer)
+        self.path = None if path is None else Path(path).expanduser().resolve()
+        #: The previous snapshot of the authorship
+        self.authorship = Authorship(authors=[], institutions=[])
+        #: The lines for the previous snapshot of the authorship
+        self.lines = self.writer.to_lines(self.authorship)
+        if self.path is not None and self.path.is_file():
+            snapshot = json.loads(self.path.read_text())
+            self.authorship = Authorship.model_validate(snapshot["authorship"])
+            if snapshot.get("writer") == self._get_writer_name():
+                self.lines = snapshot["lines"]
+            else:
+                self.lines = self.writer.to_lines(self.authorship)
+
+    def _get_writer_name(self) -> str:
+        return f"{type(self.writer).__module__}.{type(self.writer).__qualname__}"
+
+    def render(self, authorship: Authorship) -> AuthorshipDiff:
+        """Render a new version of the authorship, which becomes the snapshot.
+
+        :param authorship: The new version of the authorship
+        :returns: The difference from the previous snapshot. The new lines are
+            available from :attr:`lines` and :meth:`to_str`.
+        """
+        diff = diff_authorships(self.authorship, authorship)
+        self.lines = self.writer.update_lines(authorship, self.lines, diff)
+        self.authorship = authorship
+        if self.path is not None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            snapshot = {
+                "writer": self._get_writer_name(),
+                "authorship": authorship.model_dump(mode="json"),
+                "lines": self.lines,
+            }
+            self.path.write_text(json.dumps(snapshot))
+        return diff
+
+    def to_str(self) -> str:
+        """Get the text for the current snapshot."""
+        return "\n".join(self.lines)
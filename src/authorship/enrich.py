@@ -0,0 +1,528 @@
+"""Fill in missing metadata of authors and institutions from ORCID, Wikidata, and ROR.
+
+Author lists often only have identifiers, so an :class:`Enricher` looks them up to
+fill in what's missing, without overwriting what's in the sheet:
+
+1. the homepages of authors, from their ORCID records or Wikidata items,
+2. the ROR identifiers of institutions, from their Wikidata items, and
+3. the addresses and Wikidata identifiers of institutions, from ROR.
+
+Each unique identifier is looked up at most once, in batches where the API allows
+it, and the results (including identifiers that weren't found) are kept in a
+persistent :class:`MetadataCache`, so enriching the same author lists again
+doesn't need any requests.
+
+.. code-block:: python
+
+    from authorship.enrich import Enricher, MetadataCache
+
+    enricher = Enricher(cache=MetadataCache())
+    authorship = enricher.enrich(reader.get_authorship())
+
+The sources are pluggable, e.g., :class:`FixtureSource` answers from a dictionary
+for testing without contacting the live APIs.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import re
+import sqlite3
+import time
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, ClassVar, Iterable, Mapping, Optional, Sequence, Union
+from urllib.error import HTTPError, URLError
+from urllib.parse import quote
+
+from .cache import get_default_directory
+from .client import SheetClient
+from .instrument import count, span
+
+if TYPE_CHECKING:
+    from .models import Author, Authorship, Institution
+
+__all__ = [
+    "Enricher",
+    "MetadataCache",
+    "Source",
+    "HTTPSource",
+    "ORCIDSource",
+    "WikidataSource",
+    "RORSource",
+    "RORAffiliationSource",
+    "FixtureSource",
+]
+
+logger = logging.getLogger(__name__)
+
+#: A record of metadata, with any of the keys ``homepage``, ``address``, ``ror``, and
+#: ``wikidata``
+Record = dict[str, str]
+
+
+class Source(ABC):
+    """A source of metadata records for one kind of identifier."""
+
+    #: The kind of identifiers the source looks up, e.g., ``orcid``
+    prefix: ClassVar[str]
+
+    @abstractmethod
+    def get_records(self, identifiers: Sequence[str]) -> dict[str, Record]:
+        """Look up the records for many identifiers at once.
+
+        :param identifiers: Unique identifiers, without prefixes
+        :returns: A dictionary from the identifiers that were found to their records
+        :raises URLError: If the source couldn't be reached, in which case nothing
+            is cached and the identifiers are looked up again next time
+        """
+
+
+class FixtureSource(Source):
+    """A source that answers from a dictionary, e.g., for testing."""
+
+    def __init__(self, prefix: str, records: Mapping[str, Record]):
+        """Initialize the source.
+
+        :param prefix: The kind of identifiers the source looks up
+        :param records: A dictionary from identifiers to their records
+        """
+        self.prefix = prefix
+        self.records = records
+        #: The batches of identifiers that were looked up
+        self.requests: list[list[str]] = []
+
+    def get_records(self, identifiers: Sequence[str]) -> dict[str, Record]:
+        """Look up the records in the dictionary."""
+        self.requests.append(list(identifiers))
+        return {
+            identifier: self.records[identifier]
+            for identifier in identifiers
+            if identifier in self.records
+        }
+
+
+class HTTPSource(Source):
+    """A source that looks up identifiers in a JSON API."""
+
+    #: The maximum number of identifiers in one request
+    batch_size: ClassVar[int] = 1
+    #: The template for request URLs, which gets formatted with ``base`` and
+    #: ``identifier`` (or ``identifiers``, joined with ``|``, for batches)
+    url_template: ClassVar[str]
+    #: The default base URL of the API
+    default_base: ClassVar[str]
+
+    def __init__(self, base: Optional[str] = None, *, client: Optional[SheetClient] = None):
+        """Initialize the source.
+
+        :param base: The base URL of the API, which can be changed to point to a
+            local server for testing
+        :param client: The HTTP client. Defaults to a new client with its own
+            connection pool, so consecutive requests reuse a connection.
+        """
+        self.base = (base or self.default_base).rstrip("/")
+        self.client = client if client is not None else SheetClient()
+
+    def get_records(self, identifiers: Sequence[str]) -> dict[str, Record]:
+        """Look up the identifiers, in batches of :data:`batch_size`."""
+        rv: dict[str, Record] = {}
+        for start in range(0, len(identifiers), self.batch_size):
+            batch = identifiers[start : start + self.batch_size]
+            url = self.url_template.format(
+                base=self.base,
+                identifier=quote(batch[0], safe=""),
+                identifiers=quote("|".join(batch), safe="|"),
+            )
+            try:
+                response = self.client.get(url, headers={"Accept": "application/json"})
+            except HTTPError as e:
+                if e.code != 404:
+                    raise URLError(e) from e
+                continue
+            rv.update(self.parse(batch, json.loads(response.body)))
+        return rv
+
+    @abstractmethod
+    def parse(self, identifiers: Sequence[str], data: Any) -> dict[str, Record]:
+        """Get records from the JSON response for a batch of identifiers."""
+
+
+class ORCIDSource(HTTPSource):
+    """Look up the homepages of researchers in the ORCID public API."""
+
+    prefix = "orcid"
+    default_base = "https://pub.orcid.org/v3.0"
+    url_template = "{base}/{identifier}/researcher-urls"
+
+    def parse(self, identifiers: Sequence[str], data: Any) -> dict[str, Record]:
+        """Get the first of the researcher's URLs as their homepage."""
+        urls = [
+            url["url"]["value"]
+            for url in data.get("researcher-url") or []
+            if (url.get("url") or {}).get("value")
+        ]
+        return {identifiers[0]: {"homepage": urls[0]} if urls else {}}
+
+
+#: Wikidata properties for the fields of records
+WIKIDATA_PROPERTIES = {
+    "homepage": "P856",  # official website
+    "ror": "P6782",  # ROR ID
+}
+
+
+#: The pattern for Wikidata item identifiers, e.g., ``Q42``
+WIKIDATA_ITEM_PATTERN = re.compile(r"^Q\d+$")
+
+
+class WikidataSource(HTTPSource):
+    """Look up homepages and ROR identifiers in Wikidata, 50 items at a time."""
+
+    prefix = "wikidata"
+    batch_size = 50
+    default_base = "https://www.wikidata.org/w/api.php"
+    url_template = "{base}?action=wbgetentities&props=claims&format=json&ids={identifiers}"
+
+    def get_records(self, identifiers: Sequence[str]) -> dict[str, Record]:
+        """Look up the identifiers that are items, since one malformed identifier fails a batch.
+
+        Other identifiers, e.g., URLs, are never found.
+        """
+        return super().get_records(
+            [identifier for identifier in identifiers if WIKIDATA_ITEM_PATTERN.match(identifier)]
+        )
+
+    def parse(self, identifiers: Sequence[str], data: Any) -> dict[str, Record]:
+        """Get the first value of each property of the items that were found.
+
+        :raises URLError: If Wikidata answered with an error, so the identifiers in the
+            batch aren't cached as missing
+        """
+        if "error" in data:
+            raise URLError(f"Wikidata couldn't look up {identifiers}: {data['error']}")
+        rv = {}
+        for identifier, entity in (data.get("entities") or {}).items():
+            if "missing" in entity:
+                continue
+            claims = entity.get("claims") or {}
+            record = {}
+            for key, prop in WIKIDATA_PROPERTIES.items():
+                for claim in claims.get(prop) or []:
+                    value = (claim.get("mainsnak", {}).get("datavalue") or {}).get("value")
+                    if isinstance(value, str):
+                        record[key] = value
+                        break
+            rv[identifier] = record
+        return rv
+
+
+class RORSource(HTTPSource):
+    """Look up the addresses and Wikidata identifiers of institutions in ROR."""
+
+    prefix = "ror"
+    default_base = "https://api.ror.org/v2"
+    url_template = "{base}/organizations/{identifier}"
+
+    def parse(self, identifiers: Sequence[str], data: Any) -> dict[str, Record]:
+        """Get a record from a ROR organization."""
+        return {identifiers[0]: _parse_ror_organization(data)}
+
+
+class RORAffiliationSource(HTTPSource):
+    """Match the names of institutions to ROR identifiers with ROR's affiliation matching.
+
+    Only matches that ROR is confident about are used. Since matching can still be
+    wrong, this source isn't used by default.
+    """
+
+    prefix = "ror_affiliation"
+    default_base = "https://api.ror.org/v2"
+    url_template = "{base}/organizations?affiliation={identifier}"
+
+    def parse(self, identifiers: Sequence[str], data: Any) -> dict[str, Record]:
+        """Get the record of the chosen organization, if there is one."""
+        for item in data.get("items") or []:
+            if item.get("chosen"):
+                organization = item.get("organization") or {}
+                return {
+                    identifiers[0]: {
+                        "ror": _strip_ror(organization.get("id", "")),
+                        **_parse_ror_organization(organization),
+                    }
+                }
+        return {}
+
+
+def _strip_ror(uri: str) -> str:
+    return uri.removeprefix("https://ror.org/")
+
+
+def _parse_ror_organization(data: Mapping[str, Any]) -> Record:
+    record = {}
+    for location in data.get("locations") or []:
+        details = location.get("geonames_details") or {}
+        parts = [details.get("name"), details.get("country_name")]
+        address = ", ".join(part for part in parts if part)
+        if address:
+            record["address"] = address
+            break
+    for external_id in data.get("external_ids") or []:
+        if external_id.get("type") == "wikidata":
+            wikidata = external_id.get("preferred") or next(iter(external_id.get("all") or []), "")
+            if wikidata:
+                record["wikidata"] = wikidata
+                break
+    return record
+
+
+def get_default_path() -> Path:
+    """Get the default path of the metadata cache, next to the sheets cache."""
+    return get_default_directory().parent.joinpath("metadata.sqlite")
+
+
+class MetadataCache:
+    """A persistent key-value store of metadata records, in SQLite."""
+
+    def __init__(self, path: Union[None, str, Path] = None, *, ttl: Optional[float] = None):
+        """Initialize the cache.
+
+        :param path: The path to the database. Defaults to the one given by
+            :func:`get_default_path`.
+        :param ttl: The number of seconds after which records are looked up again.
+            Defaults to none, meaning they're kept forever.
+        """
+        self.path = Path(path).expanduser().resolve() if path else get_default_path()
+        self.ttl = ttl
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self._connect() as connection:
+            connection.execute("""
+                CREATE TABLE IF NOT EXISTS records (
+                    prefix TEXT NOT NULL,
+                    identifier TEXT NOT NULL,
+                    record TEXT,
+                    fetched REAL NOT NULL,
+                    PRIMARY KEY (prefix, identifier)
+                )
+                """)
+
+    def _connect(self) -> sqlite3.Connection:
+        # a connection per operation, so the cache can be shared between threads
+        return sqlite3.connect(self.path, timeout=30)
+
+    def get_many(self, prefix: str, identifiers: Iterable[str]) -> dict[str, Optional[Record]]:
+        """Get the cached records for identifiers.
+
+        :param prefix: The kind of identifiers
+        :param identifiers: The identifiers
+        :returns: A dictionary from the cached identifiers to their records, which are
+            none for identifiers that weren't found
+        """
+        identifiers = list(identifiers)
+        oldest = 0.0 if self.ttl is None else time.time() - self.ttl
+        rv = {}
+        connection = self._connect()
+        try:
+            # the number of parameters in a query is limited
+            for start in range(0, len(identifiers), 500):
+                batch = identifiers[start : start + 500]
+                rows = connection.execute(
+                    "SELECT identifier, record FROM records WHERE prefix = ? AND fetched >= ?"
+                    f" AND identifier IN ({', '.join('?' * len(batch))})",
+                    [prefix, oldest, *batch],
+                )
+                for identifier, record in rows:
+                    rv[identifier] = None if record is None else json.loads(record)
+        finally:
+            connection.close()
+        return rv
+
+    def set_many(self, prefix: str, records: Mapping[str, Optional[Record]]) -> None:
+        """Store records for identifiers, using none for ones that weren't found."""
+        now = time.time()
+        connection = self._connect()
+        try:
+            with connection:
+                connection.executemany(
+                    "INSERT OR REPLACE INTO records VALUES (?, ?, ?, ?)",
+                    (
+                        (prefix, identifier, None if record is None else json.dumps(record), now)
+                        for identifier, record in records.items()
+                    ),
+                )
+        finally:
+            connection.close()
+
+    def clear(self) -> None:
+        """Remove all records from the cache."""
+        connection = self._connect()
+        try:
+            with connection:
+                connection.execute("DELETE FROM records")
+        finally:
+            connection.close()
+
+
+def get_default_sources() -> list[Source]:
+    """Get the sources for ORCID, Wikidata, and ROR, sharing one HTTP client."""
+    client = SheetClient()
+    return [ORCIDSource(client=client), WikidataSource(client=client), RORSource(client=client)]
+
+
+class Enricher:
+    """Fill in the missing metadata of the authors and institutions in authorships."""
+
+    def __init__(
+        self,
+        sources: Optional[Iterable[Source]] = None,
+        *,
+        cache: Optional[MetadataCache] = None,
+        offline: bool = False,
+    ):
+        """Initialize the enricher.
+
+        :param sources: The sources of metadata, at most one per prefix. Defaults to
+            the ones given by :func:`get_default_sources`. Add a
+            :class:`RORAffiliationSource` to also match the names of institutions
+            without identifiers to ROR.
+        :param cache: A persistent cache of records. If none is given, records are
+            only kept in memory, for the lifetime of the enricher.
+        :param offline: If true, only use cached records
+        """
+        self.sources = {
+            source.prefix: source
+            for source in (get_default_sources() if sources is None else sources)
+        }
+        self.cache = cache
+        self.offline = offline
+        self._memory: dict[tuple[str, str], Optional[Record]] = {}
+
+    def get_records(self, prefix: str, identifiers: Iterable[str]) -> dict[str, Record]:
+        """Get the records for identifiers, from the cache or else from the source.
+
+        :param prefix: The kind of identifiers, e.g., ``orcid``
+        :param identifiers: The identifiers, which may have duplicates
+        :returns: A dictionary from the identifiers that were found to their records
+        """
+        source = self.sources.get(prefix)
+        if source is None:
+            return {}
+        identifiers = list(dict.fromkeys(identifiers))
+        rv = {
+            identifier: self._memory[prefix, identifier]
+            for identifier in identifiers
+            if (prefix, identifier) in self._memory
+        }
+        missing = [identifier for identifier in identifiers if identifier not in rv]
+        if missing and self.cache is not None:
+            cached = self.cache.get_many(prefix, missing)
+            count("metadata_cache_hits", len(cached))
+            rv.update(cached)
+            missing = [identifier for identifier in missing if identifier not in cached]
+        if missing and not self.offline:
+            count("metadata_lookups", len(missing))
+            try:
+                with span(f"lookup:{prefix}"):
+                    records = source.get_records(missing)
+            except URLError as e:
+                logger.warning("couldn't look up %d %s identifiers: %s", len(missing), prefix, e)
+            else:
+                fetched = {identifier: records.get(identifier) for identifier in missing}
+                if self.cache is not None:
+                    self.cache.set_many(prefix, fetched)
+                rv.update(fetched)
+        for identifier, record in rv.items():
+            self._memory[prefix, identifier] = record
+        return {identifier: record for identifier, record in rv.items() if record is not None}
+
+    @span("enrich")
+    def enrich(self, authorship: Authorship) -> Authorship:
+        """Get a copy of an authorship with missing metadata filled in.
+
+        Values that are already in the authorship are kept. Institutions that are
+        shared between authors stay shared.
+
+        :param authorship: An authorship
+        :returns: A new authorship
+        """
+        from .models import Authorship
+
+        authors = authorship.authors
+        institutions = list(
+            {
+                id(institution): institution
+                for institution in [
+                    *authorship.institutions,
+                    *(i for author in authors for i in author.institutions),
+                ]
+            }.values()
+        )
+
+        # look up the identifiers in the sheet, then the ROR identifiers found in them
+        wikidata = self.get_records(
+            "wikidata",
+            [
+                *(a.wikidata for a in authors if a.wikidata and not a.homepage),
+                *(i.wikidata for i in institutions if i.wikidata and not i.ror),
+            ],
+        )
+        orcid = self.get_records("orcid", [a.orcid for a in authors if a.orcid and not a.homepage])
+        unidentified = {id(i) for i in institutions if not i.ror and not i.wikidata}
+        names = self.get_records(
+            "ror_affiliation", [i.name for i in institutions if id(i) in unidentified]
+        )
+        matches = {
+            id(institution): (
+                names.get(institution.name, {}) if id(institution) in unidentified else {}
+            )
+            for institution in institutions
+        }
+        rors = {
+            id(institution): institution.ror
+            or wikidata.get(institution.wikidata or "", {}).get("ror")
+            or matches[id(institution)].get("ror")
+            for institution in institutions
+        }
+        ror = self.get_records("ror", [value for value in rors.values() if value])
+
+        new_institutions = {
+            id(institution): _update(
+                institution,
+                {"ror": rors[id(institution)] or ""},
+                ror.get(rors[id(institution)] or "", {}),
+                matches[id(institution)],
+            )
+            for institution in institutions
+        }
+        new_authors = []
+        for author in authors:
+            update = {}
+            author_institutions = [new_institutions[id(i)] for i in author.institutions]
+            if any(new is not old for new, old in zip(author_institutions, author.institutions)):
+                update["institutions"] = author_institutions
+            new_authors.append(
+                _update(
+                    author,
+                    orcid.get(author.orcid, {}),
+                    wikidata.get(author.wikidata or "", {}),
+                    **update,
+                )
+            )
+        return Authorship.model_construct(
+            authors=new_authors,
+            institutions=[new_institutions[id(i)] for i in authorship.institutions],
+        )
+
+
+def _update(
+    model: Union[Author, Institution], *records: Record, **update: Any
+) -> Union[Author, Institution]:
+    """Copy a model, filling in its empty fields from the first record that has them."""
+    for record in records:
+        for key, value in record.items():
+            if key in type(model).model_fields and value and not getattr(model, key):
+                update.setdefault(key, value)
+    if not update:
+        return model
+    return model.model_copy(update=update)
@@ -0,0 +1,204 @@
+"""Timing spans and counters for finding out where the time goes when rendering.
+
+The readers, writers, and caches time their stages (e.g., downloading a sheet,
+parsing it, constructing the models, and formatting the output) with :func:`span`
+and count what they process (e.g., rows, authors, institutions, bytes fetched,
+and cache hits) with :func:`count`. Each is emitted as an :class:`Event`:
+
+1. to the hooks added with :func:`add_hook`, and
+2. to the ``authorship.instrument`` logger at the debug level, with the event's
+   fields in the ``authorship_event`` attribute of the log record.
+
+When there are no hooks and debug logging is off, spans and counters are nearly
+free. :class:`Profile` is a hook that collects a per-stage breakdown, e.g.:
+
+.. code-block:: python
+
+    from authorship.instrument import Profile
+
+    with Profile() as profile:
+        reader.print("biorxiv")
+    print(profile.to_str())
+
+On the command line, use ``authorship --profile render ...``. Note that events
+from other processes (e.g., of ``authorship batch -j 4``) aren't collected.
+"""
+
+import logging
+import time
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from pathlib import Path
+from typing import Callable, Iterable, Iterator, Literal, NamedTuple, Union
+
+__all__ = [
+    "Event",
+    "Hook",
+    "add_hook",
+    "remove_hook",
+    "is_enabled",
+    "span",
+    "count",
+    "Profile",
+]
+
+logger = logging.getLogger(__name__)
+
+
+class Event(NamedTuple):
+    """A finished span or an increment of a counter."""
+
+    kind: Literal["span", "count"]
+    #: The name of the span or counter, e.g., ``download`` or ``authors``
+    name: str
+    #: The duration of a span, in seconds, or the increment of a counter
+    value: float
+    #: The names of the enclosing spans, outermost first. For spans, this includes
+    #: the span itself.
+    path: tuple[str, ...]
+    #: The value of :func:`time.perf_counter` when a span started, or when a counter
+    #: was incremented
+    start: float
+
+
+#: A function that's called with each event
+Hook = Callable[[Event], None]
+
+_hooks: list[Hook] = []
+_path: ContextVar[tuple[str, ...]] = ContextVar("authorship_span", default=())
+
+
+def add_hook(hook: Hook) -> None:
+    """Add a function that's called with each event, e.g., to export them to a tracer."""
+    _hooks.append(hook)
+
+
+def remove_hook(hook: Hook) -> None:
+    """Remove a hook added with :func:`add_hook`."""
+    _hooks.remove(hook)
+
+
+def is_enabled() -> bool:
+    """Check if events are emitted, i.e., if there are hooks or debug logging is on."""
+    return bool(_hooks) or logger.isEnabledFor(logging.DEBUG)
+
+
+def _emit(event: Event) -> None:
+    for hook in list(_hooks):
+        hook(event)
+    if logger.isEnabledFor(logging.DEBUG):
+        if event.kind == "span":
+            msg, value = "%s took %.2f ms", 1000 * event.value
+        else:
+            msg, value = "%s += %d", event.value
+        logger.debug(
+            msg,
+            "/".join(event.path) or event.name,
+            value,
+            extra={"authorship_event": event._asdict()},
+        )
+
+
+@contextmanager
+def span(name: str) -> Iterator[None]:
+    """Time a stage, e.g., ``with span("download"): ...``.
+
+    Spans can be nested, in which case the path of the inner span includes the
+    names of the outer ones. A span can also decorate a function, in which case
+    each call is timed.
+    """
+    if not is_enabled():
+        yield
+        return
+    path = (*_path.get(), name)
+    token = _path.set(path)
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        seconds = time.perf_counter() - start
+        _path.reset(token)
+        _emit(Event("span", name, seconds, path, start))
+
+
+def count(name: str, value: float = 1) -> None:
+    """Increment a counter, e.g., ``count("authors", len(authors))``."""
+    if is_enabled():
+        _emit(Event("count", name, value, _path.get(), time.perf_counter()))
+
+
+class _Stage(NamedTuple):
+    start: float
+    calls: int
+    seconds: float
+
+
+class Profile:
+    """A hook that collects a per-stage breakdown of the time spent while it's active."""
+
+    def __init__(self, *, cprofile: bool = False):
+        """Initialize the profile.
+
+        :param cprofile: Should :mod:`cProfile` also run while the profile is active?
+            Its statistics can then be saved with :meth:`dump_stats`.
+        """
+        #: A dictionary from paths of spans to when they first started, how many times
+        #: they finished, and their total duration in seconds
+        self.stages: dict[tuple[str, ...], _Stage] = {}
+        #: The totals of the counters
+        self.counters: Counter[str] = Counter()
+        self.cprofile = None
+        if cprofile:
+            import cProfile
+
+            self.cprofile = cProfile.Profile()
+
+    def __call__(self, event: Event) -> None:
+        """Collect an event."""
+        if event.kind == "count":
+            self.counters[event.name] += event.value
+            return
+        stage = self.stages.get(event.path)
+        if stage is None:
+            self.stages[event.path] = _Stage(event.start, 1, event.value)
+        else:
+            self.stages[event.path] = _Stage(
+                stage.start, stage.calls + 1, stage.seconds + event.value
+            )
+
+    def __enter__(self) -> "Profile":
+        add_hook(self)
+        if self.cprofile is not None:
+            self.cprofile.enable()
+        return self
+
+    def __exit__(self, *args) -> None:
+        if self.cprofile is not None:
+            self.cprofile.disable()
+        remove_hook(self)
+
+    def dump_stats(self, path: Union[str, Path]) -> None:
+        """Save the :mod:`cProfile` statistics, e.g., for :mod:`pstats` or snakeviz."""
+        if self.cprofile is None:
+            raise ValueError("the profile was made without cprofile=True")
+        self.cprofile.dump_stats(str(path))
+
+    def iter_lines(self) -> Iterable[str]:
+        """Iterate over the lines of a table of the stages, in the order they started."""
+        paths = sorted(self.stages, key=lambda path: self.stages[path].start)
+        labels = ["  " * (len(path) - 1) + path[-1] for path in paths]
+        width = max([len("stage"), *map(len, labels), *map(len, self.counters)])
+        yield f"{'stage':<{width}}  {'calls':>6}  {'total (ms)':>10}"
+        for label, path in zip(labels, paths):
+            stage = self.stages[path]
+            yield f"{label:<{width}}  {stage.calls:>6}  {1000 * stage.seconds:>10.2f}"
+        if self.counters:
+            yield ""
+            yield f"{'counter':<{width}}  {'total':>6}"
+            for name, value in self.counters.items():
+                yield f"{name:<{width}}  {value:>6,.0f}"
+
+    def to_str(self) -> str:
+        """Make a table of the stages and counters."""
+        return "\n".join(self.iter_lines())
@@ -0,0 +1,192 @@
+"""Render many manuscripts' author lists from a manifest.
+
+A manifest is a YAML file listing jobs, each of which reads one authorship
+and writes it with one or more writers to a directory:
+
+.. code-block:: yaml
+
+    # optional, shared between all jobs
+    cache: ~/.data/authorship/sheets
+    jobs:
+      - name: sssom
+        source: 1NfhibWHOKgV2glmgRdKMzHEzTCw2_dUq_t0Zq64cgeQ
+        reader: obo_google_sheet
+        reader_kwargs:
+          skiprows: 1
+        writers: [text, biorxiv]
+        directory: output/sssom
+      - source: authors.tsv
+        directory: output/local
+
+Relative paths in a manifest are resolved relative to the manifest's directory.
+"""
+
+import inspect
+import time
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from pathlib import Path
+from typing import Any, NamedTuple, Optional, Union
+
+from class_resolver import HintOrType
+from pydantic import BaseModel, Field
+
+from .readers import Reader, reader_resolver
+
+__all__ = [
+    "Job",
+    "Manifest",
+    "JobResult",
+    "guess_reader",
+    "make_reader",
+    "load_manifest",
+    "run_job",
+    "run_jobs",
+]
+
+#: File extensions of sheets that are read with :class:`authorship.readers.SheetFileReader`
+SHEET_FILE_SUFFIXES = {".tsv", ".txt", ".csv", ".xlsx", ".xlsm", ".xls", ".ods"}
+
+
+class Job(BaseModel):
+    """A job that renders one authorship with several writers."""
+
+    #: The name of the job, used when reporting. Defaults to the source.
+    name: Optional[str] = None
+    #: The first argument to the reader, e.g., the identifier of a google sheet or a path
+    source: str
+    #: The name of the reader. If none is given, it's guessed from the source with
+    #: :func:`make_reader`.
+    reader: Optional[str] = None
+    #: Keyword arguments passed to the reader
+    reader_kwargs: dict[str, Any] = Field(default_factory=dict)
+    #: The names of the writers
+    writers: list[str] = Field(default_factory=lambda: ["text"])
+    #: The directory where the outputs are written
+    directory: str
+
+    @property
+    def label(self) -> str:
+        """Get a label for the job."""
+        return self.name or self.source
+
+
+class Manifest(BaseModel):
+    """A list of jobs, with a cache for google sheets shared between them."""
+
+    #: The directory for a :class:`authorship.cache.SheetCache` shared by all jobs
+    cache: Optional[str] = None
+    jobs: list[Job]
+
+
+class JobResult(NamedTuple):
+    """The result of running a job."""
+
+    #: The label of the job
+    name: str
+    #: The time the job took, in seconds
+    seconds: float
+    #: A description of the error, if the job failed
+    error: Optional[str] = None
+
+
+def guess_reader(source: str) -> str:
+    """Guess the name of the reader for a source.
+
+    :param source: The identifier of a google sheet or the path to a local export
+    :returns: ``arrow`` for directories, ``sheet_file`` for sheet files, and
+        ``google_sheet`` otherwise
+    """
+    path = Path(source).expanduser()
+    if path.is_dir():
+        return "arrow"
+    if path.suffix.lower() in SHEET_FILE_SUFFIXES:
+        return "sheet_file"
+    return "google_sheet"
+
+
+def make_reader(
+    source: str,
+    reader: Optional[HintOrType[Reader]] = None,
+    reader_kwargs: Optional[dict[str, Any]] = None,
+    *,
+    cache_directory: Union[None, str, Path] = None,
+) -> Reader:
+    """Make a reader for a source.
+
+    :param source: The first argument to the reader, e.g., the identifier of a google
+        sheet or the path to a local export
+    :param reader: The reader (or its name). If none is given, it's guessed from the
+        source with :func:`guess_reader`.
+    :param reader_kwargs: Keyword arguments passed to the reader
+    :param cache_directory: If given and the reader takes a cache, uses a
+        :class:`authorship.cache.SheetCache` in this directory
+    :returns: A reader
+    """
+    reader_cls = reader_resolver.lookup(reader if reader is not None else guess_reader(source))
+    parameters = list(inspect.signature(reader_cls.__init__).parameters)
+    kwargs = dict(reader_kwargs or {})
+    kwargs[parameters[1]] = source
+    if cache_directory is not None and "cache" in parameters:
+        from .cache import SheetCache
+
+        kwargs.setdefault("cache", SheetCache(cache_directory))
+    return reader_cls(**kwargs)
+
+
+def load_manifest(path: Union[str, Path]) -> Manifest:
+    """Load a manifest from a YAML file, resolving relative paths.
+
+    :param path: The path to the manifest
+    :returns: A manifest
+    """
+    import yaml
+
+    path = Path(path).expanduser().resolve()
+    manifest = Manifest.model_validate(yaml.safe_load(path.read_text()))
+    if manifest.cache is not None:
+        manifest.cache = str(path.parent.joinpath(Path(manifest.cache).expanduser()))
+    for job in manifest.jobs:
+        job.directory = str(path.parent.joinpath(Path(job.directory).expanduser()))
+        source_path = path.parent.joinpath(job.source)
+        if source_path.exists():
+            job.source = str(source_path)
+    return manifest
+
+
+def run_job(job: Job, cache_directory: Union[None, str, Path] = None) -> JobResult:
+    """Run a job, catching any errors.
+
+    :param job: The job
+    :param cache_directory: The directory of a sheet cache shared between jobs
+    :returns: The result of the job, with how long it took and an error if it failed
+    """
+    start = time.perf_counter()
+    try:
+        reader = make_reader(
+            job.source, job.reader, job.reader_kwargs, cache_directory=cache_directory
+        )
+        reader.export_all(job.writers, directory=job.directory)
+    except Exception as e:
+        return JobResult(job.label, time.perf_counter() - start, f"{type(e).__name__}: {e}")
+    return JobResult(job.label, time.perf_counter() - start)
+
+
+def run_jobs(
+    jobs: list[Job],
+    *,
+    cache_directory: Union[None, str, Path] = None,
+    max_workers: int = 1,
+) -> list[JobResult]:
+    """Run jobs, in parallel processes if more than one worker is given.
+
+    :param jobs: The jobs
+    :param cache_directory: The directory of a sheet cache shared between all jobs. Writes
+        to the cache are atomic, so processes can share it safely.
+    :param max_workers: The number of processes. If 1, runs the jobs in this process.
+    :returns: The results of the jobs, in the same order
+    """
+    if max_workers == 1:
+        return [run_job(job, cache_directory) for job in jobs]
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(run_job, jobs, repeat(cache_directory)))
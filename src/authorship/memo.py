@@ -0,0 +1,162 @@
+"""Content-addressed memoization of parsed authorships and rendered output.
+
+Parsing a sheet and rendering an authorship are both deterministic, so their
+results can be stored in bounded, least recently used (LRU) caches keyed by a
+stable hash of their input. For example, exporting the same authorship with
+several writers only parses the sheet once, and rendering the same authorship
+twice with the same writer only formats it once.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from functools import wraps
+from typing import TYPE_CHECKING, Any, Callable, Generic, Hashable, Optional, TypeVar
+
+from .instrument import count, span
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+    from .models import Authorship
+
+__all__ = [
+    "LRUCache",
+    "reader_cache",
+    "render_cache",
+    "hash_df",
+    "hash_kwargs",
+    "clear_caches",
+    "memoize_authorship",
+]
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class LRUCache(Generic[K, V]):
+    """A thread-safe cache that keeps a bounded number of the most recently used values."""
+
+    def __init__(self, maxsize: int = 128, *, name: Optional[str] = None):
+        """Initialize the cache.
+
+        :param maxsize: The maximum number of values kept in the cache
+        :param name: If given, hits and misses are counted with
+            :func:`authorship.instrument.count` as ``<name>_hits`` and ``<name>_misses``
+        """
+        self.maxsize = maxsize
+        self.name = name
+        self.hits = 0
+        self.misses = 0
+        self._data: OrderedDict[K, V] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get_or_set(self, key: K, func: Callable[[], V]) -> V:
+        """Get the value for a key, computing and storing it with the function if it's missing."""
+        with self._lock:
+            if key in self._data:
+                self.hits += 1
+                self._data.move_to_end(key)
+                if self.name is not None:
+                    count(f"{self.name}_hits")
+                return self._data[key]
+            self.misses += 1
+        if self.name is not None:
+            count(f"{self.name}_misses")
+        # compute outside the lock so other keys aren't blocked
+        value = func()
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+        return value
+
+    def clear(self) -> None:
+        """Remove all values from the cache."""
+        with self._lock:
+            self._data.clear()
+
+    def keys(self) -> list[K]:
+        """Get the keys in the cache, from the least to the most recently used."""
+        with self._lock:
+            return list(self._data)
+
+    def pop(self, key: K) -> Optional[V]:
+        """Remove the value for a key from the cache, returning it if it was there."""
+        with self._lock:
+            return self._data.pop(key, None)
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __contains__(self, key: K) -> bool:
+        return key in self._data
+
+
+#: A cache from reader classes, their configuration, and the hash of their data to authorships
+reader_cache: LRUCache[tuple[str, str, str], "Authorship"] = LRUCache(
+    maxsize=32, name="reader_cache"
+)
+#: A cache from writer classes, their configuration, and the hash of an authorship to output
+render_cache: LRUCache[tuple[str, str, str], str] = LRUCache(maxsize=256, name="render_cache")
+
+
+@span("hash")
+def hash_df(df: pd.DataFrame) -> str:
+    """Get a stable hash of the columns and values of a dataframe."""
+    import pandas as pd
+
+    digest = hashlib.sha256(json.dumps([str(column) for column in df.columns]).encode())
+    digest.update(pd.util.hash_pandas_object(df, index=False).to_numpy().tobytes())
+    return digest.hexdigest()
+
+
+def hash_kwargs(obj: Any, skip: frozenset[str] = frozenset()) -> str:
+    """Get a stable representation of the public configuration of a reader or writer.
+
+    :param obj: A reader or writer
+    :param skip: Attributes to skip, e.g., ones holding data or caches
+    :returns: A string representing the public attributes of the object
+    """
+    kwargs = {
+        key: value
+        for key, value in vars(obj).items()
+        if not key.startswith("_") and key not in skip
+    }
+    return json.dumps(kwargs, sort_keys=True, default=repr)
+
+
+#: Reader attributes that don't affect the authorship, e.g., since the content of the
+#: dataframe is hashed
+READER_SKIP = frozenset(["df", "cache", "google_sheet", "gid", "path", "n_jobs"])
+
+
+def memoize_authorship(func: Callable[[Any], "Authorship"]) -> Callable[[Any], "Authorship"]:
+    """Memoize the ``get_authorship`` method of a dataframe-based reader.
+
+    The authorship is stored in :data:`reader_cache`, keyed by the reader class, its
+    configuration, and the hash of its dataframe. Note that the same authorship object
+    is returned for equivalent readers, so it shouldn't be modified in place.
+    """
+
+    @wraps(func)
+    @span("get_authorship")
+    def _wrapped(self) -> "Authorship":
+        key = (
+            f"{type(self).__module__}.{type(self).__qualname__}",
+            hash_kwargs(self, skip=READER_SKIP),
+            hash_df(self.df),
+        )
+        return reader_cache.get_or_set(key, lambda: func(self))
+
+    return _wrapped
+
+
+def clear_caches() -> None:
+    """Clear the reader and render caches."""
+    reader_cache.clear()
+    render_cache.clear()
@@ -1,6 +1,22 @@
 """Models."""
 
-from typing import Optional
+import hashlib
+import uuid
+from functools import cached_property
+from itertools import chain, repeat
+from typing import (
+    Any,
+    Collection,
+    Iterator,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Sequence,
+    TypeVar,
+    Union,
+    get_args,
+    get_origin,
+)
 
 from pydantic import BaseModel
 
@@ -8,31 +24,36 @@ __all__ = [
     "Institution",
     "Author",
     "Authorship",
+    "AffiliationIndex",
+    "InstitutionRegistry",
+    "construct_many",
 ]
 
+M = TypeVar("M", bound=BaseModel)
+
 
 class Institution(BaseModel):
     """An institution."""
 
     name: str
-    address: Optional[str]
-    ror: Optional[str]
-    wikidata: Optional[str]
+    address: Optional[str] = None
+    ror: Optional[str] = None
+    wikidata: Optional[str] = None
 
 
 class Author(BaseModel):
     """An author."""
 
     first: str
-    middle: Optional[str]
+    middle: Optional[str] = None
     last: str
     email: str
     orcid: str
-    wikidata: Optional[str]
-    role: Optional[str]
-    homepage: Optional[str]
-    conflict: Optional[str]
-    twitter: Optional[str]
+    wikidata: Optional[str] = None
+    role: Optional[str] = None
+    homepage: Optional[str] = None
+    conflict: Optional[str] = None
+    twitter: Optional[str] = None
     institutions: list[Institution]
 
     @property
@@ -48,3 +69,396 @@ class Authorship(BaseModel):
 
     authors: list[Author]
     institutions: list[Institution]
+
+    def get_hash(self) -> str:
+        """Get a stable hash of the content of the authorship.
+
+        The hash is computed once, like :attr:`affiliation_index`. It's recomputed
+        after a field of the authorship is assigned, but not after its authors or
+        institutions are modified in place, so make a new authorship (e.g., with
+        :meth:`model_copy`) instead.
+        """
+        rv = self.__dict__.get("_hash")
+        if rv is None:
+            rv = self.__dict__["_hash"] = hashlib.sha256(
+                self.model_dump_json().encode("utf-8")
+            ).hexdigest()
+        return rv
+
+    @cached_property
+    def affiliation_index(self) -> "AffiliationIndex":
+        """Get the index of the institutions the authors are affiliated with.
+
+        The index is computed once and shared between all writers that number
+        affiliations, so they number them consistently. Like :meth:`get_hash`, it's
+        recomputed after a field is assigned, but not after in-place modifications.
+        """
+        return AffiliationIndex.from_authors(self.authors)
+
+    def model_copy(self, *, update: Optional[Mapping[str, Any]] = None, deep: bool = False):
+        """Copy the authorship, without the cached index and hash of the original."""
+        rv = super().model_copy(update=update, deep=deep)
+        rv._clear_caches()
+        return rv
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        self._clear_caches()
+
+    def _clear_caches(self) -> None:
+        # cached values are stored in the instance's dictionary, which pydantic>=2.6
+        # leaves out of equality, but copies along with the fields
+        self.__dict__.pop("affiliation_index", None)
+        self.__dict__.pop("_hash", None)
+
+
+class AffiliationIndex(NamedTuple):
+    """An index of the institutions that authors are affiliated with, deduplicated by name."""
+
+    #: The unique institutions, in order of first appearance going author by author and
+    #: then affiliation by affiliation. The position of an institution is its identifier.
+    institutions: list[Institution]
+    #: The identifiers of the institutions of each author, aligned with the authors
+    author_ids: list[list[int]]
+
+    @classmethod
+    def from_authors(cls, authors: list[Author]) -> "AffiliationIndex":
+        """Build an index for a list of authors."""
+        name_to_id: dict[str, int] = {}
+        institutions: list[Institution] = []
+        author_ids: list[list[int]] = []
+        for author in authors:
+            ids = []
+            for institution in author.institutions:
+                institution_id = name_to_id.get(institution.name)
+                if institution_id is None:
+                    institution_id = name_to_id[institution.name] = len(institutions)
+                    institutions.append(institution)
+                ids.append(institution_id)
+            author_ids.append(ids)
+        return cls(institutions=institutions, author_ids=author_ids)
+
+
+class InstitutionRegistry:
+    """A pool of interned institutions, shared between readers, authors, and authorships.
+
+    Institutions with the same values are represented by a single object, so an
+    institution that appears in many sheets (e.g., for the papers of a consortium)
+    only costs one object, and comparing lists of interned institutions short-circuits
+    on identity. Institutions are interned by all of their values, so two institutions
+    with the same ROR but differently written names stay distinct and the output of
+    the writers doesn't change. Interned institutions can be looked up by ROR,
+    Wikidata, or normalized name with :meth:`lookup`.
+
+    Since interned institutions are shared, they shouldn't be modified in place.
+
+    >>> registry = InstitutionRegistry()
+    >>> a = registry.intern(Institution(name="Harvard Medical School", ror="03vek6s52"))
+    >>> b = registry.intern(Institution(name="Harvard Medical School", ror="03vek6s52"))
+    >>> a is b
+    True
+    >>> registry.lookup(name="harvard  medical school") is a
+    True
+    """
+
+    def __init__(self):
+        """Initialize an empty registry."""
+        # identifies the registry in the keys of memoized readers, unlike its address,
+        # which can be reused by a new registry after this one is garbage collected
+        self._token = uuid.uuid4().hex
+        self._pool: dict[tuple[Optional[str], ...], Institution] = {}
+        self._index: dict[tuple[str, str], Institution] = {}
+
+    def __len__(self) -> int:
+        return len(self._pool)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self._token})"
+
+    def __iter__(self) -> Iterator[Institution]:
+        return iter(list(self._pool.values()))
+
+    def __contains__(self, institution: Institution) -> bool:
+        return _get_key(institution) in self._pool
+
+    def intern(self, institution: Institution) -> Institution:
+        """Get the interned institution with the same values, adding it if necessary."""
+        rv = self._pool.get(_get_key(institution))
+        if rv is None:
+            rv = self._add(_get_key(institution), institution)
+        return rv
+
+    def intern_many(self, columns: Mapping[str, Sequence[Optional[str]]]) -> list[Institution]:
+        """Get interned institutions from aligned columns of values.
+
+        :param columns: A dictionary from the fields of :class:`Institution` to sequences
+            of values of the same length, like for :func:`construct_many`
+        :returns: A list of interned institutions, aligned with the columns. Only the
+            institutions that aren't in the registry yet are constructed.
+        """
+        if not columns:
+            return []
+        n = len(next(iter(columns.values())))
+        keys = list(zip(*(columns[field] if field in columns else [None] * n for field in _FIELDS)))
+        new = dict.fromkeys(key for key in keys if key not in self._pool)
+        if new:
+            institutions = construct_many(
+                Institution, {field: [key[i] for key in new] for i, field in enumerate(_FIELDS)}
+            )
+            for key, institution in zip(new, institutions):
+                self._add(key, institution)
+        return [self._pool[key] for key in keys]
+
+    def intern_authorship(self, authorship: "Authorship") -> "Authorship":
+        """Get a copy of an authorship whose institutions are interned in this registry."""
+        return Authorship.model_construct(
+            authors=[
+                author.model_copy(
+                    update={"institutions": [self.intern(i) for i in author.institutions]}
+                )
+                for author in authorship.authors
+            ],
+            institutions=[self.intern(i) for i in authorship.institutions],
+        )
+
+    def lookup(
+        self,
+        *,
+        ror: Optional[str] = None,
+        wikidata: Optional[str] = None,
+        name: Optional[str] = None,
+    ) -> Optional[Institution]:
+        """Look up the first interned institution with the given ROR, Wikidata, or name.
+
+        :param ror: A ROR identifier, e.g., ``03vek6s52``
+        :param wikidata: A Wikidata identifier, e.g., ``Q49121``
+        :param name: A name, which is compared case-insensitively and ignoring whitespace
+        :returns: The first institution added to the registry that matches, trying the
+            given identifiers in order, or none if there's no match.
+        """
+        for prefix, value in [("ror", ror), ("wikidata", wikidata), ("name", name)]:
+            if value is None:
+                continue
+            if prefix == "name":
+                value = normalize_name(value)
+            rv = self._index.get((prefix, value))
+            if rv is not None:
+                return rv
+        return None
+
+    def clear(self) -> None:
+        """Remove all institutions from the registry."""
+        self._pool.clear()
+        self._index.clear()
+
+    def _add(self, key: tuple[Optional[str], ...], institution: Institution) -> Institution:
+        # setdefault is atomic, so readers in different threads can share a registry
+        rv = self._pool.setdefault(key, institution)
+        if rv is institution:
+            for index_key in [
+                ("ror", institution.ror),
+                ("wikidata", institution.wikidata),
+                ("name", normalize_name(institution.name)),
+            ]:
+                if index_key[1]:
+                    self._index.setdefault(index_key, institution)
+        return rv
+
+
+_FIELDS = list(Institution.model_fields)
+
+
+def _get_key(institution: Institution) -> tuple[Optional[str], ...]:
+    return tuple(getattr(institution, field) for field in _FIELDS)
+
+
+def normalize_name(name: str) -> str:
+    """Normalize the name of an institution for lookup, ignoring case and whitespace."""
+    return " ".join(name.casefold().split())
+
+
+def construct_many(
+    model: type[M],
+    columns: Mapping[str, Sequence[Any]],
+    *,
+    validate: bool = True,
+    n_jobs: int = 1,
+) -> list[M]:
+    """Construct many models from aligned columns of values.
+
+    Validating each model on construction is the largest part of the cost of
+    reading a big sheet, so the columns are instead checked once in bulk and the
+    models are then constructed without per-object validation, like
+    :meth:`pydantic.BaseModel.model_construct` (but faster). If the bulk checks
+    fail, the models are constructed with full validation so the usual
+    :class:`pydantic.ValidationError` is raised for the offending values.
+
+    :param model: The model class, e.g., :class:`Author`
+    :param columns: A dictionary from field names to sequences of values of the same
+        length. Fields that aren't given get their defaults.
+    :param validate: Should the types of the values be checked in bulk? Only pass
+        false for values that were already validated, e.g., by a reader that
+        normalized its input.
+    :param n_jobs: The number of processes between which the rows are sharded. Each
+        process checks and constructs its shard and sends the models back, except for
+        the values of nested models (e.g., the institutions of authors), which are
+        checked and set in this process, so they stay shared between models.
+    :returns: A list of models, aligned with the columns
+    """
+    if n_jobs > 1:
+        return _construct_sharded(model, columns, n_jobs, validate=validate)
+    if validate and not _check_columns(model, columns):
+        return _validate_many(model, columns)
+    if not columns:
+        # the defaults are infinite, so there have to be columns to zip them with
+        return []
+
+    # the values are in the order of the model's fields, like for validated models, so
+    # they're dumped in the same order
+    names = list(model.model_fields)
+    values = [
+        (
+            columns[name]
+            if name in columns
+            else (
+                _iter_defaults(field)
+                if field.default_factory is not None
+                else repeat(field.default)
+            )
+        )
+        for name, field in model.model_fields.items()
+    ]
+    fields_set = set(columns)
+    rv = []
+    for row in zip(*values):
+        instance = model.__new__(model)
+        object.__setattr__(instance, "__dict__", dict(zip(names, row)))
+        object.__setattr__(instance, "__pydantic_fields_set__", set(fields_set))
+        object.__setattr__(instance, "__pydantic_extra__", None)
+        object.__setattr__(instance, "__pydantic_private__", None)
+        rv.append(instance)
+    return rv
+
+
+def _validate_many(model: type[M], columns: Mapping[str, Sequence[Any]]) -> list[M]:
+    """Construct models with full validation, which raises the usual errors."""
+    keys = list(columns)
+    return [model(**dict(zip(keys, row))) for row in zip(*columns.values())]
+
+
+def _construct_sharded(
+    model: type[M], columns: Mapping[str, Sequence[Any]], n_jobs: int, *, validate: bool
+) -> list[M]:
+    """Check and construct models in a process pool."""
+    from concurrent.futures import ProcessPoolExecutor
+
+    nested = {
+        name: values
+        for name, values in columns.items()
+        if name in model.model_fields and _is_nested(model.model_fields[name].annotation)
+    }
+    if validate and not _check_columns(model, columns, fields=nested):
+        return _validate_many(model, columns)
+    n_rows = len(next(iter(columns.values()), []))
+    bounds = [n_rows * i // n_jobs for i in range(n_jobs + 1)]
+    # nested values are replaced by placeholders, which the processes don't check
+    shards = [
+        {
+            name: [None] * (end - start) if name in nested else values[start:end]
+            for name, values in columns.items()
+        }
+        for start, end in zip(bounds, bounds[1:])
+    ]
+    fields = set(model.model_fields).difference(nested) if validate else None
+    with ProcessPoolExecutor(max_workers=n_jobs) as executor:
+        # map returns the shards in order, so the models stay aligned with the columns
+        results = list(
+            executor.map(_construct_shard, [model] * len(shards), shards, [fields] * len(shards))
+        )
+    if any(result is None for result in results):
+        return _validate_many(model, columns)
+    rv = list(chain.from_iterable(results))
+    for name, values in nested.items():
+        for instance, value in zip(rv, values):
+            instance.__dict__[name] = value
+    return rv
+
+
+def _construct_shard(
+    model: type[M], columns: Mapping[str, Sequence[Any]], fields: Optional[set[str]]
+) -> Optional[list[M]]:
+    """Check and construct a shard, or get none if some of its values don't check."""
+    if fields is not None and not _check_columns(model, columns, fields=fields):
+        return None
+    return construct_many(model, columns, validate=False)
+
+
+def _is_nested(annotation) -> bool:
+    """Check if a field's values are models or lists of models."""
+    types = _get_types(annotation)
+    return types is not None and any(
+        issubclass(cls, BaseModel) for cls in chain(types[0], types[1] or ())
+    )
+
+
+def _iter_defaults(field) -> Iterator[Any]:
+    """Iterate over new default values of a field with a default factory."""
+    while True:
+        yield field.get_default(call_default_factory=True)
+
+
+def _check_columns(
+    model: type[BaseModel],
+    columns: Mapping[str, Sequence[Any]],
+    *,
+    fields: Optional[Collection[str]] = None,
+) -> bool:
+    """Check in bulk that the columns have the types of the model's fields.
+
+    :param model: The model class
+    :param columns: A dictionary from field names to sequences of values
+    :param fields: The fields whose types are checked. Defaults to all of them.
+    """
+    if not columns:
+        return False
+    if len({len(values) for values in columns.values()}) != 1:
+        return False
+    for name, field in model.model_fields.items():
+        if name not in columns:
+            if field.is_required():
+                return False
+            continue
+        if fields is not None and name not in fields:
+            continue
+        types = _get_types(field.annotation)
+        if types is None:
+            return False
+        outer, inner = types
+        values = columns[name]
+        if not set(map(type, values)) <= outer:
+            return False
+        if inner is not None and not set(map(type, chain.from_iterable(values))) <= inner:
+            return False
+    return not set(columns).difference(model.model_fields)
+
+
+def _get_types(annotation) -> Optional[tuple[set[type], Optional[set[type]]]]:
+    """Get the exact types allowed for a field and for its elements, if it's a list."""
+    if (
+        annotation in (str, int, float, bool)
+        or isinstance(annotation, type)
+        and issubclass(annotation, BaseModel)
+    ):
+        return {annotation}, None
+    origin, args = get_origin(annotation), get_args(annotation)
+    if origin is Union and len(args) == 2 and type(None) in args:
+        inner = _get_types(next(arg for arg in args if arg is not type(None)))
+        if inner is None or inner[1] is not None:
+            return None
+        return inner[0] | {type(None)}, None
+    if origin is list and len(args) == 1:
+        inner = _get_types(args[0])
+        if inner is None or inner[1] is not None:
+            return None
+        return {list}, inner[0]
+    return None
@@ -0,0 +1,273 @@
+"""Strategies for ordering the authors of a Hoyt-style sheet.
+
+By default, :class:`authorship.readers.SheetReader` puts lead authors first, senior
+authors last, and sorts the middle authors by last name. A :class:`Sorter` can be
+given instead, e.g., to order middle authors by their contributions or group them
+by consortium:
+
+.. code-block:: python
+
+    from authorship.ordering import ConsortiumSorter
+    from authorship.readers import GoogleSheetReader
+
+    sorter = ConsortiumSorter({"0000-0003-4423-4370": "OBO Foundry"})
+    reader = GoogleSheetReader("1Fo1YH3ZzOVrQ4wzKnBm6sPha5hZG66-u-uSMDGUvguI", sorter=sorter)
+
+Sorters compute an array of keys per criterion for all rows at once and order
+them with :func:`numpy.lexsort`, which is stable, rather than calling a Python
+function per row. Authors are identified in the mappings that sorters take by
+their ORCID, or by their email if they don't have one.
+"""
+
+from __future__ import annotations
+
+import json
+from abc import ABC, abstractmethod
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Mapping, Optional, Sequence
+
+from .constants import ROLE
+
+if TYPE_CHECKING:
+    import numpy as np
+    import pandas as pd
+    from class_resolver import ClassResolver
+
+    sorter_resolver: ClassResolver[Sorter]
+
+__all__ = [
+    "Sorter",
+    "KeySorter",
+    "NameSorter",
+    "ContributionSorter",
+    "ConsortiumSorter",
+    "CollationSorter",
+    "PinnedSorter",
+    "sorter_resolver",
+]
+
+#: The positions of the columns of a Hoyt-style sheet used for ordering
+FIRST, LAST, ROLE_COLUMN, EMAIL, ORCID = 0, 2, 3, 4, 5
+#: The blocks of combining marks that decomposed accented Latin letters use
+COMBINING_MARKS = "[\u0300-\u036f\u1ab0-\u1aff\u1dc0-\u1dff\u20d0-\u20ff\ufe20-\ufe2f]"
+
+
+class Sorter(ABC):
+    """A strategy for ordering the rows of a Hoyt-style sheet."""
+
+    @abstractmethod
+    def get_order(self, df: pd.DataFrame) -> np.ndarray:
+        """Get the positional order of the rows.
+
+        :param df: A Hoyt-style sheet
+        :returns: An array of row positions, e.g., for use with :meth:`pandas.DataFrame.iloc`
+        """
+
+    def __repr__(self) -> str:
+        # readers are memoized on their configuration, so this is based on the content
+        return f"{type(self).__name__}({json.dumps(vars(self), sort_keys=True, default=repr)})"
+
+
+class KeySorter(Sorter):
+    """A sorter that keeps lead authors first and senior authors last.
+
+    The middle authors are ordered by the keys from :meth:`get_keys`, then by their
+    order in the sheet.
+    """
+
+    @abstractmethod
+    def get_keys(self, df: pd.DataFrame) -> list[np.ndarray]:
+        """Get arrays of sort keys for all rows, from the most to the least significant."""
+
+    def get_order(self, df: pd.DataFrame) -> np.ndarray:
+        """Order by role, then by the sorter's keys."""
+        import numpy as np
+
+        role = df.iloc[:, ROLE_COLUMN].map(ROLE).fillna(1).to_numpy()
+        # lexsort uses the last key as the primary one
+        return np.lexsort([*reversed(self.get_keys(df)), role])
+
+
+def get_ranks(values: Any) -> np.ndarray:
+    """Get integer keys that sort like the values, with missing values last.
+
+    This makes keys for :func:`numpy.lexsort` from values it can't compare, e.g.,
+    strings with missing values.
+    """
+    import pandas as pd
+
+    codes, _ = pd.factorize(pd.Series(values, dtype=object), sort=True)
+    codes[codes == -1] = len(codes)
+    return codes
+
+
+def get_identifiers(df: pd.DataFrame) -> pd.Series:
+    """Get the ORCID of each row, or their email if they don't have one."""
+    return df.iloc[:, ORCID].fillna(df.iloc[:, EMAIL])
+
+
+class NameSorter(KeySorter):
+    """Order the middle authors by last name, which is the default."""
+
+    def get_keys(self, df: pd.DataFrame) -> list[np.ndarray]:
+        """Get the ranks of the last names."""
+        return [get_ranks(df.iloc[:, LAST].to_numpy())]
+
+
+class ContributionSorter(KeySorter):
+    """Order the middle authors by their contribution, largest first, then by last name."""
+
+    def __init__(self, weights: Mapping[str, float]):
+        """Initialize the sorter.
+
+        :param weights: A dictionary from the ORCIDs (or emails) of authors to the size
+            of their contribution, e.g., the number of commits or of tasks. Authors
+            who aren't in the dictionary come after the others.
+        """
+        self.weights = dict(weights)
+
+    def get_keys(self, df: pd.DataFrame) -> list[np.ndarray]:
+        """Get the negated weights, then the ranks of the last names."""
+        import numpy as np
+
+        weights = get_identifiers(df).map(self.weights).astype(float).to_numpy()
+        return [
+            np.where(np.isnan(weights), np.inf, -weights),
+            get_ranks(df.iloc[:, LAST].to_numpy()),
+        ]
+
+
+class ConsortiumSorter(KeySorter):
+    """Group the middle authors by consortium, then order them by last name.
+
+    Middle authors who aren't in a consortium come first.
+    """
+
+    def __init__(self, consortia: Mapping[str, str], order: Optional[Sequence[str]] = None):
+        """Initialize the sorter.
+
+        :param consortia: A dictionary from the ORCIDs (or emails) of authors to the
+            names of their consortia
+        :param order: The order of the consortia. Defaults to alphabetical order.
+            Consortia that aren't listed come after the listed ones, alphabetically.
+        """
+        self.consortia = dict(consortia)
+        self.order = list(order) if order is not None else None
+
+    def get_keys(self, df: pd.DataFrame) -> list[np.ndarray]:
+        """Get the positions of the consortia, then the ranks of the last names."""
+        import numpy as np
+
+        consortia = get_identifiers(df).map(self.consortia)
+        names = sorted(set(consortia.dropna()), key=lambda name: (self._position(name), name))
+        positions = consortia.map({name: i for i, name in enumerate(names)})
+        return [
+            positions.fillna(-1).to_numpy(dtype=np.int64),
+            get_ranks(df.iloc[:, LAST].to_numpy()),
+        ]
+
+    def _position(self, name: str) -> int:
+        if self.order is None or name not in self.order:
+            return len(self.order or [])
+        return self.order.index(name)
+
+
+class CollationSorter(KeySorter):
+    """Order the middle authors by last name, then first name, like a dictionary would.
+
+    By default, accents and case are ignored, so "Ávila" comes before "Baker" and
+    "de la Cruz" sorts with "De La Cruz". Give a locale to use its collation rules,
+    which needs PyICU (``pip install authorship[icu]``).
+    """
+
+    def __init__(self, locale: Optional[str] = None):
+        """Initialize the sorter.
+
+        :param locale: A locale, e.g., ``sv`` for Swedish, in which "Ö" comes after "Z"
+        """
+        self.locale = locale
+
+    def get_keys(self, df: pd.DataFrame) -> list[np.ndarray]:
+        """Get the ranks of the collation keys of the last names, then of the first names."""
+        import numpy as np
+        import pandas as pd
+
+        rv = []
+        for column in [LAST, FIRST]:
+            # collation keys are only computed once per distinct name
+            codes, uniques = pd.factorize(df.iloc[:, column])
+            keys = get_ranks(self._get_collation_keys(pd.Series(uniques).astype(str)))
+            rv.append(np.where(codes == -1, len(uniques), keys[codes]))
+        return rv
+
+    def _get_collation_keys(self, names: pd.Series) -> Any:
+        if self.locale is None:
+            folded = (
+                names.str.normalize("NFKD")
+                .str.replace(COMBINING_MARKS, "", regex=True)
+                .str.casefold()
+            )
+            # names that only differ by accents or case are ordered by code point
+            return (folded + "\0" + names).to_numpy()
+        try:
+            import icu
+        except ImportError as e:
+            raise ImportError(
+                "collating with a locale needs PyICU. Install it with `pip install authorship[icu]`"
+            ) from e
+        collator = icu.Collator.createInstance(icu.Locale(self.locale))
+        return [collator.getSortKey(name) for name in names]
+
+
+class PinnedSorter(Sorter):
+    """Put some authors at fixed positions and order the others with another sorter."""
+
+    def __init__(self, pins: Mapping[str, int], base: Optional[Sorter] = None):
+        """Initialize the sorter.
+
+        :param pins: A dictionary from the ORCIDs (or emails) of authors to their
+            positions, starting from 1. Negative positions count from the end, so -1
+            is the last position. Authors who aren't in the sheet are ignored.
+        :param base: The sorter for the other authors. Defaults to :class:`NameSorter`.
+        """
+        self.pins = dict(pins)
+        self.base = base if base is not None else NameSorter()
+
+    def get_order(self, df: pd.DataFrame) -> np.ndarray:
+        """Get the base order, then move the pinned authors to their positions."""
+        import numpy as np
+
+        n = len(df)
+        order = self.base.get_order(df)
+        pins = get_identifiers(df).map(self.pins).to_numpy(dtype=float)
+        pinned = np.flatnonzero(~np.isnan(pins))
+        positions = pins[pinned].astype(np.int64)
+        positions = np.where(positions < 0, n + positions, positions - 1)
+        if ((positions < 0) | (positions >= n)).any():
+            raise ValueError(f"pinned positions should be between 1 and {n}, or -{n} and -1")
+        if len(set(positions.tolist())) < len(positions):
+            raise ValueError("several authors are pinned to the same position")
+        rv = np.full(n, -1, dtype=np.int64)
+        rv[positions] = pinned
+        # the other authors fill the remaining positions in the base order
+        rv[rv == -1] = order[~np.isin(order, pinned)]
+        return rv
+
+
+@lru_cache(maxsize=None)
+def _get_sorter_resolver() -> "ClassResolver[Sorter]":
+    from class_resolver import ClassResolver
+
+    # an explicit list doesn't depend on which subclasses happen to be defined when
+    # the resolver is first used. Register other sorters with sorter_resolver.register
+    return ClassResolver(
+        [NameSorter, ContributionSorter, ConsortiumSorter, CollationSorter, PinnedSorter],
+        base=Sorter,
+    )
+
+
+def __getattr__(name: str) -> Any:
+    # the resolver is built on first use, since importing class_resolver is slow
+    if name == "sorter_resolver":
+        return _get_sorter_resolver()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,20 +1,60 @@
 """Readers."""
 
-from class_resolver import ClassResolver
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any
 
-from .base import PreparedReader, Reader
-from .google_sheets import GoogleSheetReader, SheetReader
-from .obo_sheet import OboGoogleSheetReader, OboSheetReader
+from .arrow import ArrowReader
+from .base import LazyReader, PreparedReader, Reader
+from .batch import BatchResult, fetch_many
+from .google_sheets import GoogleSheetReader, SheetFileReader, SheetReader
+from .obo_sheet import OboGoogleSheetReader, OboSheetFileReader, OboSheetReader
 
 __all__ = [
     "Reader",
     "reader_resolver",
+    "LazyReader",
+    "fetch_many",
+    "BatchResult",
     # Concrete classes
     "PreparedReader",
     "SheetReader",
     "GoogleSheetReader",
+    "SheetFileReader",
     "OboSheetReader",
     "OboGoogleSheetReader",
+    "OboSheetFileReader",
+    "ArrowReader",
 ]
 
-reader_resolver: ClassResolver[Reader] = ClassResolver.from_subclasses(Reader)
+if TYPE_CHECKING:
+    from class_resolver import ClassResolver
+
+    reader_resolver: ClassResolver[Reader]
+
+
+@lru_cache(maxsize=None)
+def _get_reader_resolver() -> "ClassResolver[Reader]":
+    from class_resolver import ClassResolver
+
+    # an explicit list doesn't depend on which subclasses happen to be defined when
+    # the resolver is first used. Register other readers with reader_resolver.register
+    return ClassResolver(
+        [
+            PreparedReader,
+            SheetReader,
+            GoogleSheetReader,
+            SheetFileReader,
+            OboSheetReader,
+            OboGoogleSheetReader,
+            OboSheetFileReader,
+            ArrowReader,
+        ],
+        base=Reader,
+    )
+
+
+def __getattr__(name: str) -> Any:
+    # the resolver is built on first use, since importing class_resolver is slow
+    if name == "reader_resolver":
+        return _get_reader_resolver()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
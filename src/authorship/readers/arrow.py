@@ -0,0 +1,42 @@
+"""Read the normalized columnar form of an authorship written with Arrow or Parquet."""
+
+from pathlib import Path
+from typing import Optional, Union
+
+from .base import Reader
+from ..columnar import read_authorship
+from ..models import Authorship, InstitutionRegistry
+
+__all__ = [
+    "ArrowReader",
+]
+
+
+class ArrowReader(Reader):
+    """Read an authorship from tables written by :class:`authorship.writers.ArrowWriter`.
+
+    This skips parsing a sheet entirely, so it's a fast way to reload an authorship
+    in the later steps of a pipeline. Requires :mod:`pyarrow`.
+    """
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        *,
+        memory_map: bool = True,
+        registry: Optional[InstitutionRegistry] = None,
+    ):
+        """Initialize the reader.
+
+        :param path: The directory with the tables, written by
+            :class:`authorship.writers.ArrowWriter` or :class:`authorship.writers.ParquetWriter`
+        :param memory_map: Should Arrow IPC files be memory-mapped instead of read?
+        :param registry: A registry in which institutions are interned
+        """
+        self.path = path
+        self.memory_map = memory_map
+        self.registry = registry
+
+    def get_authorship(self) -> Authorship:
+        """Read the authorship from the tables."""
+        return read_authorship(self.path, memory_map=self.memory_map, registry=self.registry)
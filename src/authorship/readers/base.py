@@ -3,19 +3,24 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import TYPE_CHECKING
-
-from class_resolver import HintOrType, OptionalKwargs
+from typing import TYPE_CHECKING, Iterable, Optional, Union
 
+from ..instrument import span
 from ..models import Authorship
 
 if TYPE_CHECKING:
+    import pandas as pd
+    from class_resolver import HintOrType, OptionalKwargs
+
+    from ..validate import ValidationReport
     from ..writers import Writer
 
 __all__ = [
     "Reader",
     "PreparedReader",
+    "LazyReader",
 ]
 
 
@@ -26,6 +31,19 @@ class Reader(ABC):
     def get_authorship(self) -> "Authorship":
         """Get an author list."""
 
+    def validate(self) -> "ValidationReport":
+        """Check the authorship for problems, reporting all of them at once.
+
+        Readers of sheets check the sheet's rows without constructing the authorship.
+        Other readers check the authors of the authorship, e.g., for ORCID checksums
+        and duplicate emails.
+
+        :returns: A report of the problems, with their rows and columns
+        """
+        from ..validate import validate_authorship
+
+        return validate_authorship(self.get_authorship())
+
     def print(  # noqa:T202
         self,
         writer: HintOrType["Writer"] = "text",
@@ -45,6 +63,67 @@ class Reader(ABC):
         else:
             _writer.print(self.get_authorship(), file=file, **kwargs)
 
+    def export_all(
+        self,
+        writers: Optional[Iterable[HintOrType["Writer"]]] = None,
+        *,
+        directory: Union[None, str, Path] = None,
+        max_workers: Optional[int] = None,
+    ) -> dict[str, str]:
+        """Render the authorship from this reader with several writers at once.
+
+        The authorship is only parsed once and the shared affiliation index is
+        only computed once, then the authorship is rendered with each writer.
+
+        :param writers: The writers (or their names). Defaults to all writers whose
+            optional packages are installed, see :meth:`authorship.writers.Writer.is_available`.
+        :param directory: If given, writes each output to the directory, using
+            the writer's :attr:`authorship.writers.Writer.file_name`. Binary writers
+            (e.g., :class:`authorship.writers.ArrowWriter`) write their files there
+            instead of the text output.
+        :param max_workers: If given, renders in parallel with this many threads
+        :returns: A dictionary from the normalized names of the writers to their output
+
+        .. code-block:: python
+
+            from authorship.readers import GoogleSheetReader
+
+            reader = GoogleSheetReader("1Fo1YH3ZzOVrQ4wzKnBm6sPha5hZG66-u-uSMDGUvguI")
+            reader.export_all(["text", "biorxiv"], directory="~/Desktop/authors")
+        """
+        from ..writers import writer_resolver
+
+        authorship = self.get_authorship()
+        # compute the affiliation index up front so threads don't race to compute it
+        _ = authorship.affiliation_index
+        _writers = (
+            [cls() for cls in writer_resolver if cls.is_available()]
+            if writers is None
+            else [writer_resolver.make(writer) for writer in writers]
+        )
+
+        def _render(_writer: "Writer") -> str:
+            return _writer.to_str(authorship)
+
+        if max_workers is None:
+            texts = list(map(_render, _writers))
+        else:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                texts = list(executor.map(_render, _writers))
+
+        if directory is not None:
+            directory = Path(directory).expanduser().resolve()
+            directory.mkdir(parents=True, exist_ok=True)
+            for _writer, text in zip(_writers, texts):
+                if _writer.binary:
+                    _writer.write(authorship, path=directory.joinpath(_writer.file_name))
+                else:
+                    directory.joinpath(_writer.file_name).write_text(text)
+
+        return {
+            writer_resolver.normalize_inst(_writer): text for _writer, text in zip(_writers, texts)
+        }
+
 
 class PreparedReader(Reader):
     """A reader for prepared :class:`Authorship` instances."""
@@ -56,3 +135,51 @@ class PreparedReader(Reader):
     def get_authorship(self) -> "Authorship":
         """Get the prepared authorship."""
         return self.authorship
+
+
+class LazyReader(Reader):
+    """A mixin for dataframe-based readers that defers loading the dataframe until it's needed.
+
+    Loading (e.g., downloading a google sheet) happens on first access to ``df``,
+    which usually means the first call to :meth:`get_authorship`. The authorship is
+    then memoized, so subsequent calls are free. Use :meth:`prefetch` and
+    :meth:`invalidate` to control when I/O happens, e.g., in batch jobs.
+
+    This class should come before the dataframe-based reader in the bases, like in
+    ``class GoogleSheetReader(LazyReader, SheetReader)``.
+    """
+
+    _df: Optional[pd.DataFrame] = None
+    _authorship: Optional[Authorship] = None
+
+    @abstractmethod
+    def load_df(self) -> pd.DataFrame:
+        """Load the dataframe."""
+
+    @property
+    def df(self) -> pd.DataFrame:
+        """Get the dataframe, loading it if it hasn't been already."""
+        if self._df is None:
+            with span("load"):
+                self._df = self.load_df()
+        return self._df
+
+    @df.setter
+    def df(self, df: pd.DataFrame) -> None:
+        self._df = df
+        self._authorship = None
+
+    def get_authorship(self) -> Authorship:
+        """Get the authorship, memoized after the first call."""
+        if self._authorship is None:
+            self._authorship = super().get_authorship()
+        return self._authorship
+
+    def prefetch(self) -> None:
+        """Load the dataframe now, if it hasn't been already."""
+        _ = self.df
+
+    def invalidate(self) -> None:
+        """Forget the loaded dataframe and authorship, so they're loaded again on next use."""
+        self._df = None
+        self._authorship = None
@@ -0,0 +1,131 @@
+"""Fetch many google sheets concurrently."""
+
+from __future__ import annotations
+
+import copy
+import io
+import logging
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import TYPE_CHECKING, Iterable, NamedTuple, Optional, Union
+
+from .base import LazyReader
+from .google_sheets import GoogleSheetReader
+from .obo_sheet import OboGoogleSheetReader
+from ..client import SheetClient
+from ..constants import GOOGLE_SHEETS_URL, read_sheet
+
+if TYPE_CHECKING:
+    from class_resolver import HintOrType, OptionalKwargs
+
+    from ..cache import SheetCache
+
+__all__ = [
+    "fetch_many",
+    "BatchResult",
+]
+
+logger = logging.getLogger(__name__)
+
+#: A pair of a google sheet identifier and a sheet identifier
+SheetKey = tuple[str, Union[str, int]]
+#: Either a google sheet identifier, using the first sheet, or a :data:`SheetKey`
+SheetHint = Union[str, SheetKey]
+
+
+class BatchResult(NamedTuple):
+    """The result of :func:`fetch_many`."""
+
+    #: Readers whose sheets were successfully downloaded
+    readers: dict[SheetKey, LazyReader]
+    #: Errors for the sheets that couldn't be downloaded
+    errors: dict[SheetKey, Exception]
+
+
+def fetch_many(
+    sheets: Iterable[SheetHint],
+    *,
+    reader: HintOrType[LazyReader] = "google_sheet",
+    reader_kwargs: OptionalKwargs = None,
+    cache: Optional["SheetCache"] = None,
+    client: Optional[SheetClient] = None,
+    max_workers: int = 8,
+    url_template: str = GOOGLE_SHEETS_URL,
+) -> BatchResult:
+    """Download many google sheets concurrently and get readers for them.
+
+    :param sheets: The google sheets, either given by their identifier or by a pair of
+        their identifier and the sheet identifier (in case there are more than one)
+    :param reader: The reader class (or its name), either ``google_sheet`` or
+        ``obo_google_sheet`` (or a subclass of them)
+    :param reader_kwargs: Additional keyword arguments passed to each reader, e.g., ``skiprows``
+    :param cache: A cache for the exports. If given, the downloads go through the cache
+        and the readers keep a reference to it. If a client is also given, the readers
+        get a copy of the cache that downloads with that client instead.
+    :param client: The HTTP client used for downloading. It keeps a pool of
+        keep-alive connections and retries transient errors with backoff. Defaults
+        to the cache's client, or to a new client that's closed afterwards.
+    :param max_workers: The maximum number of concurrent downloads
+    :param url_template: The template for the export URL, when no cache is given
+    :returns: A pair of dictionaries, one from the sheets to readers whose data are
+        already loaded and one from the sheets to the errors that happened downloading
+        them. An error in one sheet doesn't affect the others.
+    :raises ValueError: If the reader doesn't read google sheets
+
+    .. code-block:: python
+
+        from authorship.readers import fetch_many
+
+        readers, errors = fetch_many(
+            [
+                "1Fo1YH3ZzOVrQ4wzKnBm6sPha5hZG66-u-uSMDGUvguI",
+                ("1NfhibWHOKgV2glmgRdKMzHEzTCw2_dUq_t0Zq64cgeQ", 0),
+            ],
+        )
+    """
+    from . import reader_resolver
+
+    reader_cls = reader_resolver.lookup(reader)
+    if not issubclass(reader_cls, (GoogleSheetReader, OboGoogleSheetReader)):
+        raise ValueError(
+            f"can't fetch google sheets with {reader_cls.__name__}. Use a reader for google"
+            " sheets, e.g., google_sheet or obo_google_sheet"
+        )
+    if cache is not None and client is not None:
+        # the caller's cache is left as is, e.g., since it's shared
+        cache = copy.copy(cache)
+        cache.client = client
+    owned_client = cache is None and client is None
+    if owned_client:
+        client = SheetClient()
+    readers: dict[SheetKey, LazyReader] = {}
+    for sheet in sheets:
+        key = (sheet, 0) if isinstance(sheet, str) else sheet
+        readers[key] = reader_cls(key[0], gid=key[1], cache=cache, **(reader_kwargs or {}))
+
+    def _load(_reader) -> None:
+        if _reader.cache is not None:
+            _reader.prefetch()
+        else:
+            url = url_template.format(google_sheet=_reader.google_sheet, gid=_reader.gid)
+            content = client.get(url).body  # type: ignore
+            _reader.df = read_sheet(io.BytesIO(content), skiprows=_reader.skiprows)
+
+    errors: dict[SheetKey, Exception] = {}
+    try:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {executor.submit(_load, _reader): key for key, _reader in readers.items()}
+            for future in as_completed(futures):
+                key = futures[future]
+                try:
+                    future.result()
+                except Exception as e:
+                    logger.warning("failed to download %s (gid=%s): %s", *key, e)
+                    errors[key] = e
+    finally:
+        # a given client is the caller's to close, e.g., since it's shared
+        if owned_client:
+            client.close()  # type: ignore
+    return BatchResult(
+        readers={key: _reader for key, _reader in readers.items() if key not in errors},
+        errors=errors,
+    )
@@ -1,25 +1,57 @@
 """Pandas dataframe reader."""
 
-from typing import Union
+from __future__ import annotations
 
-import pandas as pd
+from pathlib import Path
+from typing import TYPE_CHECKING, Optional, Union
 
-from .base import Reader
-from ..constants import get_hoyt_google_sheets_df, hoyt_sort_key, safe
-from ..models import Author, Authorship, Institution
+from .base import LazyReader, Reader
+from ..constants import (
+    get_hoyt_file_df,
+    get_hoyt_google_sheets_df,
+    get_values,
+    remove_prefix,
+)
+from ..instrument import count, span
+from ..memo import memoize_authorship
+from ..models import Author, Authorship, Institution, InstitutionRegistry, construct_many
+
+if TYPE_CHECKING:
+    import numpy as np
+    import pandas as pd
+
+    from ..cache import SheetCache
+    from ..ordering import Sorter
+    from ..validate import ValidationReport
 
 __all__ = [
     "SheetReader",
     "GoogleSheetReader",
+    "SheetFileReader",
 ]
 
 AFFILIATION_KEYS = ["Affiliation", "Affiliation 2"]
+INSTITUTION_KEYS = [
+    ("Affiliation", "Affiliation Address", "Affiliation ROR/Wikidata"),
+    ("Affiliation 2", "Affiliation 2 Address", "Affiliation 2 ROR/Wikidata"),
+]
+ROR_PREFIX = "https://ror.org/"
+WIKIDATA_PREFIX = "https://www.wikidata.org/wiki/"
+WIKIDATA_INSTITUTION_PREFIX = "https://www.wikidata.org/wiki/Q10279363"
 
 
 class SheetReader(Reader):
     """Read from a pandas dataframe."""
 
-    def __init__(self, df: pd.DataFrame, *, sort_middle_authors: bool = True):
+    def __init__(
+        self,
+        df: pd.DataFrame,
+        *,
+        sort_middle_authors: bool = True,
+        sorter: Union[None, str, Sorter] = None,
+        registry: Optional[InstitutionRegistry] = None,
+        n_jobs: int = 1,
+    ):
         """Initialize the sheet reader.
 
         :param df:
@@ -30,78 +62,167 @@ class SheetReader(Reader):
             Should the middle authors (i.e., ones that don't have "Lead" or "Senior" in their
             role column) be automatically sorted by last name alphabetical order? Defaults
             to true, since middle authorship order isn't usually meaningful.
+        :param sorter: A strategy for ordering the authors when sorting, or the name of
+            one, e.g., ``collation``. Defaults to
+            :class:`authorship.ordering.NameSorter`. See :mod:`authorship.ordering`.
+        :param registry: A registry in which institutions are interned, e.g., to share
+            them between the sheets of many papers
+        :param n_jobs: The number of processes between which the construction of the
+            authors is sharded. Defaults to 1, which constructs them in this process.
+            See :func:`authorship.models.construct_many`.
         """
         self.df = df
         self.sort_middle_authors = sort_middle_authors
+        self.sorter = sorter
+        self.registry = registry
+        self.n_jobs = n_jobs
 
+    @memoize_authorship
     def get_authorship(self) -> Authorship:
-        """Get authors and institutions."""
+        """Get authors and institutions, memoized on the content of the dataframe."""
         df = self.df
-        column_to_idx = {column: i for i, column in enumerate(df.columns)}
-        rows = sorted(df.values, key=hoyt_sort_key) if self.sort_middle_authors else list(df.values)
-
-        institutions = {}
-        for row in rows:
-            for keys in [
-                ("Affiliation", "Affiliation Address", "Affiliation ROR/Wikidata"),
-                ("Affiliation 2", "Affiliation 2 Address", "Affiliation 2 ROR/Wikidata"),
-            ]:
-                name, address, uri = (safe(row[column_to_idx[key]]) for key in keys)
-                if name is None:
-                    continue
-                if pd.isna(uri):
-                    ror = None
-                    wikidata = None
-                elif uri.startswith("https://ror.org/"):
-                    ror = uri.removeprefix("https://ror.org/")
-                    wikidata = None
-                elif uri.startswith("https://www.wikidata.org/wiki/"):
-                    ror = None
-                    wikidata = uri.removeprefix("https://www.wikidata.org/wiki/Q10279363")
-                else:
-                    ror = None
-                    wikidata = None
-                institutions[name] = Institution(
-                    name=name,
-                    address=address,
-                    wikidata=wikidata,
-                    ror=ror,
-                )
-
-        authors = []
-        for row in rows:
-            author = Author(
-                first=safe(row[0]),
-                middle=safe(row[1]),
-                last=safe(row[2]),
-                role=safe(row[3]),
-                corresponding=row[3] == "Senior",
-                email=safe(row[4]),
-                orcid=safe(row[5]),
-                wikidata=row[6].removeprefix("https://www.wikidata.org/wiki/")
-                if pd.notna(row[6])
-                else None,
-                twitter=row[7].removeprefix("@") if pd.notna(row[7]) else None,
-                institutions=[
-                    institutions[row[column_to_idx[key]]]
-                    for key in ["Affiliation", "Affiliation 2"]
-                    if pd.notna(row[column_to_idx[key]])
-                ],
-                conflict=safe(row[14]),
+        count("rows", len(df))
+        with span("sort"):
+            sorter = self.get_sorter()
+            if sorter is not None:
+                df = df.iloc[sorter.get_order(df)]
+            column_to_idx = {column: i for i, column in enumerate(df.columns)}
+            values = get_values(df)
+
+        with span("institutions"):
+            institutions = get_institutions(values, column_to_idx, registry=self.registry)
+        count("institutions", len(institutions))
+        affiliations = zip(*(values[:, column_to_idx[key]] for key in AFFILIATION_KEYS))
+        with span("authors"):
+            authors = construct_many(
+                Author,
+                {
+                    "first": values[:, 0],
+                    "middle": values[:, 1],
+                    "last": values[:, 2],
+                    "role": values[:, 3],
+                    "email": values[:, 4],
+                    "orcid": values[:, 5],
+                    "wikidata": remove_prefix(values[:, 6], WIKIDATA_PREFIX),
+                    "twitter": remove_prefix(values[:, 7], "@"),
+                    "institutions": [
+                        [institutions[name] for name in names if name is not None]
+                        for names in affiliations
+                    ],
+                    "conflict": values[:, 14],
+                },
+                n_jobs=self.n_jobs,
             )
-            authors.append(author)
+        count("authors", len(authors))
         return Authorship(authors=authors, institutions=list(institutions.values()))
 
+    def get_sorter(self) -> Optional[Sorter]:
+        """Get the strategy for ordering the authors, if they're sorted."""
+        from ..ordering import NameSorter, Sorter
+
+        if not self.sort_middle_authors:
+            return None
+        if self.sorter is None:
+            return NameSorter()
+        if isinstance(self.sorter, Sorter):
+            return self.sorter
+        from ..ordering import sorter_resolver
+
+        return sorter_resolver.make(self.sorter)
+
+    @span("validate")
+    def validate(self) -> ValidationReport:
+        """Check all rows of the sheet at once, without constructing the authorship.
+
+        The rows in the report are the positions of the rows in the dataframe, before
+        sorting the middle authors.
+        """
+        import numpy as np
+
+        from ..validate import check_authors, get_issues, make_report
+
+        df = self.df
+        first, _, last, role, email, orcid = df.columns[:6]
+        issues = check_authors(
+            df, required=[first, last, email, orcid], orcid=orcid, email=email, role=role
+        )
+        unaffiliated = df[AFFILIATION_KEYS].isna().all(axis=1).to_numpy()
+        issues.extend(
+            get_issues(unaffiliated, np.arange(len(df)), AFFILIATION_KEYS[0], "missing_affiliation")
+        )
+        return make_report(issues, len(df), df.columns)
+
+
+def get_institutions(
+    values: np.ndarray,
+    column_to_idx: dict[str, int],
+    *,
+    registry: Optional[InstitutionRegistry] = None,
+) -> dict[str, Institution]:
+    """Get institutions from a Hoyt-style sheet, deduplicated by name.
+
+    :param values: The values from a Hoyt-style sheet, as returned by :func:`get_values`
+    :param column_to_idx: A mapping from column names to their positions
+    :param registry: A registry in which the institutions are interned
+    :returns: A dictionary from institution names to institutions, in order of first
+        appearance (going row by row, then affiliation by affiliation). If the same
+        institution name appears more than once, the last address/URI is used.
+    """
+    import numpy as np
+    import pandas as pd
+
+    # Interleave the affiliation columns so the flattened arrays follow the row-by-row order
+    names, addresses, uris = (
+        np.stack([values[:, column_to_idx[keys[i]]] for keys in INSTITUTION_KEYS], axis=1).ravel()
+        for i in range(3)
+    )
+    mask = pd.notna(names)
+    names, addresses, uris = names[mask], addresses[mask], uris[mask]
+
+    uri_series = pd.Series(uris, dtype=object)
+    is_ror = uri_series.str.startswith(ROR_PREFIX, na=False).to_numpy()
+    is_wikidata = ~is_ror & uri_series.str.startswith(WIKIDATA_PREFIX, na=False).to_numpy()
+    rors = np.where(is_ror, remove_prefix(uris, ROR_PREFIX), None)
+    wikidatas = np.where(is_wikidata, remove_prefix(uris, WIKIDATA_INSTITUTION_PREFIX), None)
+
+    last = ~pd.Index(names).duplicated(keep="last")
+    institutions: dict[str, Institution] = dict.fromkeys(pd.unique(names))  # type: ignore
+    columns = {
+        "name": names[last],
+        "address": addresses[last],
+        "ror": rors[last],
+        "wikidata": wikidatas[last],
+    }
+    if registry is None:
+        institutions.update(zip(names[last], construct_many(Institution, columns)))
+    else:
+        institutions.update(zip(names[last], registry.intern_many(columns)))
+    return institutions
 
-class GoogleSheetReader(SheetReader):
+
+class GoogleSheetReader(LazyReader, SheetReader):
     """Read from google sheets.
 
     An example sheet that has the right template can be found at:
     https://docs.google.com/spreadsheets/d/1Fo1YH3ZzOVrQ4wzKnBm6sPha5hZG66-u-uSMDGUvguI
+
+    The sheet is only downloaded on the first call to :meth:`get_authorship`
+    (or :meth:`prefetch`).
     """
 
+    #: The number of rows skipped at the top of the sheet, which contain instructions
+    skiprows = 1
+
     def __init__(
-        self, google_sheet: str, *, gid: Union[str, int] = 0, sort_middle_authors: bool = True
+        self,
+        google_sheet: str,
+        *,
+        gid: Union[str, int] = 0,
+        sort_middle_authors: bool = True,
+        sorter: Union[None, str, Sorter] = None,
+        cache: Optional["SheetCache"] = None,
+        registry: Optional[InstitutionRegistry] = None,
+        n_jobs: int = 1,
     ):
         """Initialize the sheet reader.
 
@@ -111,6 +232,72 @@ class GoogleSheetReader(SheetReader):
             Should the middle authors (i.e., ones that don't have "Lead" or "Senior" in their
             role column) be automatically sorted by last name alphabetical order? Defaults
             to true, since middle authorship order isn't usually meaningful.
+        :param sorter: A strategy for ordering the authors when sorting, or the name of
+            one, e.g., ``collation``. Defaults to
+            :class:`authorship.ordering.NameSorter`. See :mod:`authorship.ordering`.
+        :param cache: A cache for the sheet's export. If none is given, downloads it directly.
+        :param registry: A registry in which institutions are interned
+        :param n_jobs: The number of processes between which the construction of the
+            authors is sharded
         """
-        df = get_hoyt_google_sheets_df(google_sheet, gid)
-        super().__init__(df, sort_middle_authors=sort_middle_authors)
+        self.google_sheet = google_sheet
+        self.gid = gid
+        self.cache = cache
+        self.sort_middle_authors = sort_middle_authors
+        self.sorter = sorter
+        self.registry = registry
+        self.n_jobs = n_jobs
+
+    def load_df(self) -> pd.DataFrame:
+        """Download the sheet."""
+        return get_hoyt_google_sheets_df(self.google_sheet, self.gid, cache=self.cache)
+
+
+class SheetFileReader(LazyReader, SheetReader):
+    """Read from a local TSV, CSV, or Excel export of a sheet.
+
+    Only the columns used by :class:`SheetReader` are parsed, so extra columns
+    (e.g., for notes) in large exports don't cost anything. The file is only read
+    on the first call to :meth:`get_authorship` (or :meth:`prefetch`).
+    """
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        *,
+        skiprows=1,
+        sep: Optional[str] = None,
+        sort_middle_authors: bool = True,
+        sorter: Union[None, str, Sorter] = None,
+        registry: Optional[InstitutionRegistry] = None,
+        n_jobs: int = 1,
+    ):
+        """Initialize the sheet reader.
+
+        :param path: The path to a TSV, CSV, or Excel file
+        :param skiprows: Should rows be skipped? Defaults to 1, which skips the
+            instructions at the top of the template.
+        :param sep: The separator for text files. Defaults to a comma for files ending
+            in ``.csv`` and a tab otherwise.
+        :param sort_middle_authors:
+            Should the middle authors (i.e., ones that don't have "Lead" or "Senior" in their
+            role column) be automatically sorted by last name alphabetical order? Defaults
+            to true, since middle authorship order isn't usually meaningful.
+        :param sorter: A strategy for ordering the authors when sorting, or the name of
+            one, e.g., ``collation``. Defaults to
+            :class:`authorship.ordering.NameSorter`. See :mod:`authorship.ordering`.
+        :param registry: A registry in which institutions are interned
+        :param n_jobs: The number of processes between which the construction of the
+            authors is sharded
+        """
+        self.path = path
+        self.skiprows = skiprows
+        self.sep = sep
+        self.sort_middle_authors = sort_middle_authors
+        self.sorter = sorter
+        self.registry = registry
+        self.n_jobs = n_jobs
+
+    def load_df(self) -> pd.DataFrame:
+        """Read the file."""
+        return get_hoyt_file_df(self.path, skiprows=self.skiprows, sep=self.sep)
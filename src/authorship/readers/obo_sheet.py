@@ -1,17 +1,28 @@
 """Pandas dataframe reader."""
 
+from __future__ import annotations
+
 import logging
-from typing import Union
+from pathlib import Path
+from typing import TYPE_CHECKING, Optional, Union
+
+from .base import LazyReader, Reader
+from ..constants import get_obo_file_df, get_obo_google_sheets_df, get_values, remove_prefix
+from ..instrument import count, span
+from ..memo import memoize_authorship
+from ..models import Author, Authorship, Institution, InstitutionRegistry, construct_many
 
-import pandas as pd
+if TYPE_CHECKING:
+    import pandas as pd
 
-from .base import Reader
-from ..constants import get_obo_google_sheets_df, safe
-from ..models import Author, Authorship, Institution
+    from ..cache import SheetCache
+    from ..validate import ValidationReport
 
 __all__ = [
     "OboSheetReader",
     "OboGoogleSheetReader",
+    "OboSheetFileReader",
+    "MissingAffiliationError",
 ]
 
 logger = logging.getLogger(__name__)
@@ -29,12 +40,29 @@ COLUMNS = [
     "Twitter",
     "Organization + location (will separate later)",
 ]
+ORGANIZATION_KEY = "Organization + location (will separate later)"
+AUTHOR_KEYS = [
+    "First name",
+    "Middle (optional)",
+    "Last name",
+    "Email",
+    "ORCID",
+    "Wikidata",
+    "Twitter",
+]
+WIKIDATA_PREFIX = "https://www.wikidata.org/wiki/"
 
 
 class OboSheetReader(Reader):
     """Read from a pandas dataframe."""
 
-    def __init__(self, df: pd.DataFrame):
+    def __init__(
+        self,
+        df: pd.DataFrame,
+        *,
+        registry: Optional[InstitutionRegistry] = None,
+        n_jobs: int = 1,
+    ):
         """Initialize the sheet reader.
 
         :param df:
@@ -45,30 +73,124 @@ class OboSheetReader(Reader):
             - ODK paper https://docs.google.com/spreadsheets/d/1JMo1ZyytnJGXr7biYqxMzV7DIAzlfyum5jcrtetG8lI
             - CL paper https://docs.google.com/spreadsheets/d/1G9b6NOyUkMJUI2ZiCWoFSDdoKf1KWdfTwlDoTJ4zntM
               (broken since many authors missing email/orcid)
+        :param registry: A registry in which institutions are interned, e.g., to share
+            them between the sheets of many papers
+        :param n_jobs: The number of processes between which the construction of the
+            authors is sharded. Defaults to 1, which constructs them in this process.
+            See :func:`authorship.models.construct_many`.
         """
         self.df = df
+        self.registry = registry
+        self.n_jobs = n_jobs
 
+    @memoize_authorship
     def get_authorship(self) -> Authorship:
-        """Get authors and institutions."""
+        """Get authors and institutions, memoized on the content of the dataframe."""
         df = self.df
-        org_sheet = df[df.columns[-2:]]
-        org_sheet.columns = ["code", "institution"]
-        code_to_institution: dict[int, Institution] = {
-            int(code): get_org(text) for code, text in org_sheet[org_sheet["code"].notna()].values
-        }
-
-        author_sheet = df[df.columns[:-2]]
-        author_sheet = author_sheet[author_sheet[author_sheet.columns[0]].notna()]
-        authors = [get_author(row, code_to_institution) for _, row in author_sheet.iterrows()]
+        count("rows", len(df))
+        with span("institutions"):
+            org_sheet = df[df.columns[-2:]]
+            org_sheet.columns = ["code", "institution"]
+            code_to_institution: dict[int, Institution] = {
+                int(code): get_org(text, registry=self.registry)
+                for code, text in org_sheet[org_sheet["code"].notna()].values
+            }
+        count("institutions", len(code_to_institution))
+
+        with span("affiliations"):
+            author_sheet = df[df.columns[:-2]]
+            author_sheet = author_sheet[author_sheet[author_sheet.columns[0]].notna()]
+            author_sheet = author_sheet.reset_index(drop=True)
+            affiliations = get_affiliations(author_sheet, code_to_institution)
+
+        with span("authors"):
+            values = get_values(author_sheet[AUTHOR_KEYS])
+            authors = construct_many(
+                Author,
+                {
+                    "first": values[:, 0],
+                    "middle": values[:, 1],
+                    "last": values[:, 2],
+                    "email": values[:, 3],
+                    "orcid": values[:, 4],
+                    "wikidata": remove_prefix(values[:, 5], WIKIDATA_PREFIX),
+                    "twitter": remove_prefix(values[:, 6], "@"),
+                    "institutions": affiliations,
+                },
+                n_jobs=self.n_jobs,
+            )
+        count("authors", len(authors))
         return Authorship(authors=authors, institutions=list(code_to_institution.values()))
 
+    @span("validate")
+    def validate(self) -> ValidationReport:
+        """Check all rows of the sheet at once, without constructing the authorship.
+
+        Besides the authors' values, this checks that their organization codes are
+        numbers that appear in the organization table.
+        """
+        import numpy as np
+        import pandas as pd
+
+        from ..validate import check_authors, get_issues, make_report
 
-class OboGoogleSheetReader(OboSheetReader):
+        df = self.df
+        codes = pd.to_numeric(df[df.columns[-2]], errors="coerce").dropna()
+        is_author = df[df.columns[0]].notna().to_numpy()
+        rows = np.flatnonzero(is_author)
+        author_sheet = df[df.columns[:-2]][is_author].reset_index(drop=True)
+        issues = check_authors(
+            author_sheet,
+            rows=rows,
+            required=["First name", "Last name", "Email", "ORCID"],
+            orcid="ORCID",
+            email="Email",
+        )
+
+        # one entry per code, indexed by the position of the author
+        author_codes = (
+            author_sheet[ORGANIZATION_KEY].astype("string").str.split(",").explode().str.strip()
+        )
+        author_codes = author_codes[author_codes.notna() & (author_codes != "")]
+        numbers = pd.to_numeric(author_codes, errors="coerce")
+        known = numbers.isin(codes.to_numpy())
+        code_rows = rows[author_codes.index.to_numpy()]
+        issues.extend(
+            get_issues(
+                numbers.isna().to_numpy(),
+                code_rows,
+                ORGANIZATION_KEY,
+                "invalid_affiliation_code",
+                author_codes,
+            )
+        )
+        issues.extend(
+            get_issues(
+                (numbers.notna() & ~known).to_numpy(),
+                code_rows,
+                ORGANIZATION_KEY,
+                "unknown_affiliation_code",
+                author_codes,
+            )
+        )
+        affiliated = (
+            known.groupby(level=0).any().reindex(range(len(author_sheet)), fill_value=False)
+        )
+        issues.extend(
+            get_issues(~affiliated.to_numpy(), rows, ORGANIZATION_KEY, "missing_affiliation")
+        )
+        return make_report(issues, len(rows), df.columns)
+
+
+class OboGoogleSheetReader(LazyReader, OboSheetReader):
     """Read from google sheets.
 
     An example sheet that has the right template can be found at:
     https://docs.google.com/spreadsheets/d/1NfhibWHOKgV2glmgRdKMzHEzTCw2_dUq_t0Zq64cgeQ
     using ``skiprows=1``
+
+    The sheet is only downloaded on the first call to :meth:`get_authorship`
+    (or :meth:`prefetch`).
     """
 
     def __init__(
@@ -77,50 +199,133 @@ class OboGoogleSheetReader(OboSheetReader):
         *,
         gid: Union[str, int] = 0,
         skiprows=None,
+        cache: Optional["SheetCache"] = None,
+        registry: Optional[InstitutionRegistry] = None,
+        n_jobs: int = 1,
     ):
         """Initialize the sheet reader.
 
         :param google_sheet: The identifier of the google sheet
         :param gid: The sheet identifier (in case there are more than one)
         :param skiprows: Should rows be skipped?
+        :param cache: A cache for the sheet's export. If none is given, downloads it directly.
+        :param registry: A registry in which institutions are interned
+        :param n_jobs: The number of processes between which the construction of the
+            authors is sharded
         """
-        df = get_obo_google_sheets_df(google_sheet, gid, skiprows=skiprows)
-        super().__init__(df)
+        self.google_sheet = google_sheet
+        self.gid = gid
+        self.skiprows = skiprows
+        self.cache = cache
+        self.registry = registry
+        self.n_jobs = n_jobs
 
+    def load_df(self) -> pd.DataFrame:
+        """Download the sheet."""
+        return get_obo_google_sheets_df(
+            self.google_sheet, self.gid, skiprows=self.skiprows, cache=self.cache
+        )
 
-def get_org(text: str) -> Institution:
-    """Get an institution."""
-    return Institution(
-        name=text,  # todo parse out address
-    )
 
+class OboSheetFileReader(LazyReader, OboSheetReader):
+    """Read from a local TSV, CSV, or Excel export of an OBO community-style sheet.
 
-def get_author(row, code_to_institution: dict[int, Institution]) -> Author:
-    """Get an author from a row."""
-    first = row["First name"]
-    last = row["Last name"]
-    codes_str = row["Organization + location (will separate later)"]
-    if pd.isna(codes_str):
-        raise ValueError(f"no affiliations written for {first} {last}")
-    codes = [int(key.strip()) for key in codes_str.split(",")]
-    institutions = []
-    for code in codes:
-        if code not in code_to_institution:
-            logger.warning("missing organization code %d for %s%s", code, first, last)
-        else:
-            institutions.append(code_to_institution[code])
-    if not institutions:
-        raise ValueError(f"no affiliation for {first} {last}")
-
-    return Author(
-        first=row["First name"],
-        middle=safe(row["Middle (optional)"]),
-        last=row["Last name"],
-        email=safe(row["Email"]),
-        orcid=row["ORCID"],
-        wikidata=row["Wikidata"].removeprefix("https://www.wikidata.org/wiki/")
-        if pd.notna(row["Wikidata"])
-        else None,
-        twitter=row["Twitter"].removeprefix("@") if pd.notna(row["Twitter"]) else None,
-        institutions=institutions,
+    Only the author columns and the organization table (i.e., the last two columns)
+    are parsed. The file is only read on the first call to :meth:`get_authorship`
+    (or :meth:`prefetch`).
+    """
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        *,
+        skiprows=None,
+        sep: Optional[str] = None,
+        registry: Optional[InstitutionRegistry] = None,
+        n_jobs: int = 1,
+    ):
+        """Initialize the sheet reader.
+
+        :param path: The path to a TSV, CSV, or Excel file
+        :param skiprows: Should rows be skipped?
+        :param sep: The separator for text files. Defaults to a comma for files ending
+            in ``.csv`` and a tab otherwise.
+        :param registry: A registry in which institutions are interned
+        :param n_jobs: The number of processes between which the construction of the
+            authors is sharded
+        """
+        self.path = path
+        self.skiprows = skiprows
+        self.sep = sep
+        self.registry = registry
+        self.n_jobs = n_jobs
+
+    def load_df(self) -> pd.DataFrame:
+        """Read the file."""
+        return get_obo_file_df(self.path, skiprows=self.skiprows, sep=self.sep)
+
+
+def get_org(text: str, *, registry: Optional[InstitutionRegistry] = None) -> Institution:
+    """Get an institution, interned in the registry if one is given."""
+    institution = Institution(
+        name=text,  # the address can be filled in with authorship.enrich
     )
+    if registry is not None:
+        return registry.intern(institution)
+    return institution
+
+
+class MissingAffiliationError(ValueError):
+    """Raised when some authors don't have any resolvable affiliations."""
+
+    def __init__(self, unaffiliated: list[str], missing_codes: dict[int, tuple[str, list[int]]]):
+        """Instantiate the error.
+
+        :param unaffiliated: The names of authors without any resolvable affiliations
+        :param missing_codes: A dictionary from the positions of authors in the author
+            part of the sheet to pairs of their name and the organization codes that
+            don't appear in the organization table. Positions are used since several
+            authors can have the same name.
+        """
+        self.unaffiliated = unaffiliated
+        self.missing_codes = missing_codes
+        super().__init__(
+            f"no affiliation for {len(unaffiliated)} authors: {', '.join(unaffiliated)}"
+        )
+
+
+def get_affiliations(
+    author_sheet: pd.DataFrame, code_to_institution: dict[int, Institution]
+) -> list[list[Institution]]:
+    """Resolve the organization codes for all authors at once.
+
+    :param author_sheet: The author part of an OBO-style sheet, with a positional index
+    :param code_to_institution: A dictionary from organization codes to institutions
+    :returns: A list with the institutions for each author, aligned with the rows of the sheet
+    :raises MissingAffiliationError: If any authors have no resolvable affiliations. All
+        such authors are reported together rather than stopping at the first one.
+    """
+    names = author_sheet["First name"] + " " + author_sheet["Last name"]
+    codes = author_sheet[ORGANIZATION_KEY].dropna().str.split(",").explode().str.strip().astype(int)
+    known = codes.isin(code_to_institution.keys())
+
+    missing = codes[~known]
+    missing_codes = {
+        idx: (names[idx], group.tolist()) for idx, group in missing.groupby(level=0, sort=False)
+    }
+    if missing_codes:
+        logger.warning(
+            "missing organization codes for %d authors: %s",
+            len(missing_codes),
+            "; ".join(
+                f"{name} ({', '.join(map(str, c))}) in row {idx}"
+                for idx, (name, c) in missing_codes.items()
+            ),
+        )
+
+    resolved = codes[known].map(code_to_institution).groupby(level=0, sort=False).agg(list)
+    rv = [resolved.get(idx, []) for idx in range(len(author_sheet))]
+    unaffiliated = [names[idx] for idx, institutions in enumerate(rv) if not institutions]
+    if unaffiliated:
+        raise MissingAffiliationError(unaffiliated, missing_codes)
+    return rv
@@ -0,0 +1,252 @@
+"""A long-running local server that renders author lists from warm caches.
+
+Starting a new process for each rendering pays for importing the package and
+reading the sheet every time. The server instead keeps readers, their parsed
+authorships, and the rendered output of writers in memory, so repeated requests
+are served from memory. Run it with ``authorship serve``, then use:
+
+``GET /render?sheet=<source>&writer=<writer>``
+    Render the authorship from a source (e.g., the identifier of a google sheet or
+    the path to a local export) with a writer (defaults to ``text``). The reader can
+    be given with ``reader=<reader>``, otherwise it's guessed from the source with
+    :func:`authorship.manifest.guess_reader`. All other parameters (e.g., ``gid=1``)
+    are passed to the reader. Local exports are only read from inside the root
+    directory given with ``authorship serve --root``, relative to which their paths
+    are resolved, so clients can't read arbitrary files.
+``POST /invalidate?sheet=<source>``
+    Forget the data for a source, so it's read again on the next request. Without
+    a ``sheet`` parameter, everything is forgotten.
+``GET /health``
+    Check the server is running.
+"""
+
+import json
+import logging
+import socketserver
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Optional, Union
+from urllib.parse import parse_qsl, urlsplit
+
+from .memo import LRUCache
+from .readers import GoogleSheetReader, LazyReader, OboGoogleSheetReader, Reader
+
+__all__ = [
+    "RenderService",
+    "make_server",
+]
+
+logger = logging.getLogger(__name__)
+
+
+class RenderService:
+    """Keeps readers warm between requests and renders with them."""
+
+    def __init__(
+        self,
+        *,
+        cache_directory: Union[None, str, Path] = None,
+        root_directory: Union[None, str, Path] = None,
+        max_readers: int = 64,
+    ):
+        """Initialize the service.
+
+        :param cache_directory: If given, google sheets are cached in this directory
+            with a :class:`authorship.cache.SheetCache`, so they're revalidated with
+            cheap conditional requests after being invalidated
+        :param root_directory: If given, local exports can be read from inside this
+            directory, relative to which their paths are resolved. Otherwise, only
+            google sheets can be read.
+        :param max_readers: The maximum number of readers kept in memory. The least
+            recently used ones are forgotten first.
+        """
+        self.cache_directory = cache_directory
+        self.root_directory = (
+            Path(root_directory).expanduser().resolve() if root_directory is not None else None
+        )
+        self._readers: LRUCache[tuple[Optional[str], str, str], Reader] = LRUCache(
+            max_readers, name="server_readers"
+        )
+
+    def get_reader(
+        self,
+        source: str,
+        reader: Optional[str] = None,
+        reader_kwargs: Optional[dict[str, Any]] = None,
+    ) -> Reader:
+        """Get the reader for a source, reusing it if it was already made.
+
+        :param source: The first argument to the reader, e.g., the identifier of a google sheet
+        :param reader: The name of the reader. If none is given, it's guessed from the source.
+        :param reader_kwargs: Keyword arguments passed to the reader
+        :returns: A reader, which keeps its data after the first use
+        :raises PermissionError: If the source is a local path outside of the root
+            directory, or if there's no root directory
+        """
+        from .manifest import make_reader
+
+        key = (reader, source, json.dumps(reader_kwargs or {}, sort_keys=True))
+        return self._readers.get_or_set(
+            key,
+            lambda: make_reader(
+                self._get_source(source, reader),
+                reader,
+                reader_kwargs,
+                cache_directory=self.cache_directory,
+            ),
+        )
+
+    def _get_source(self, source: str, reader: Optional[str]) -> str:
+        """Resolve the path of a local source, checking it's inside the root directory."""
+        from .manifest import guess_reader
+        from .readers import reader_resolver
+
+        path = self.root_directory.joinpath(source) if self.root_directory is not None else None
+        reader_cls = reader_resolver.lookup(
+            reader if reader is not None else guess_reader(str(path or source))
+        )
+        if issubclass(reader_cls, (GoogleSheetReader, OboGoogleSheetReader)):
+            return source
+        if path is None:
+            raise PermissionError("local files can't be read since the server has no root")
+        path = path.resolve()
+        if not path.is_relative_to(self.root_directory):
+            raise PermissionError(f"{source} is outside of the server's root")
+        return str(path)
+
+    def render(
+        self,
+        source: str,
+        writer: str = "text",
+        reader: Optional[str] = None,
+        reader_kwargs: Optional[dict[str, Any]] = None,
+    ) -> str:
+        """Render the authorship from a source with a writer.
+
+        :param source: The first argument to the reader, e.g., the identifier of a google sheet
+        :param writer: The name of the writer
+        :param reader: The name of the reader. If none is given, it's guessed from the source.
+        :param reader_kwargs: Keyword arguments passed to the reader
+        :returns: The rendered authorship, which is memoized by the writer
+        """
+        from .writers import writer_resolver
+
+        _writer = writer_resolver.make(writer)
+        return _writer.to_str(self.get_reader(source, reader, reader_kwargs))
+
+    def invalidate(self, source: Optional[str] = None) -> int:
+        """Forget the data for a source, or for all sources if none is given.
+
+        :param source: The source to invalidate
+        :returns: The number of readers that were invalidated
+        """
+        keys = [key for key in self._readers.keys() if source is None or key[1] == source]
+        readers = [reader for reader in map(self._readers.pop, keys) if reader is not None]
+        for reader in readers:
+            if isinstance(reader, LazyReader):
+                reader.invalidate()
+        return len(readers)
+
+
+class _Handler(BaseHTTPRequestHandler):
+    server: "_RenderServer"
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):  # noqa:N802
+        """Render an authorship or check the health of the server."""
+        path, params = self._parse()
+        if path == "/health":
+            self._send(HTTPStatus.OK, "ok")
+        elif path == "/render":
+            source = params.pop("sheet", None)
+            if source is None:
+                self._send(HTTPStatus.BAD_REQUEST, "missing the sheet parameter")
+                return
+            writer = params.pop("writer", "text")
+            reader = params.pop("reader", None)
+            try:
+                text = self.server.service.render(
+                    source, writer, reader, {key: _parse_value(v) for key, v in params.items()}
+                )
+            except PermissionError as e:
+                self._send(HTTPStatus.FORBIDDEN, f"{type(e).__name__}: {e}")
+            except (KeyError, ValueError, TypeError) as e:
+                self._send(HTTPStatus.BAD_REQUEST, f"{type(e).__name__}: {e}")
+            except Exception as e:
+                logger.exception("failed to render %s", source)
+                self._send(HTTPStatus.INTERNAL_SERVER_ERROR, f"{type(e).__name__}: {e}")
+            else:
+                self._send(HTTPStatus.OK, text)
+        else:
+            self._send(HTTPStatus.NOT_FOUND, f"unknown path: {path}")
+
+    def do_POST(self):  # noqa:N802
+        """Invalidate the data for a source, or for all sources."""
+        path, params = self._parse()
+        if path == "/invalidate":
+            n = self.server.service.invalidate(params.get("sheet"))
+            self._send(HTTPStatus.OK, f"invalidated {n} readers")
+        else:
+            self._send(HTTPStatus.NOT_FOUND, f"unknown path: {path}")
+
+    def _parse(self) -> tuple[str, dict[str, str]]:
+        url = urlsplit(self.path)
+        return url.path.rstrip("/") or "/", dict(parse_qsl(url.query))
+
+    def _send(self, status: HTTPStatus, text: str) -> None:
+        content = text.encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "text/plain; charset=utf-8")
+        self.send_header("Content-Length", str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+    def address_string(self) -> str:
+        # clients connecting through a unix socket don't have an address
+        return self.client_address[0] if self.client_address else "unix"
+
+    def log_message(self, format, *args):  # noqa:A002
+        """Log requests with :mod:`logging` instead of writing to stderr."""
+        logger.debug("%s - %s", self.address_string(), format % args)
+
+
+def _parse_value(value: str) -> Any:
+    """Parse a query parameter value, e.g., so ``gid=1`` gives an integer."""
+    import yaml
+
+    return yaml.safe_load(value)
+
+
+class _RenderServer(ThreadingHTTPServer):
+    daemon_threads = True
+    service: RenderService
+
+
+class _UnixRenderServer(socketserver.ThreadingUnixStreamServer):
+    daemon_threads = True
+    service: RenderService
+
+
+def make_server(
+    service: Optional[RenderService] = None,
+    *,
+    host: str = "127.0.0.1",
+    port: int = 8000,
+    socket: Union[None, str, Path] = None,
+) -> socketserver.BaseServer:
+    """Make a server for a render service.
+
+    :param service: The render service. Defaults to one without a cache directory.
+    :param host: The host to bind to. Defaults to only accepting local connections.
+    :param port: The port to bind to. Use 0 to pick a free port.
+    :param socket: If given, binds to a unix socket at this path instead of a host and port
+    :returns: A server, on which :meth:`socketserver.BaseServer.serve_forever` can be called
+    """
+    server: Union[_RenderServer, _UnixRenderServer]
+    if socket is not None:
+        server = _UnixRenderServer(str(socket), _Handler)
+    else:
+        server = _RenderServer((host, port), _Handler)
+    server.service = RenderService() if service is None else service
+    return server
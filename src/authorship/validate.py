@@ -0,0 +1,274 @@
+"""Check a whole sheet for problems at once, without constructing models.
+
+Reading a sheet stops at the first problem, e.g., a missing affiliation or a
+value that doesn't validate, so fixing a large sheet can take many attempts.
+:meth:`authorship.readers.Reader.validate` instead checks all rows in one
+vectorized pass and reports every problem, with its row and column:
+
+.. code-block:: python
+
+    from authorship.readers import GoogleSheetReader
+
+    report = GoogleSheetReader("1Fo1YH3ZzOVrQ4wzKnBm6sPha5hZG66-u-uSMDGUvguI").validate()
+    print(report.to_str())
+
+The checks are for missing required values, ORCID checksums, email syntax,
+duplicate ORCIDs and emails, unknown roles, and missing or unknown affiliations.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Iterable, Literal, Optional
+
+from pydantic import BaseModel, Field
+
+from .constants import ROLE
+from .instrument import count, span
+
+if TYPE_CHECKING:
+    import numpy as np
+    import pandas as pd
+
+    from .models import Authorship
+
+__all__ = [
+    "Issue",
+    "ValidationReport",
+    "check_authors",
+    "get_issues",
+    "make_report",
+    "is_valid_orcid",
+    "is_valid_email",
+    "validate_authorship",
+]
+
+IssueKind = Literal[
+    "missing",
+    "invalid_orcid",
+    "invalid_email",
+    "duplicate",
+    "unknown_role",
+    "missing_affiliation",
+    "invalid_affiliation_code",
+    "unknown_affiliation_code",
+]
+
+#: A permissive pattern for emails, which only catches obvious mistakes like missing
+#: an ``@`` or a domain, or having spaces
+EMAIL_PATTERN = r"[^@\s]+@[^@\s]+\.[^@\s]+"
+ORCID_PATTERN = r"\d{4}-\d{4}-\d{4}-\d{3}[\dX]"
+
+
+class Issue(BaseModel):
+    """A problem with a value in a sheet."""
+
+    #: The position of the row in the sheet's dataframe, starting from zero. For
+    #: authorships that aren't read from a sheet, this is the position of the author.
+    row: int
+    #: The name of the column
+    column: str
+    issue: IssueKind
+    #: The value with the problem, if there is one
+    value: Optional[str] = None
+    #: More details, e.g., the other rows with the same value for duplicates
+    detail: Optional[str] = None
+
+
+class ValidationReport(BaseModel):
+    """All the problems found in a sheet."""
+
+    #: The problems, in order of their row and then of their column
+    issues: list[Issue] = Field(default_factory=list)
+    #: The number of rows that were checked
+    n_rows: int = 0
+
+    def is_valid(self) -> bool:
+        """Check that there are no problems."""
+        return not self.issues
+
+    def iter_lines(self) -> Iterable[str]:
+        """Iterate over the lines of a report of the problems, one per problem."""
+        for issue in self.issues:
+            line = f"row {issue.row + 1}, {issue.column}: {issue.issue.replace('_', ' ')}"
+            if issue.value is not None:
+                line += f" {issue.value!r}"
+            if issue.detail:
+                line += f" ({issue.detail})"
+            yield line
+
+    def to_str(self) -> str:
+        """Make a report of the problems."""
+        if not self.issues:
+            return f"no problems in {self.n_rows} rows"
+        rows = len({issue.row for issue in self.issues})
+        return "\n".join(
+            [*self.iter_lines(), f"{len(self.issues)} problems in {rows} of {self.n_rows} rows"]
+        )
+
+
+def is_valid_orcid(values: pd.Series) -> np.ndarray:
+    """Check the format and ISO 7064 MOD 11-2 checksum of ORCIDs, all at once.
+
+    :param values: ORCIDs, like ``0000-0002-1825-0097``
+    :returns: A boolean array that is false for missing and invalid ORCIDs
+    """
+    import numpy as np
+
+    strings = values.astype("string")
+    rv = strings.str.fullmatch(ORCID_PATTERN).fillna(False).to_numpy(dtype=bool)
+    if not rv.any():
+        return rv
+    # each well-formed ORCID is 16 ASCII characters without the dashes
+    characters = np.frombuffer(
+        "".join(strings[rv].str.replace("-", "", regex=False)).encode("ascii"), dtype=np.uint8
+    ).reshape(-1, 16)
+    digits = characters[:, :15].astype(np.int64) - ord("0")
+    total = np.zeros(len(digits), dtype=np.int64)
+    for i in range(15):
+        total = (total + digits[:, i]) * 2
+    check = (12 - total % 11) % 11
+    expected = np.where(check == 10, ord("X"), check + ord("0"))
+    rv[rv] = characters[:, 15] == expected
+    return rv
+
+
+def is_valid_email(values: pd.Series) -> np.ndarray:
+    """Check the syntax of emails, all at once.
+
+    :param values: Emails
+    :returns: A boolean array that is false for missing and invalid emails
+    """
+    return values.astype("string").str.fullmatch(EMAIL_PATTERN).fillna(False).to_numpy(dtype=bool)
+
+
+def get_issues(
+    mask: np.ndarray,
+    rows: np.ndarray,
+    column: str,
+    issue: IssueKind,
+    values: Optional[pd.Series] = None,
+) -> list[Issue]:
+    """Make an issue for each row where the mask is true.
+
+    :param mask: A boolean array, aligned with the rows
+    :param rows: The row of each element of the mask in the sheet
+    :param column: The name of the column
+    :param issue: The kind of problem
+    :param values: The values, aligned with the mask, to include in the issues
+    :returns: An issue for each true element of the mask
+    """
+    import numpy as np
+
+    positions = np.flatnonzero(mask)
+    count(f"issues:{issue}", len(positions))
+    return [
+        Issue(
+            row=int(rows[position]),
+            column=column,
+            issue=issue,
+            value=None if values is None else str(values.iloc[position]),
+        )
+        for position in positions
+    ]
+
+
+def _duplicates(values: pd.Series, rows: np.ndarray, column: str) -> list[Issue]:
+    """Make an issue for each row whose (case-insensitive) value appears more than once."""
+    import numpy as np
+
+    keys = values.astype("string").str.strip().str.casefold()
+    mask = (keys.duplicated(keep=False) & keys.notna()).to_numpy(dtype=bool)
+    rv = []
+    groups = keys[mask].groupby(keys[mask], sort=False).indices
+    positions = np.flatnonzero(mask)
+    for group in groups.values():
+        group_rows = rows[positions[group]]
+        for position, row in zip(positions[group], group_rows):
+            rv.append(
+                Issue(
+                    row=int(row),
+                    column=column,
+                    issue="duplicate",
+                    value=str(values.iloc[position]),
+                    detail="also in row " + ", ".join(str(r + 1) for r in group_rows if r != row),
+                )
+            )
+    count("issues:duplicate", len(rv))
+    return rv
+
+
+def check_authors(
+    df: pd.DataFrame,
+    *,
+    rows: Optional[np.ndarray] = None,
+    required: Iterable[str] = (),
+    orcid: Optional[str] = None,
+    email: Optional[str] = None,
+    role: Optional[str] = None,
+) -> list[Issue]:
+    """Check the columns of a dataframe of authors.
+
+    :param df: A dataframe with a row per author
+    :param rows: The row of each author in the sheet. Defaults to their positions.
+    :param required: The names of columns that can't have missing values
+    :param orcid: The name of the ORCID column, which is checked for valid, unique ORCIDs
+    :param email: The name of the email column, which is checked for valid, unique emails
+    :param role: The name of the role column, which is checked for known roles
+    :returns: The problems, in no particular order
+    """
+    import numpy as np
+
+    if rows is None:
+        rows = np.arange(len(df))
+    rv = []
+    for column in required:
+        rv.extend(get_issues(df[column].isna().to_numpy(), rows, column, "missing"))
+    if orcid is not None:
+        values = df[orcid]
+        invalid = ~is_valid_orcid(values) & values.notna().to_numpy()
+        rv.extend(get_issues(invalid, rows, orcid, "invalid_orcid", values))
+        rv.extend(_duplicates(values, rows, orcid))
+    if email is not None:
+        values = df[email]
+        invalid = ~is_valid_email(values) & values.notna().to_numpy()
+        rv.extend(get_issues(invalid, rows, email, "invalid_email", values))
+        rv.extend(_duplicates(values, rows, email))
+    if role is not None:
+        values = df[role]
+        unknown = (values.notna() & ~values.isin(list(ROLE))).to_numpy()
+        rv.extend(get_issues(unknown, rows, role, "unknown_role", values))
+    return rv
+
+
+def make_report(issues: list[Issue], n_rows: int, columns: Iterable[str]) -> ValidationReport:
+    """Sort issues by their row and then by the order of their column."""
+    order = {column: i for i, column in enumerate(columns)}
+    issues.sort(key=lambda issue: (issue.row, order.get(issue.column, len(order))))
+    return ValidationReport(issues=issues, n_rows=n_rows)
+
+
+@span("validate")
+def validate_authorship(authorship: Authorship) -> ValidationReport:
+    """Check the authors of an authorship that was already constructed.
+
+    The rows in the report are the positions of the authors.
+    """
+    import numpy as np
+    import pandas as pd
+
+    df = pd.DataFrame(
+        {
+            "orcid": [author.orcid or None for author in authorship.authors],
+            "email": [author.email or None for author in authorship.authors],
+            "role": [author.role for author in authorship.authors],
+        },
+        dtype=object,
+    )
+    issues = check_authors(
+        df, required=["orcid", "email"], orcid="orcid", email="email", role="role"
+    )
+    unaffiliated = np.array([not author.institutions for author in authorship.authors], dtype=bool)
+    issues.extend(
+        get_issues(unaffiliated, np.arange(len(df)), "institutions", "missing_affiliation")
+    )
+    return make_report(issues, len(df), [*df.columns, "institutions"])
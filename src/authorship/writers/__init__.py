@@ -1,8 +1,10 @@
 """Writers."""
 
-from class_resolver import ClassResolver
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any
 
-from .base import Writer
+from .arrow import ArrowWriter, ParquetWriter
+from .base import AuthorLineWriter, Writer
 from .biorxiv import BiorxivWriter
 from .citation_cff import CitationCFFWriter
 from .nature_scientific_data import ScientificDataWriter
@@ -10,12 +12,44 @@ from .text import TextWriter
 
 __all__ = [
     "Writer",
+    "AuthorLineWriter",
     "writer_resolver",
     # Concrete classes
     "TextWriter",
     "BiorxivWriter",
     "ScientificDataWriter",
     "CitationCFFWriter",
+    "ArrowWriter",
+    "ParquetWriter",
 ]
 
-writer_resolver: ClassResolver[Writer] = ClassResolver.from_subclasses(Writer)
+if TYPE_CHECKING:
+    from class_resolver import ClassResolver
+
+    writer_resolver: ClassResolver[Writer]
+
+
+@lru_cache(maxsize=None)
+def _get_writer_resolver() -> "ClassResolver[Writer]":
+    from class_resolver import ClassResolver
+
+    # an explicit list doesn't depend on which subclasses happen to be defined when
+    # the resolver is first used. Register other writers with writer_resolver.register
+    return ClassResolver(
+        [
+            TextWriter,
+            BiorxivWriter,
+            ScientificDataWriter,
+            CitationCFFWriter,
+            ArrowWriter,
+            ParquetWriter,
+        ],
+        base=Writer,
+    )
+
+
+def __getattr__(name: str) -> Any:
+    # the resolver is built on first use, since importing class_resolver is slow
+    if name == "writer_resolver":
+        return _get_writer_resolver()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
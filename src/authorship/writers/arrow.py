@@ -0,0 +1,52 @@
+"""Write a normalized columnar form of an authorship with Arrow or Parquet."""
+
+from pathlib import Path
+from typing import TYPE_CHECKING, Iterable, Union
+
+from .base import Writer
+from ..columnar import iter_tsv_lines, to_columns, write_tables
+from ..models import Authorship
+
+if TYPE_CHECKING:
+    from ..readers import Reader
+
+__all__ = [
+    "ArrowWriter",
+    "ParquetWriter",
+]
+
+
+class ArrowWriter(Writer):
+    """Write the authors, institutions, and links tables as Arrow IPC files.
+
+    The files can be memory-mapped and reloaded quickly with
+    :class:`authorship.readers.ArrowReader`, so later steps of a pipeline can skip
+    parsing the sheet. See :mod:`authorship.columnar` for a description of the
+    tables. Writing files requires :mod:`pyarrow`, but the text output from
+    :meth:`iter_lines` doesn't.
+    """
+
+    file_name = "authors_arrow"
+    binary = True
+    requires = ("pyarrow",)
+    #: The format passed to :func:`authorship.columnar.write_tables`
+    format = "arrow"
+
+    def iter_lines(self, authorship: Authorship) -> Iterable[str]:
+        """Iterate over the lines of a plain text projection of the tables."""
+        return iter_tsv_lines(to_columns(authorship))
+
+    def write(self, authorship: Union["Reader", Authorship], *, path: Union[str, Path]) -> None:
+        """Write the tables to files in a directory, which is created if needed."""
+        from ..readers import Reader
+
+        if isinstance(authorship, Reader):
+            authorship = authorship.get_authorship()
+        write_tables(authorship, path, format=self.format)
+
+
+class ParquetWriter(ArrowWriter):
+    """Write the authors, institutions, and links tables as Parquet files."""
+
+    file_name = "authors_parquet"
+    format = "parquet"
@@ -2,23 +2,42 @@
 
 from __future__ import annotations
 
+import sys
 from abc import ABC, abstractmethod
 from pathlib import Path
-from typing import TYPE_CHECKING, Iterable, Union
+from typing import TYPE_CHECKING, ClassVar, Iterable, TextIO, Union
 
-from ..models import Authorship
+from ..instrument import span
+from ..memo import hash_kwargs, render_cache
+from ..models import Author, Authorship
 
 if TYPE_CHECKING:
+    from ..diff import AuthorshipDiff
     from ..readers import Reader
 
 __all__ = [
     "Writer",
+    "AuthorLineWriter",
 ]
 
 
 class Writer(ABC):
     """A writer for authorship."""
 
+    #: The default file name used by :meth:`authorship.readers.Reader.export_all`
+    file_name: ClassVar[str] = "authors.txt"
+    #: Does :meth:`write` produce files other than the text from :meth:`iter_lines`?
+    binary: ClassVar[bool] = False
+    #: The optional packages that :meth:`write` needs, e.g., ``pyarrow``
+    requires: ClassVar[tuple[str, ...]] = ()
+
+    @classmethod
+    def is_available(cls) -> bool:
+        """Check if the optional packages that the writer needs are installed."""
+        from importlib.util import find_spec
+
+        return all(find_spec(name) is not None for name in cls.requires)
+
     @abstractmethod
     def iter_lines(self, authorship: Authorship) -> Iterable[str]:
         """Iterate over lines for the authorship."""
@@ -31,14 +50,123 @@ class Writer(ABC):
             authorship = authorship.get_authorship()
         return list(self.iter_lines(authorship))
 
+    def update_lines(
+        self, authorship: Authorship, previous_lines: list[str], diff: "AuthorshipDiff"
+    ) -> list[str]:
+        """Make lines for an authorship, reusing the lines made for a previous version.
+
+        By default, all lines are made again. Writers whose lines map to authors
+        (see :class:`AuthorLineWriter`) only make the lines of authors that changed.
+
+        :param authorship: The new authorship
+        :param previous_lines: The lines made for the previous authorship
+        :param diff: The difference between the previous and new authorships, from
+            :func:`authorship.diff.diff_authorships`
+        :returns: The same lines as :meth:`to_lines` gives for the new authorship
+        """
+        return self.to_lines(authorship)
+
     def to_str(self, authorship: Union["Reader", Authorship]) -> str:
-        """Make a string from the authorship."""
-        return "\n".join(self.to_lines(authorship))
+        """Make a string from the authorship.
+
+        The output is memoized in :data:`authorship.memo.render_cache`, keyed by the
+        writer class, its configuration, and the hash of the authorship.
+        """
+        from ..readers import Reader
+
+        if isinstance(authorship, Reader):
+            authorship = authorship.get_authorship()
+        with span(f"render:{type(self).__name__}"):
+            key = (
+                f"{type(self).__module__}.{type(self).__qualname__}",
+                hash_kwargs(self),
+                authorship.get_hash(),
+            )
+            return render_cache.get_or_set(key, lambda: "\n".join(self.iter_lines(authorship)))
+
+    def dump(
+        self,
+        authorship: Union["Reader", Authorship],
+        file: TextIO,
+        *,
+        end: str = "",
+        chunk_size: int = 1024,
+    ) -> None:
+        """Write the authorship to a file-like object without building the full string.
+
+        Lines are consumed lazily from :meth:`iter_lines` and written in chunks, so
+        the memory used for the output doesn't grow with the number of authors.
+        The content is the same as :meth:`to_str`.
+
+        :param authorship: The authorship, or a reader for it
+        :param file: A text file-like object, e.g., an open file or :data:`sys.stdout`
+        :param end: A string written after the last line
+        :param chunk_size: The number of lines joined together for each write
+        """
+        from ..readers import Reader
+
+        if isinstance(authorship, Reader):
+            authorship = authorship.get_authorship()
+        with span(f"render:{type(self).__name__}"):
+            chunk: list[str] = []
+            for i, line in enumerate(self.iter_lines(authorship)):
+                if i:
+                    chunk.append("\n")
+                chunk.append(line)
+                if len(chunk) >= 2 * chunk_size:
+                    file.write("".join(chunk))
+                    chunk.clear()
+            chunk.append(end)
+            file.write("".join(chunk))
 
     def print(self, authorship: Union["Reader", Authorship], **kwargs) -> None:  # noqa:T202
-        """Print the authorship."""
-        print(self.to_str(authorship), **kwargs)  # noqa:T201
+        """Print the authorship.
+
+        :param authorship: The authorship, or a reader for it
+        :param kwargs: Keyword arguments with the same meaning as for :func:`print`,
+            i.e., ``file``, ``end``, and ``flush``
+        """
+        file = kwargs.get("file") or sys.stdout
+        self.dump(authorship, file, end=kwargs.get("end", "\n"))
+        if kwargs.get("flush"):
+            file.flush()
 
     def write(self, authorship: Union["Reader", Authorship], *, path: Union[str, Path]) -> None:
-        """Write the authorship to a path."""
-        Path(path).resolve().write_text(self.to_str(authorship))
+        """Write the authorship to a path, streaming it with :meth:`dump`."""
+        with Path(path).resolve().open("w") as file:
+            self.dump(authorship, file)
+
+
+class AuthorLineWriter(Writer):
+    """A writer whose output is some header lines followed by one line per author.
+
+    Since each author's line only depends on that author, :meth:`update_lines`
+    reuses the previous lines of unchanged authors, even if they moved.
+    """
+
+    def iter_header_lines(self) -> Iterable[str]:
+        """Iterate over the lines that come before the authors."""
+        return iter(())
+
+    @abstractmethod
+    def author_to_line(self, author: Author) -> str:
+        """Make the line for an author."""
+
+    def iter_lines(self, authorship: Authorship) -> Iterable[str]:
+        """Iterate over the header lines, then a line for each author."""
+        yield from self.iter_header_lines()
+        for author in authorship.authors:
+            yield self.author_to_line(author)
+
+    def update_lines(
+        self, authorship: Authorship, previous_lines: list[str], diff: "AuthorshipDiff"
+    ) -> list[str]:
+        """Make lines for an authorship, only making the lines of added or modified authors."""
+        rv = list(self.iter_header_lines())
+        offset = len(rv)
+        for author, previous_position in zip(authorship.authors, diff.previous_positions):
+            if previous_position is None:
+                rv.append(self.author_to_line(author))
+            else:
+                rv.append(previous_lines[offset + previous_position])
+        return rv
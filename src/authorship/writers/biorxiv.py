@@ -2,7 +2,7 @@
 
 from typing import Iterable
 
-from .base import Writer
+from .base import AuthorLineWriter
 from ..models import Author, Authorship
 
 HEADER = [
@@ -19,9 +19,11 @@ HEADER = [
 ]
 
 
-class BiorxivWriter(Writer):
+class BiorxivWriter(AuthorLineWriter):
     """Write output for bioRxiv bulk author import."""
 
+    file_name = "authors_biorxiv.tsv"
+
     def author_to_row(self, author: Author) -> tuple[str, ...]:
         """Make a row from an author."""
         return (
@@ -32,7 +34,7 @@ class BiorxivWriter(Writer):
             author.last,
             "",  # suffix
             "x" if author.role == "Senior" else "",  # corresponding
-            f"https://bioregistry.io/wikidata:{author.wikidata}",  # homepage TODO look up from wikidata
+            _get_homepage(author),
             "",  # Collaborative Group/Consortium
             author.orcid,
         )
@@ -42,8 +44,18 @@ class BiorxivWriter(Writer):
         for author in authorship.authors:
             yield self.author_to_row(author)
 
-    def iter_lines(self, authorship: Authorship) -> Iterable[str]:
-        """Iterate over lines for a bioRxiv author template."""
+    def iter_header_lines(self) -> Iterable[str]:
+        """Iterate over the header of a bioRxiv author template."""
         yield "\t".join(HEADER)
-        for row in self.iter_rows(authorship):
-            yield "\t".join(row)
+
+    def author_to_line(self, author: Author) -> str:
+        """Make a line for an author in a bioRxiv author template."""
+        return "\t".join(self.author_to_row(author))
+
+
+def _get_homepage(author: Author) -> str:
+    if author.homepage:
+        return author.homepage
+    if author.wikidata:
+        return f"https://bioregistry.io/wikidata:{author.wikidata}"
+    return ""
@@ -3,26 +3,30 @@
 from textwrap import dedent
 from typing import Iterable
 
-from .base import Writer
-from ..models import Authorship
+from .base import AuthorLineWriter
+from ..models import Author
 
 __all__ = [
     "CitationCFFWriter",
 ]
 
 
-class CitationCFFWriter(Writer):
+class CitationCFFWriter(AuthorLineWriter):
     """Write an author list for the CITATION.cff file on GitHub."""
 
-    def iter_lines(self, authorship: Authorship) -> Iterable[str]:
-        """Iterate lines."""
+    file_name = "authors_citation.cff"
+
+    def iter_header_lines(self) -> Iterable[str]:
+        """Iterate header lines."""
         yield "authors:"
-        for author in authorship.authors:
-            given = f"{author.first} {author.middle}" if author.middle else author.first
-            yield dedent(
-                f"""\
-            - family-names: "{author.last}"
-              given-names: "{given}"
-              orcid: "https://orcid.org/{author.orcid}"
-            """
-            ).rstrip()
+
+    def author_to_line(self, author: Author) -> str:
+        """Make the entry for an author."""
+        given = f"{author.first} {author.middle}" if author.middle else author.first
+        return dedent(
+            f"""\
+        - family-names: "{author.last}"
+          given-names: "{given}"
+          orcid: "https://orcid.org/{author.orcid}"
+        """
+        ).rstrip()
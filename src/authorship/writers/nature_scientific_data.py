@@ -1,6 +1,5 @@
 """Write an author list for the LaTeX template provided by Nature Scientific Data."""
 
-from operator import itemgetter
 from typing import Iterable, Optional
 
 from .base import Writer
@@ -14,27 +13,23 @@ __all__ = [
 class ScientificDataWriter(Writer):
     """Write an author list for the latex template for Nature Scientific Data."""
 
+    file_name = "authors_scientific_data.tex"
+
     def iter_lines(self, authorship: Authorship) -> Iterable[str]:
         """Iterate lines."""
         corresponding: Optional[Author] = None
-        affiliation_counts: dict[str, int] = {}
-        for author in authorship.authors:
-            local_numbering = []
-            for affiliation in author.institutions:
-                local_numbering.append(affiliation)
-                if affiliation.name not in affiliation_counts:
-                    affiliation_counts[affiliation.name] = len(affiliation_counts)
-
+        index = authorship.affiliation_index
+        for author, institution_ids in zip(authorship.authors, index.author_ids):
             affiliation_text = ",".join(
-                str(affiliation_counts[affiliation.name] + 1) for affiliation in local_numbering
+                str(institution_id + 1) for institution_id in institution_ids
             )
             if author.role == "Senior":
                 affiliation_text = f"{affiliation_text},*"
                 corresponding = author
             yield rf"\author[{affiliation_text}]{{{author.name}}}"
 
-        for _affiliation, index in sorted(affiliation_counts.items(), key=itemgetter(1)):
-            yield rf"\affil[{index + 1}]{{{_affiliation}}}"
+        for institution_id, institution in enumerate(index.institutions):
+            yield rf"\affil[{institution_id + 1}]{{{institution.name}}}"
 
         if corresponding is not None:
             yield rf"\affil[*]{{corresponding author(s): {corresponding.name} ({corresponding.email})}}"
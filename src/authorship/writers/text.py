@@ -2,7 +2,6 @@
 
 """Write an author list as text, e.g., for Microsoft Word or Google Docs."""
 
-from operator import itemgetter
 from typing import Iterable
 
 from .base import Writer
@@ -17,22 +16,18 @@ __all__ = [
 class TextWriter(Writer):
     """Write an authorship as text."""
 
+    file_name = "authors.txt"
+
     def iter_lines(self, authorship: Authorship) -> Iterable[str]:
         """Iterate over text lines."""
-        affiliation_counts: dict[str, int] = {}
-        for author in authorship.authors:
-            local_numbering = []
-            for affiliation in author.institutions:
-                local_numbering.append(affiliation)
-                if affiliation.name not in affiliation_counts:
-                    affiliation_counts[affiliation.name] = len(affiliation_counts)
-
+        index = authorship.affiliation_index
+        for author, institution_ids in zip(authorship.authors, index.author_ids):
             affiliation_text = "𝄒".join(
-                str(affiliation_counts[affiliation.name] + 1).translate(SUPERSCRIPTS_TRANS)
-                for affiliation in local_numbering
+                str(institution_id + 1).translate(SUPERSCRIPTS_TRANS)
+                for institution_id in institution_ids
             )
             yield f"{author.name}{affiliation_text}"
 
         yield ""
-        for affiliation_name, index in sorted(affiliation_counts.items(), key=itemgetter(1)):
-            yield f"{index + 1}. {affiliation_name}"
+        for institution_id, institution in enumerate(index.institutions):
+            yield f"{institution_id + 1}. {institution.name}"
@@ -0,0 +1,52 @@
+"""Small example sheets used in tests."""
+
+import numpy as np
+
+__all__ = [
+    "N",
+    "HOYT_COLUMNS",
+    "HOYT_ROWS",
+    "OBO_ROWS",
+]
+
+HOYT_COLUMNS = [
+    "First Name",
+    "Middle Name",
+    "Last Name",
+    "Role",
+    "Email",
+    "ORCID",
+    "Wikidata",
+    "Twitter",
+    "Affiliation",
+    "Affiliation Address",
+    "Affiliation ROR/Wikidata",
+    "Affiliation 2",
+    "Affiliation 2 Address",
+    "Affiliation 2 ROR/Wikidata",
+    "Conflicts of Interest",
+]
+N = np.nan
+HOYT_ROWS = [
+    # fmt: off
+    ["Zed", N, "Zulu", N, "z@example.org", "0000-0000-0000-0003", N, N,
+     "Inst B", N, N, N, N, N, N],
+    ["Sam", N, "Senior", "Senior", "s@example.org", "0000-0000-0000-0004", N, "@sam",
+     "Inst A", "Address 2", "https://ror.org/02", N, N, N, "Nothing"],
+    ["Al", "B.", "Alpha", N, "a@example.org", "0000-0000-0000-0002",
+     "https://www.wikidata.org/wiki/Q2", N,
+     "Inst C", N, "https://www.wikidata.org/wiki/Q10279363", "Inst A", "Address 1",
+     "https://ror.org/01", N],
+    ["Lee", N, "Lead", "Lead", "l@example.org", "0000-0000-0000-0001", N, N,
+     "Inst A", "Address 1", "https://ror.org/01", N, N, N, N],
+    # fmt: on
+]
+OBO_ROWS = [
+    # fmt: off
+    ["Al", "B.", "Alpha", "1", "y", "a@example.org", "0000-0000-0000-0001",
+     "https://www.wikidata.org/wiki/Q1", "@al", "1, 2", "1", "Org One"],
+    ["Bo", N, "Beta", "2", "y", "b@example.org", "0000-0000-0000-0002", N, N, "2,9",
+     "2", "Org Two"],
+    [N, N, N, N, N, N, N, N, N, N, "3", "Org Three"],
+    # fmt: on
+]
@@ -0,0 +1,87 @@
+"""Tests for fetching many sheets at once."""
+
+import tempfile
+import unittest
+from unittest import mock
+from urllib.error import HTTPError
+
+from authorship.cache import SheetCache
+from authorship.client import SheetClient
+from authorship.readers import OboGoogleSheetReader, fetch_many
+from tests.utils import MockSheetServer
+
+CONTENT = "a\tb\n1\t2\n"
+
+
+class TestFetchMany(unittest.TestCase):
+    """Test fetching many sheets against a local server."""
+
+    def setUp(self) -> None:
+        """Set up the test case with a local server."""
+        self.server = MockSheetServer().__enter__()
+        for i in range(10):
+            self.server.set_sheet(f"sheet{i}", CONTENT.replace("1", str(i)))
+
+    def tearDown(self) -> None:
+        """Tear down the local server."""
+        self.server.__exit__()
+
+    def test_fetch_many(self):
+        """Test fetching many sheets with errors in some of them."""
+        self.server.set_failures("sheet3", 2)
+        self.server.set_failures("sheet4", 10)
+        result = fetch_many(
+            [f"sheet{i}" for i in range(10)] + [("missing", 5)],
+            reader="obo_google_sheet",
+            client=SheetClient(retries=2, backoff=0),
+            max_workers=3,
+            url_template=self.server.url_template,
+        )
+        self.assertEqual({("sheet4", 0), ("missing", 5)}, set(result.errors))
+        self.assertIsInstance(result.errors["missing", 5], HTTPError)
+        self.assertEqual(9, len(result.readers))
+        for (sheet, _), reader in result.readers.items():
+            self.assertIsInstance(reader, OboGoogleSheetReader)
+            self.assertEqual(sheet[-1], reader._df["a"][0])
+        self.assertEqual(3, self.server.count("sheet3"))
+        self.assertEqual(3, self.server.count("sheet4"))
+        self.assertEqual(1, self.server.count("sheet5"))
+        # connections are reused between sheets
+        self.assertLess(self.server.connections, 10)
+
+    def test_close(self):
+        """Test the default client is closed, but a given client isn't."""
+        sheets = ["sheet1", "sheet2"]
+        with mock.patch.object(SheetClient, "close", autospec=True) as close:
+            fetch_many(sheets, url_template=self.server.url_template)
+            self.assertEqual(1, close.call_count)
+            client = SheetClient()
+            fetch_many(sheets, client=client, url_template=self.server.url_template)
+            self.assertEqual(1, close.call_count)
+
+    def test_fetch_many_cached(self):
+        """Test fetching many sheets through a cache."""
+        with tempfile.TemporaryDirectory() as directory:
+            cache = SheetCache(directory, url_template=self.server.url_template)
+            result = fetch_many(["sheet1", "sheet2"], reader="obo_google_sheet", cache=cache)
+            self.assertEqual({}, result.errors)
+            self.assertIs(cache, result.readers["sheet1", 0].cache)
+            self.assertEqual(1, self.server.count("sheet1"))
+            self.assertTrue(cache.get_path("sheet1", 0).is_file())
+
+            # a given client is used for the downloads, without changing the cache
+            client = SheetClient()
+            with mock.patch.object(client, "get", wraps=client.get) as get:
+                result = fetch_many(["sheet3"], cache=cache, client=client)
+            self.assertEqual({}, result.errors)
+            self.assertEqual(1, get.call_count)
+            self.assertIsNot(client, cache.client)
+            self.assertIs(client, result.readers["sheet3", 0].cache.client)
+            self.assertEqual(cache.directory, result.readers["sheet3", 0].cache.directory)
+
+    def test_invalid_reader(self):
+        """Test readers that don't read google sheets are rejected up front."""
+        for reader in ["sheet_file", "obo_sheet_file", "arrow"]:
+            with self.subTest(reader=reader), self.assertRaises(ValueError):
+                fetch_many(["sheet1"], reader=reader, url_template=self.server.url_template)
+        self.assertEqual(0, self.server.count("sheet1"))
@@ -0,0 +1,109 @@
+"""Tests for the sheet export cache."""
+
+import socket
+import tempfile
+import unittest
+from pathlib import Path
+
+from authorship.cache import SheetCache
+from authorship.client import SheetClient
+from authorship.readers import OboGoogleSheetReader
+from tests.utils import MockSheetServer
+
+SHEET = "sheet"
+CONTENT = "a\tb\n1\t2\n"
+CONTENT_2 = "a\tb\n3\t4\n"
+
+
+class TestSheetCache(unittest.TestCase):
+    """Test the sheet export cache against a local server."""
+
+    def setUp(self) -> None:
+        """Set up the test case with a local server and a temporary directory."""
+        self.directory = tempfile.TemporaryDirectory()
+        self.server = MockSheetServer().__enter__()
+        self.server.set_sheet(SHEET, CONTENT)
+
+    def tearDown(self) -> None:
+        """Tear down the local server and the temporary directory."""
+        self.server.__exit__()
+        self.directory.cleanup()
+
+    def get_cache(self, **kwargs) -> SheetCache:
+        """Get a cache pointing to the local server."""
+        return SheetCache(
+            self.directory.name,
+            url_template=self.server.url_template,
+            client=SheetClient(retries=1, backoff=0),
+            **kwargs,
+        )
+
+    def test_revalidate(self):
+        """Test that cached exports are revalidated with conditional requests."""
+        cache = self.get_cache()
+        path = cache.get_path(SHEET)
+        self.assertEqual(CONTENT, path.read_text())
+        self.assertEqual(1, self.server.count(SHEET))
+
+        self.assertEqual(path, cache.get_path(SHEET))
+        self.assertEqual(2, self.server.count(SHEET))
+        self.assertEqual(CONTENT, path.read_text())
+
+        self.server.set_sheet(SHEET, CONTENT_2)
+        self.assertEqual(CONTENT_2, cache.get_path(SHEET).read_text())
+        self.assertEqual(3, self.server.count(SHEET))
+
+    def test_ttl(self):
+        """Test that fresh exports are served without contacting the server."""
+        cache = self.get_cache(ttl=60)
+        cache.get_path(SHEET)
+        self.server.set_sheet(SHEET, CONTENT_2)
+        self.assertEqual(CONTENT, cache.get_path(SHEET).read_text())
+        self.assertEqual(1, self.server.count(SHEET))
+
+        cache.invalidate(SHEET)
+        self.assertEqual(CONTENT_2, cache.get_path(SHEET).read_text())
+        self.assertEqual(2, self.server.count(SHEET))
+
+    def test_stale(self):
+        """Test that stale exports are served when the server can't be reached."""
+        self.get_cache().get_path(SHEET)
+        self.server.set_failures(SHEET, 2)
+        with self.assertLogs("authorship.cache", level="WARNING"):
+            self.assertEqual(CONTENT, self.get_cache().get_path(SHEET).read_text())
+        self.assertEqual(3, self.server.count(SHEET))
+
+        self.server.set_sheet(SHEET, CONTENT_2)
+        self.assertEqual(CONTENT, self.get_cache(offline=True).get_path(SHEET).read_text())
+        self.assertEqual(3, self.server.count(SHEET))
+
+    def test_offline_missing(self):
+        """Test that an offline cache can't serve exports that were never downloaded."""
+        with self.assertRaises(FileNotFoundError):
+            self.get_cache(offline=True).get_path(SHEET)
+        self.assertEqual(0, self.server.count(SHEET))
+
+    def test_identifiers(self):
+        """Test that identifiers can't escape the cache directory."""
+        cache = self.get_cache()
+        for google_sheet, gid in [("../sheet", 0), ("a/b", 0), ("..", 0), (SHEET, "0/../1")]:
+            with self.subTest(google_sheet=google_sheet, gid=gid), self.assertRaises(ValueError):
+                cache.get_path(google_sheet, gid)
+        self.assertEqual(0, self.server.count(SHEET))
+
+    def test_timeout(self):
+        """Test that a server that never answers makes the download fail, not hang."""
+        self.assertEqual(30, SheetClient().timeout)
+        with socket.socket() as server:
+            # connections are accepted into the backlog, but nothing is ever sent
+            server.bind(("127.0.0.1", 0))
+            server.listen()
+            client = SheetClient(retries=0, timeout=0.1)
+            with self.assertRaises(OSError):
+                client.get(f"http://127.0.0.1:{server.getsockname()[1]}/sheet")
+
+    def test_reader(self):
+        """Test a reader using the cache."""
+        reader = OboGoogleSheetReader(SHEET, cache=self.get_cache())
+        self.assertEqual(["a", "b"], list(reader.df.columns))
+        self.assertTrue(Path(self.directory.name).joinpath(f"{SHEET}_0.tsv").is_file())
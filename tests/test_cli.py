@@ -0,0 +1,136 @@
+"""Tests for the command line interface."""
+
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+import pandas as pd
+from click.testing import CliRunner
+
+from authorship.cli import main
+from authorship.manifest import load_manifest
+from authorship.readers import SheetReader
+from authorship.writers import BiorxivWriter, TextWriter
+from tests.constants import HOYT_COLUMNS, HOYT_ROWS
+
+
+class TestCLI(unittest.TestCase):
+    """Test the command line interface on local files."""
+
+    def setUp(self) -> None:
+        """Set up the test case with a local export of a sheet."""
+        self.directory = tempfile.TemporaryDirectory()
+        self.root = Path(self.directory.name)
+        df = pd.DataFrame(HOYT_ROWS, columns=HOYT_COLUMNS, dtype=str)
+        self.reader = SheetReader(df)
+        self.path = self.root.joinpath("sheet.tsv")
+        self.path.write_text("Instructions\n" + df.to_csv(sep="\t", index=False))
+        self.runner = CliRunner()
+
+    def tearDown(self) -> None:
+        """Clean up the temporary directory."""
+        self.directory.cleanup()
+
+    def test_render(self):
+        """Test rendering a single writer to stdout."""
+        result = self.runner.invoke(main, ["render", str(self.path)])
+        self.assertEqual(0, result.exit_code, msg=result.output)
+        self.assertEqual(TextWriter().to_str(self.reader) + "\n", result.output)
+
+        result = self.runner.invoke(
+            main,
+            ["render", str(self.path), "-r", "sheet_file", "-O", "skiprows=1", "-w", "biorxiv"],
+        )
+        self.assertEqual(0, result.exit_code, msg=result.output)
+        self.assertEqual(BiorxivWriter().to_str(self.reader) + "\n", result.output)
+
+    def test_render_directory(self):
+        """Test rendering several writers to a directory."""
+        directory = self.root.joinpath("output")
+        result = self.runner.invoke(main, ["render", str(self.path), "-w", "text", "-w", "biorxiv"])
+        self.assertNotEqual(0, result.exit_code)
+
+        result = self.runner.invoke(
+            main, ["render", str(self.path), "-w", "text", "-w", "biorxiv", "-d", str(directory)]
+        )
+        self.assertEqual(0, result.exit_code, msg=result.output)
+        self.assertEqual(
+            BiorxivWriter().to_str(self.reader),
+            directory.joinpath(BiorxivWriter.file_name).read_text(),
+        )
+        self.assertTrue(directory.joinpath(TextWriter.file_name).is_file())
+
+    def test_batch(self):
+        """Test running jobs from a manifest in parallel processes."""
+        manifest = self.root.joinpath("manifest.yml")
+        manifest.write_text(
+            "jobs:\n"
+            "  - name: first\n"
+            "    source: sheet.tsv\n"
+            "    writers: [text, biorxiv]\n"
+            "    directory: output/first\n"
+            "  - source: sheet.tsv\n"
+            "    directory: output/second\n"
+            "  - name: broken\n"
+            "    source: missing.tsv\n"
+            "    directory: output/broken\n"
+        )
+        result = self.runner.invoke(main, ["batch", str(manifest), "-j", "2"])
+        self.assertEqual(1, result.exit_code, msg=result.output)
+        lines = result.output.splitlines()
+        self.assertEqual(4, len(lines))
+        self.assertTrue(lines[0].startswith("first"))
+        self.assertTrue(lines[0].endswith("ok"))
+        self.assertIn("failed (FileNotFoundError", lines[2])
+        self.assertIn("ran 3 jobs", lines[3])
+        self.assertEqual(
+            TextWriter().to_str(self.reader),
+            self.root.joinpath("output", "second", TextWriter.file_name).read_text(),
+        )
+        self.assertTrue(self.root.joinpath("output", "first", BiorxivWriter.file_name).is_file())
+        result = self.runner.invoke(main, ["batch", str(manifest), "-j", "0"])
+        self.assertEqual(2, result.exit_code, msg=result.output)
+        self.assertIn("--jobs", result.output)
+
+    def test_manifest(self):
+        """Test paths in a manifest are relative to it, and a home directory is expanded."""
+        manifest = self.root.joinpath("manifest.yml")
+        manifest.write_text(
+            "cache: ~/cache\n"
+            "jobs:\n"
+            "  - source: sheet.tsv\n"
+            "    directory: ~/output\n"
+            "  - source: sheet.tsv\n"
+            "    directory: output\n"
+        )
+        home = self.root.joinpath("home")
+        with mock.patch.dict(os.environ, {"HOME": str(home)}):
+            loaded = load_manifest(manifest)
+        self.assertEqual(str(home.joinpath("cache")), loaded.cache)
+        self.assertEqual(str(home.joinpath("output")), loaded.jobs[0].directory)
+        self.assertEqual(str(self.root.resolve().joinpath("output")), loaded.jobs[1].directory)
+        self.assertEqual(str(self.root.resolve().joinpath("sheet.tsv")), loaded.jobs[0].source)
+
+    def test_diff(self):
+        """Test reporting and incrementally rendering changes between two exports."""
+        df = pd.DataFrame(HOYT_ROWS[1:], columns=HOYT_COLUMNS, dtype=str)
+        path = self.root.joinpath("new.tsv")
+        path.write_text("Instructions\n" + df.to_csv(sep="\t", index=False))
+
+        result = self.runner.invoke(main, ["diff", str(self.path), str(path)])
+        self.assertEqual(0, result.exit_code, msg=result.output)
+        self.assertEqual("- Zed Zulu (removed from 3)\n- Inst B (removed, was 3)\n", result.output)
+        result = self.runner.invoke(main, ["diff", str(self.path), str(path), "--json"])
+        self.assertEqual(0, result.exit_code, msg=result.output)
+        self.assertIn('"kind": "removed"', result.output)
+
+        snapshot = self.root.joinpath("snapshot.json")
+        for source, reader in [(self.path, self.reader), (path, SheetReader(df))]:
+            result = self.runner.invoke(
+                main, ["render", str(source), "-w", "biorxiv", "--snapshot", str(snapshot)]
+            )
+            self.assertEqual(0, result.exit_code, msg=result.output)
+            self.assertTrue(result.stdout.startswith(BiorxivWriter().to_str(reader) + "\n"))
+        self.assertTrue(snapshot.is_file())
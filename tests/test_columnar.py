@@ -0,0 +1,76 @@
+"""Tests for the columnar form of authorships."""
+
+import tempfile
+import unittest
+from pathlib import Path
+
+import pandas as pd
+
+from authorship.columnar import from_columns, read_tables, to_columns
+from authorship.models import Author, Authorship, Institution, InstitutionRegistry
+from authorship.readers import ArrowReader, SheetReader
+from authorship.writers import ArrowWriter, ParquetWriter
+from tests.constants import HOYT_COLUMNS, HOYT_ROWS
+
+
+class TestColumnar(unittest.TestCase):
+    """Test converting authorships to and from tables."""
+
+    def setUp(self) -> None:
+        """Set up the test case with an authorship from a small sheet."""
+        df = pd.DataFrame(HOYT_ROWS, columns=HOYT_COLUMNS, dtype=str)
+        self.authorship = SheetReader(df).get_authorship()
+
+    def test_columns(self):
+        """Test the normalized tables."""
+        a, b = Institution(name="A"), Institution(name="B", ror="01")
+        authorship = Authorship(
+            authors=[
+                Author(first="X", last="Y", email="x", orcid="1", institutions=[b, a]),
+                Author(first="Z", last="W", email="z", orcid="2", institutions=[]),
+            ],
+            institutions=[a],
+        )
+        columns = to_columns(authorship)
+        self.assertEqual(["A", "B"], columns["institutions"]["name"])
+        self.assertEqual([True, False], columns["institutions"]["listed"])
+        self.assertEqual(
+            {"author": [0, 0], "institution": [1, 0], "position": [0, 1]}, columns["links"]
+        )
+        self.assertEqual(authorship, from_columns(columns))
+
+    def test_round_trip(self):
+        """Test writing and reading the tables in both formats."""
+        for writer_cls in [ArrowWriter, ParquetWriter]:
+            with self.subTest(writer=writer_cls.__name__), tempfile.TemporaryDirectory() as d:
+                writer_cls().write(self.authorship, path=d)
+                suffix = f".{writer_cls.format}"
+                self.assertEqual(
+                    {f"authors{suffix}", f"institutions{suffix}", f"links{suffix}"},
+                    {path.name for path in Path(d).iterdir()},
+                )
+                self.assertEqual(len(self.authorship.authors), read_tables(d)["authors"].num_rows)
+                self.assertEqual(self.authorship, ArrowReader(d).get_authorship())
+
+    def test_registry(self):
+        """Test institutions are interned when reading."""
+        registry = InstitutionRegistry()
+        with tempfile.TemporaryDirectory() as d:
+            ArrowWriter().write(self.authorship, path=d)
+            first = ArrowReader(d, registry=registry).get_authorship()
+            second = ArrowReader(d, memory_map=False, registry=registry).get_authorship()
+        self.assertEqual(self.authorship, second)
+        for x, y in zip(first.institutions, second.institutions):
+            self.assertIs(x, y)
+
+    def test_missing(self):
+        """Test an error is raised for a directory without tables."""
+        with tempfile.TemporaryDirectory() as d, self.assertRaises(FileNotFoundError):
+            read_tables(d)
+
+    def test_text(self):
+        """Test the text projection of the tables."""
+        lines = ArrowWriter().to_lines(self.authorship)
+        self.assertEqual("# authors", lines[0])
+        self.assertIn("# institutions", lines)
+        self.assertEqual("author\tinstitution\tposition", lines[lines.index("# links") + 1])
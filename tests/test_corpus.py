@@ -0,0 +1,117 @@
+"""Tests for the corpus of authorships."""
+
+import sqlite3
+import tempfile
+import unittest
+from pathlib import Path
+
+from authorship.corpus import AuthorHit, AuthorshipCorpus
+from authorship.models import Author, Authorship, Institution, InstitutionRegistry
+
+A = Institution(name="Harvard Medical School", ror="03vek6s52")
+B = Institution(name="Lawrence Berkeley National Lab", ror="02jbv0t02")
+C = Institution(name="Enveda Biosciences")
+
+
+def _author(last: str, institutions: list[Institution], **kwargs) -> Author:
+    return Author(
+        first="A",
+        last=last,
+        email=f"{last}@example.org",
+        orcid=f"0000-{last}",
+        institutions=institutions,
+        **kwargs,
+    )
+
+
+class TestCorpus(unittest.TestCase):
+    """Test indexing, looking up, and saving authorships."""
+
+    def setUp(self) -> None:
+        """Set up the test case with two papers that share an author."""
+        self.x = _author("x", [A], wikidata="Q1")
+        self.y = _author("y", [A, B])
+        self.z = _author("z", [C])
+        self.first = Authorship(authors=[self.x, self.y], institutions=[A, B])
+        self.second = Authorship(authors=[self.z, self.x], institutions=[C, A])
+        self.corpus = AuthorshipCorpus()
+        self.corpus.add("first", self.first)
+        self.corpus.add("second", self.second)
+
+    def test_lookup(self):
+        """Test looking up papers and authors."""
+        self.assertEqual(2, len(self.corpus))
+        self.assertEqual(["first", "second"], list(self.corpus))
+        self.assertEqual(["first", "second"], self.corpus.find_papers(orcid="0000-x"))
+        self.assertEqual(["first", "second"], self.corpus.find_papers(email="X@Example.org"))
+        self.assertEqual(["first", "second"], self.corpus.find_papers(wikidata="Q1"))
+        self.assertEqual(["first"], self.corpus.find_papers(ror="02jbv0t02"))
+        self.assertEqual(["second"], self.corpus.find_papers(institution="  enveda   BIOSCIENCES"))
+        self.assertEqual([], self.corpus.find_papers(orcid="0000-nope"))
+        self.assertEqual(
+            [
+                AuthorHit("first", 0, self.x),
+                AuthorHit("first", 1, self.y),
+                AuthorHit("second", 1, self.x),
+            ],
+            self.corpus.find_authors(ror="03vek6s52"),
+        )
+        with self.assertRaises(ValueError):
+            self.corpus.find_papers()
+
+    def test_intersection(self):
+        """Test that lookups with several values match authors with all of them."""
+        self.assertEqual(
+            [AuthorHit("first", 1, self.y)],
+            self.corpus.find_authors(ror="03vek6s52", institution="lawrence berkeley national lab"),
+        )
+        # both are on the second paper, but not as the same author
+        self.assertEqual([], self.corpus.find_papers(orcid="0000-z", ror="03vek6s52"))
+
+    def test_remove(self):
+        """Test removing and replacing papers."""
+        self.assertIs(self.first, self.corpus.remove("first"))
+        self.assertNotIn("first", self.corpus)
+        self.assertEqual(["second"], self.corpus.find_papers(orcid="0000-x"))
+        self.assertEqual([], self.corpus.find_papers(orcid="0000-y"))
+        self.assertNotIn(("orcid", "0000-y"), self.corpus._index)
+        with self.assertRaises(KeyError):
+            self.corpus.remove("first")
+
+        self.corpus.add("second", Authorship(authors=[self.y], institutions=[A, B]))
+        self.assertEqual(1, len(self.corpus))
+        self.assertEqual(["second"], self.corpus.find_papers(orcid="0000-y"))
+        self.assertEqual([], self.corpus.find_papers(orcid="0000-x"))
+
+    def test_save(self):
+        """Test saving to and loading from SQLite."""
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory).joinpath("corpus.sqlite")
+            self.corpus.save(path)
+            with sqlite3.connect(path) as connection:
+                papers = connection.execute(
+                    "SELECT DISTINCT paper FROM keys WHERE field = 'orcid' AND value = ?",
+                    ("0000-z",),
+                ).fetchall()
+            connection.close()
+            self.assertEqual([("second",)], papers)
+
+            registry = InstitutionRegistry()
+            corpus = AuthorshipCorpus.load(path, registry=registry)
+            self.assertEqual(["first", "second"], list(corpus))
+            self.assertEqual(["first", "second"], corpus.find_papers(orcid="0000-x"))
+            # authorships are only parsed when they're needed
+            self.assertEqual(2, len(corpus._pending))
+            hits = corpus.find_authors(orcid="0000-y")
+            self.assertEqual([AuthorHit("first", 1, self.y)], hits)
+            self.assertEqual(["second"], list(corpus._pending))
+            self.assertIs(registry.lookup(ror="03vek6s52"), hits[0].author.institutions[0])
+
+            # a partly parsed corpus can be saved again
+            corpus.remove("second")
+            corpus.save(path)
+            self.assertEqual(["first"], list(AuthorshipCorpus.load(path)))
+            self.assertEqual(["corpus.sqlite"], [p.name for p in Path(directory).iterdir()])
+
+        with self.assertRaises(FileNotFoundError):
+            AuthorshipCorpus.load(path)
@@ -0,0 +1,160 @@
+"""Tests for merging similar institutions."""
+
+import tempfile
+import unittest
+from pathlib import Path
+
+import pandas as pd
+from click.testing import CliRunner
+
+from authorship.cli import main
+from authorship.dedupe import (
+    _find_pairs,
+    _jaccard,
+    _split,
+    _trigrams,
+    dedupe_institutions,
+    normalize_institution,
+)
+from authorship.models import Author, Authorship, Institution
+from authorship.readers import SheetReader
+from authorship.writers import TextWriter
+from tests.constants import HOYT_COLUMNS, HOYT_ROWS
+
+NAMES = [
+    "Harvard Medical School",
+    "Harvard Medical School, Boston",
+    "harvard medical school",
+    "Harvard University",
+    "University of California, Berkeley",
+    "University of California, San Diego",
+    "Lawrence Berkeley Nat'l Lab.",
+    "Lawrence Berkeley National Laboratory",
+    "Universität Bonn",
+    "Universitat Bonn",
+]
+
+
+def _authorship(institutions: list[list[Institution]]) -> Authorship:
+    authors = [
+        Author(first="A", last=str(i), email="", orcid="", institutions=author_institutions)
+        for i, author_institutions in enumerate(institutions)
+    ]
+    unique = {id(i): i for row in institutions for i in row}
+    return Authorship(authors=authors, institutions=list(unique.values()))
+
+
+class TestDedupe(unittest.TestCase):
+    """Test merging similar institutions."""
+
+    def test_normalize(self):
+        """Test normalizing the names of institutions."""
+        self.assertEqual(
+            "lawrence berkeley national laboratory",
+            normalize_institution("The Lawrence Berkeley Nat'l Lab."),
+        )
+        self.assertEqual("universitat zurich", normalize_institution("Universität  Zürich"))
+        self.assertEqual("research and development", normalize_institution("Res. & Development"))
+
+    def test_dedupe(self):
+        """Test merging institutions and the merge report."""
+        institutions = [Institution(name=name) for name in NAMES]
+        institutions[1] = Institution(name=NAMES[1], ror="03vek6s52", address="Boston")
+        authorship = _authorship([[i] for i in institutions] + [[institutions[2]]])
+        rv, report = dedupe_institutions(authorship)
+        self.assertEqual(10, report.n_before)
+        self.assertEqual(6, report.n_after)
+        self.assertEqual(
+            [
+                (
+                    "harvard medical school",
+                    ["Harvard Medical School", "Harvard Medical School, Boston"],
+                ),
+                ("Lawrence Berkeley Nat'l Lab.", ["Lawrence Berkeley National Laboratory"]),
+                ("Universität Bonn", ["Universitat Bonn"]),
+            ],
+            [(merge.name, merge.merged) for merge in report.merges],
+        )
+        self.assertEqual(4, report.merges[0].n_authors)
+        self.assertIn("10 institutions merged into 6", report.to_str())
+
+        # the kept institution has the most authors and the fields of the others
+        hms = rv.authors[0].institutions[0]
+        self.assertEqual(
+            Institution(name="harvard medical school", ror="03vek6s52", address="Boston"), hms
+        )
+        self.assertTrue(all(rv.authors[i].institutions[0] is hms for i in [1, 2, 10]))
+        self.assertEqual(6, len(rv.institutions))
+        self.assertEqual(6, len(rv.affiliation_index.institutions))
+        # the input isn't modified
+        self.assertEqual(NAMES[0], authorship.authors[0].institutions[0].name)
+
+    def test_no_merges(self):
+        """Test that the same authorship is returned if nothing is merged."""
+        authorship = _authorship([[Institution(name="A")], [Institution(name="B")]])
+        rv, report = dedupe_institutions(authorship)
+        self.assertIs(authorship, rv)
+        self.assertEqual("no institutions merged", report.to_str())
+        with self.assertRaises(ValueError):
+            dedupe_institutions(authorship, threshold=0)
+
+    def test_ror(self):
+        """Test that institutions with different ROR identifiers aren't merged."""
+        a = Institution(name="Harvard Medical School, Boston", ror="01")
+        b = Institution(name="Harvard Medical School")
+        c = Institution(name="harvard medical school", ror="02")
+        # b and c are both similar to a, but c can't be merged into a or b
+        authorship = _authorship([[a], [b, a], [c]])
+        rv, report = dedupe_institutions(authorship)
+        self.assertEqual(1, len(report.merges))
+        # an author's institutions that are merged become one
+        self.assertEqual(1, len(rv.authors[1].institutions))
+        self.assertNotEqual(rv.authors[0].institutions[0], rv.authors[2].institutions[0])
+        self.assertIs(c, rv.authors[2].institutions[0])
+
+    def test_locations(self):
+        """Test that names without a location don't join names with different locations."""
+        names = [
+            "University of California, Berkeley",
+            "University of California",
+            "University of California, San Diego",
+        ]
+        authorship = _authorship([[Institution(name=name)] for name in names])
+        _, report = dedupe_institutions(authorship)
+        self.assertEqual(2, report.n_after)
+        self.assertEqual([(names[0], [names[1]])], [(m.name, m.merged) for m in report.merges])
+
+    def test_blocking(self):
+        """Test that the blocking index finds the same pairs as comparing all pairs."""
+        keys = [_split(name) for name in NAMES * 2]
+        for threshold in [0.5, 0.8, 1.0]:
+            with self.subTest(threshold=threshold):
+                expected = {
+                    (i, j)
+                    for j in range(len(keys))
+                    for i in range(j)
+                    if _is_similar(keys[i], keys[j], threshold)
+                }
+                self.assertEqual(expected, {(i, j) for i, j, _ in _find_pairs(keys, threshold)})
+
+    def test_cli(self):
+        """Test deduplicating from the command line."""
+        df = pd.DataFrame(HOYT_ROWS, columns=HOYT_COLUMNS, dtype=str)
+        df = df.replace("Inst B", "Inst A, Boston")
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory).joinpath("sheet.tsv")
+            path.write_text("Instructions\n" + df.to_csv(sep="\t", index=False))
+            result = CliRunner().invoke(main, ["render", str(path), "--dedupe"])
+        self.assertEqual(0, result.exit_code, msg=result.output)
+        self.assertIn("Inst A (4 authors, similarity 1.00)\n  <- Inst A, Boston", result.stderr)
+        self.assertIn("3 institutions merged into 2", result.stderr)
+        authorship, _ = dedupe_institutions(SheetReader(df).get_authorship())
+        self.assertEqual(TextWriter().to_str(authorship) + "\n", result.stdout)
+
+
+def _is_similar(left: tuple[str, str], right: tuple[str, str], threshold: float) -> bool:
+    if _jaccard(_trigrams(left[0]), _trigrams(right[0])) < threshold:
+        return False
+    if left[1] and right[1]:
+        return _jaccard(_trigrams(left[1]), _trigrams(right[1])) >= threshold
+    return True
@@ -0,0 +1,142 @@
+"""Tests for diffing authorships and incremental rendering."""
+
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from authorship.diff import (
+    AuthorChange,
+    IncrementalRenderer,
+    InstitutionChange,
+    diff_authorships,
+)
+from authorship.models import Author, Authorship, Institution
+from authorship.writers import BiorxivWriter, CitationCFFWriter, TextWriter
+
+A, B, C = (Institution(name=name) for name in "ABC")
+
+
+def _author(last: str, institutions: list[Institution], **kwargs) -> Author:
+    return Author(
+        first="A",
+        last=last,
+        email=f"{last.lower()}@example.org",
+        orcid=f"0000-{last}",
+        institutions=institutions,
+        **kwargs,
+    )
+
+
+def _authorship(authors: list[Author]) -> Authorship:
+    return Authorship(authors=authors, institutions=[A, B, C])
+
+
+class TestDiff(unittest.TestCase):
+    """Test diffing authorships."""
+
+    def setUp(self) -> None:
+        """Set up the test case with a previous authorship."""
+        self.w, self.x, self.y, self.z = (
+            _author(last, [institution]) for last, institution in zip("WXYZ", [A, A, B, C])
+        )
+        self.previous = _authorship([self.w, self.x, self.y, self.z])
+
+    def test_unchanged(self):
+        """Test diffing an authorship with itself."""
+        diff = diff_authorships(self.previous, self.previous)
+        self.assertTrue(diff.is_empty())
+        self.assertEqual("no changes", diff.to_str())
+        self.assertEqual([0, 1, 2, 3], diff.previous_positions)
+
+    def test_changes(self):
+        """Test added, removed, modified, and moved authors and renumbered institutions."""
+        x = self.x.model_copy(update={"email": "new@example.org"})
+        v = _author("V", [B])
+        authorship = _authorship([v, self.z, self.w, x])
+        diff = diff_authorships(self.previous, authorship)
+        self.assertEqual(
+            [
+                AuthorChange(kind="added", name="A V", position=0),
+                AuthorChange(kind="moved", name="A Z", previous_position=3, position=1),
+                AuthorChange(
+                    kind="modified", name="A X", previous_position=1, position=3, fields=["email"]
+                ),
+                AuthorChange(kind="removed", name="A Y", previous_position=2),
+            ],
+            diff.authors,
+        )
+        self.assertEqual(
+            [
+                InstitutionChange(kind="renumbered", name="B", previous_number=2, number=1),
+                InstitutionChange(kind="renumbered", name="C", previous_number=3, number=2),
+                InstitutionChange(kind="renumbered", name="A", previous_number=1, number=3),
+            ],
+            diff.institutions,
+        )
+        self.assertEqual([None, 3, 0, None], diff.previous_positions)
+        self.assertEqual(2, diff.n_shifted)
+        self.assertIn("~ A X (modified email)", diff.to_str())
+
+    def test_shifted(self):
+        """Test that authors shifted by an insertion aren't reported as moved."""
+        v = _author("V", [A])
+        diff = diff_authorships(self.previous, _authorship([v, self.w, self.x, self.y, self.z]))
+        self.assertEqual(["added"], [change.kind for change in diff.authors])
+        self.assertEqual([None, 0, 1, 2, 3], diff.previous_positions)
+        self.assertEqual([], diff.institutions)
+
+
+class TestIncremental(unittest.TestCase):
+    """Test updating the lines of writers incrementally."""
+
+    def setUp(self) -> None:
+        """Set up the test case with two versions of an authorship."""
+        authors = [_author(last, [A, B][: i % 2 + 1]) for i, last in enumerate("QRSTU")]
+        self.previous = _authorship(authors)
+        authors = [
+            authors[1],
+            authors[0].model_copy(update={"middle": "M"}),
+            _author("V", [C]),
+            *authors[3:],
+        ]
+        self.authorship = _authorship(authors)
+        self.diff = diff_authorships(self.previous, self.authorship)
+
+    def test_update_lines(self):
+        """Test that updated lines are the same as lines made from scratch."""
+        for writer in [BiorxivWriter(), CitationCFFWriter(), TextWriter()]:
+            with self.subTest(writer=writer):
+                lines = writer.update_lines(
+                    self.authorship, writer.to_lines(self.previous), self.diff
+                )
+                self.assertEqual(writer.to_lines(self.authorship), lines)
+
+    def test_only_changed_authors(self):
+        """Test that only the lines of added and modified authors are made again."""
+        writer = BiorxivWriter()
+        previous_lines = writer.to_lines(self.previous)
+        with mock.patch.object(
+            BiorxivWriter, "author_to_line", autospec=True, side_effect=BiorxivWriter.author_to_line
+        ) as author_to_line:
+            writer.update_lines(self.authorship, previous_lines, self.diff)
+        self.assertEqual(["Q", "V"], [call.args[1].last for call in author_to_line.call_args_list])
+
+    def test_renderer(self):
+        """Test that snapshots are kept in a file between renderers."""
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory).joinpath("snapshot.json")
+            renderer = IncrementalRenderer("biorxiv", path=path)
+            diff = renderer.render(self.previous)
+            self.assertEqual(5, len(diff.authors))
+            self.assertEqual(BiorxivWriter().to_str(self.previous), renderer.to_str())
+
+            renderer = IncrementalRenderer("biorxiv", path=path)
+            self.assertEqual(self.previous, renderer.authorship)
+            diff = renderer.render(self.authorship)
+            self.assertEqual(self.diff, diff)
+            self.assertEqual(BiorxivWriter().to_str(self.authorship), renderer.to_str())
+
+            # a snapshot from another writer only reuses the authorship
+            renderer = IncrementalRenderer("text", path=path)
+            self.assertEqual(TextWriter().to_lines(self.authorship), renderer.lines)
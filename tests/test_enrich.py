@@ -0,0 +1,242 @@
+"""Tests for enriching authorships with metadata."""
+
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+import pandas as pd
+from click.testing import CliRunner
+
+from authorship.cli import main
+from authorship.enrich import (
+    Enricher,
+    FixtureSource,
+    MetadataCache,
+    ORCIDSource,
+    RORAffiliationSource,
+    RORSource,
+    WikidataSource,
+)
+from authorship.models import Author, Authorship, Institution
+from authorship.writers import BiorxivWriter
+from tests.constants import HOYT_COLUMNS, HOYT_ROWS
+
+HMS = Institution(name="Harvard Medical School", ror="03vek6s52")
+LBNL = Institution(name="Lawrence Berkeley National Lab", wikidata="Q1133630")
+ENVEDA = Institution(name="Enveda Biosciences")
+
+
+def _get_sources() -> list[FixtureSource]:
+    return [
+        FixtureSource("orcid", {"0000-x": {"homepage": "https://x.example.org"}}),
+        FixtureSource(
+            "wikidata",
+            {"Q2": {"homepage": "https://y.example.org"}, "Q1133630": {"ror": "02jbv0t02"}},
+        ),
+        FixtureSource(
+            "ror",
+            {
+                "03vek6s52": {"address": "Boston, United States", "wikidata": "Q49121"},
+                "02jbv0t02": {"address": "Berkeley, United States"},
+            },
+        ),
+    ]
+
+
+class TestEnrich(unittest.TestCase):
+    """Test filling in missing metadata."""
+
+    def setUp(self) -> None:
+        """Set up the test case with an authorship with missing metadata."""
+        self.x = Author(
+            first="A", last="X", email="x@example.org", orcid="0000-x", institutions=[HMS]
+        )
+        self.y = Author(
+            first="A",
+            last="Y",
+            email="y@example.org",
+            orcid="0000-y",
+            wikidata="Q2",
+            institutions=[LBNL, HMS],
+        )
+        self.z = Author(
+            first="A",
+            last="Z",
+            email="z@example.org",
+            orcid="0000-z",
+            homepage="https://z.example.org",
+            institutions=[ENVEDA],
+        )
+        self.authorship = Authorship(
+            authors=[self.x, self.y, self.z], institutions=[HMS, LBNL, ENVEDA]
+        )
+
+    def test_enrich(self):
+        """Test that missing values are filled in and existing ones are kept."""
+        sources = _get_sources()
+        rv = Enricher(sources).enrich(self.authorship)
+        x, y, z = rv.authors
+        self.assertEqual("https://x.example.org", x.homepage)
+        self.assertEqual("https://y.example.org", y.homepage)
+        self.assertIs(self.z, z)
+        hms, lbnl, enveda = rv.institutions
+        self.assertEqual(
+            Institution(
+                name="Harvard Medical School",
+                ror="03vek6s52",
+                wikidata="Q49121",
+                address="Boston, United States",
+            ),
+            hms,
+        )
+        self.assertEqual("02jbv0t02", lbnl.ror)
+        self.assertEqual("Q1133630", lbnl.wikidata)
+        self.assertEqual("Berkeley, United States", lbnl.address)
+        self.assertIs(ENVEDA, enveda)
+        # shared institutions stay shared
+        self.assertIs(hms, x.institutions[0])
+        self.assertEqual([lbnl, hms], y.institutions)
+        self.assertIs(hms, y.institutions[1])
+        # the input isn't modified
+        self.assertIsNone(self.x.homepage)
+        self.assertIsNone(HMS.address)
+
+        # one batch per source, without duplicates, and no repeated lookups
+        orcid, wikidata, ror = sources
+        self.assertEqual([["0000-x", "0000-y"]], orcid.requests)
+        self.assertEqual([["Q2", "Q1133630"]], wikidata.requests)
+        self.assertEqual([["03vek6s52", "02jbv0t02"]], ror.requests)
+
+    def test_cache(self):
+        """Test that records, including missing ones, are cached persistently."""
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory).joinpath("metadata.sqlite")
+            sources = _get_sources()
+            expected = Enricher(sources, cache=MetadataCache(path)).enrich(self.authorship)
+
+            # a new enricher with the same cache doesn't need the sources
+            sources = _get_sources()
+            rv = Enricher(sources, cache=MetadataCache(path)).enrich(self.authorship)
+            self.assertEqual(expected, rv)
+            self.assertEqual([[], [], []], [source.requests for source in sources])
+            self.assertEqual(
+                {"0000-x": {"homepage": "https://x.example.org"}, "0000-y": None},
+                MetadataCache(path).get_many("orcid", ["0000-x", "0000-y", "0000-z"]),
+            )
+
+            rv = Enricher([], cache=MetadataCache(path), offline=True).enrich(self.authorship)
+            self.assertEqual(self.authorship, rv)
+
+            cache = MetadataCache(path, ttl=-1)
+            self.assertEqual({}, cache.get_many("orcid", ["0000-x"]))
+            cache.clear()
+            self.assertEqual({}, MetadataCache(path).get_many("orcid", ["0000-x"]))
+
+    def test_affiliations(self):
+        """Test matching the names of institutions without identifiers."""
+        sources = [
+            *_get_sources(),
+            FixtureSource("ror_affiliation", {"Enveda Biosciences": {"ror": "04z8jg394"}}),
+        ]
+        rv = Enricher(sources).enrich(self.authorship)
+        self.assertEqual("04z8jg394", rv.institutions[2].ror)
+        self.assertEqual([["Enveda Biosciences"]], sources[3].requests)
+        self.assertEqual(["03vek6s52", "02jbv0t02", "04z8jg394"], sources[2].requests[0])
+
+    def test_parse(self):
+        """Test parsing responses from the APIs."""
+        self.assertEqual(
+            {"0000-x": {"homepage": "https://x.example.org"}},
+            ORCIDSource().parse(
+                ["0000-x"],
+                {
+                    "researcher-url": [
+                        {"url-name": "Homepage", "url": {"value": "https://x.example.org"}}
+                    ]
+                },
+            ),
+        )
+        self.assertEqual({"0000-x": {}}, ORCIDSource().parse(["0000-x"], {"researcher-url": []}))
+        self.assertEqual(
+            {"Q1133630": {"homepage": "https://www.lbl.gov", "ror": "02jbv0t02"}},
+            WikidataSource().parse(
+                ["Q1133630", "Q0"],
+                {
+                    "entities": {
+                        "Q1133630": {
+                            "claims": {
+                                "P856": [
+                                    {"mainsnak": {"datavalue": {"value": "https://www.lbl.gov"}}}
+                                ],
+                                "P6782": [{"mainsnak": {"datavalue": {"value": "02jbv0t02"}}}],
+                            }
+                        },
+                        "Q0": {"id": "Q0", "missing": ""},
+                    }
+                },
+            ),
+        )
+        organization = {
+            "id": "https://ror.org/03vek6s52",
+            "locations": [
+                {"geonames_details": {"name": "Boston", "country_name": "United States"}}
+            ],
+            "external_ids": [
+                {"type": "grid", "all": ["grid.38142.3c"]},
+                {"type": "wikidata", "all": ["Q49121"], "preferred": None},
+            ],
+            "links": [{"type": "website", "value": "https://hms.harvard.edu"}],
+        }
+        expected = {"address": "Boston, United States", "wikidata": "Q49121"}
+        self.assertEqual({"03vek6s52": expected}, RORSource().parse(["03vek6s52"], organization))
+        self.assertEqual(
+            {"Harvard Medical School": {"ror": "03vek6s52", **expected}},
+            RORAffiliationSource().parse(
+                ["Harvard Medical School"],
+                {"items": [{"chosen": False}, {"chosen": True, "organization": organization}]},
+            ),
+        )
+        self.assertEqual({}, RORAffiliationSource().parse(["HMS"], {"items": [{"chosen": False}]}))
+
+    def test_wikidata_errors(self):
+        """Test that a batch that Wikidata fails isn't cached as missing."""
+        client = mock.Mock()
+        client.get.return_value.body = '{"error": {"code": "no-such-entity"}}'
+        with tempfile.TemporaryDirectory() as directory:
+            cache = MetadataCache(Path(directory).joinpath("metadata.sqlite"))
+            enricher = Enricher([WikidataSource(client=client)], cache=cache)
+            identifiers = ["Q1", "https://www.wikidata.org/wiki/Q42"]
+            self.assertEqual({}, enricher.get_records("wikidata", identifiers))
+            # malformed identifiers aren't sent, since they fail the whole batch
+            self.assertIn("ids=Q1&", client.get.call_args.args[0] + "&")
+            self.assertEqual({}, cache.get_many("wikidata", identifiers))
+            # so they're looked up again
+            Enricher([WikidataSource(client=client)], cache=cache).get_records("wikidata", ["Q1"])
+            self.assertEqual(2, client.get.call_count)
+
+    def test_biorxiv_homepage(self):
+        """Test that the bioRxiv writer uses homepages, and doesn't link to missing items."""
+        rows = list(BiorxivWriter().iter_rows(Enricher(_get_sources()).enrich(self.authorship)))
+        self.assertEqual(
+            ["https://x.example.org", "https://y.example.org", "https://z.example.org"],
+            [row[7] for row in rows],
+        )
+        self.assertEqual("", BiorxivWriter().author_to_row(self.x)[7])
+
+    def test_cli(self):
+        """Test enriching from the command line, with a cache in the home directory."""
+        df = pd.DataFrame(HOYT_ROWS, columns=HOYT_COLUMNS, dtype=str)
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory).joinpath("sheet.tsv")
+            path.write_text("Instructions\n" + df.to_csv(sep="\t", index=False))
+            with (
+                mock.patch.dict(os.environ, {"AUTHORSHIP_HOME": directory}),
+                mock.patch("authorship.enrich.get_default_sources", return_value=_get_sources()),
+            ):
+                result = CliRunner().invoke(
+                    main, ["render", str(path), "-w", "biorxiv", "--enrich"]
+                )
+            self.assertEqual(0, result.exit_code, msg=result.output)
+            self.assertTrue(Path(directory).joinpath("metadata.sqlite").is_file())
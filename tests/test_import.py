@@ -0,0 +1,62 @@
+"""Tests for import times."""
+
+import json
+import subprocess
+import sys
+import unittest
+
+#: The budget for importing the command line interface, in microseconds. Importing pandas
+#: alone usually takes longer than this.
+BUDGET = 250_000
+
+HEAVY = ["pandas", "numpy", "pyarrow", "yaml", "class_resolver", "pydantic"]
+
+
+def _get_imported(code: str) -> list[str]:
+    """Get which heavy modules are imported after running some code in a new interpreter."""
+    code = (
+        f"import sys, json\n{code}\nprint(json.dumps([m for m in {HEAVY!r} if m in sys.modules]))"
+    )
+    output = subprocess.check_output([sys.executable, "-c", code], text=True)
+    return json.loads(output.splitlines()[-1])
+
+
+class TestImport(unittest.TestCase):
+    """Test that heavy dependencies are only imported when needed."""
+
+    def test_lazy(self):
+        """Test importing the package and the CLI doesn't import heavy dependencies."""
+        self.assertEqual([], _get_imported("import authorship"))
+        self.assertEqual([], _get_imported("import authorship.cli"))
+        self.assertEqual(
+            ["pydantic"],
+            _get_imported("from authorship import Authorship, PreparedReader, TextWriter"),
+        )
+
+    def test_no_pandas_for_prepared(self):
+        """Test rendering a prepared authorship doesn't import pandas."""
+        code = """
+from authorship import Author, Authorship, Institution, PreparedReader, writer_resolver
+institution = Institution(name="A")
+author = Author(first="A", last="B", email="e", orcid="o", institutions=[institution])
+reader = PreparedReader(Authorship(authors=[author], institutions=[institution]))
+for writer in writer_resolver:
+    writer().to_str(reader)
+"""
+        self.assertNotIn("pandas", _get_imported(code))
+
+    def test_budget(self):
+        """Test the time to import the CLI is within the budget."""
+        stderr = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", "import authorship.cli"],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stderr
+        # lines look like "import time:  self [us] | cumulative | imported package"
+        cumulative = next(
+            int(line.split("|")[1])
+            for line in stderr.splitlines()
+            if line.split("|")[-1].strip() == "authorship.cli"
+        )
+        self.assertLess(cumulative, BUDGET)
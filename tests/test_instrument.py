@@ -0,0 +1,90 @@
+"""Tests for instrumentation."""
+
+import tempfile
+import unittest
+from pathlib import Path
+
+import pandas as pd
+from click.testing import CliRunner
+
+from authorship.cli import main
+from authorship.instrument import Event, Profile, add_hook, count, is_enabled, remove_hook, span
+from authorship.memo import clear_caches
+from authorship.readers import SheetReader
+from authorship.writers import TextWriter
+from tests.constants import HOYT_COLUMNS, HOYT_ROWS
+
+
+class TestInstrument(unittest.TestCase):
+    """Test spans, counters, and profiles."""
+
+    def setUp(self) -> None:
+        """Set up the test case with a small sheet."""
+        self.df = pd.DataFrame(HOYT_ROWS, columns=HOYT_COLUMNS, dtype=str)
+        clear_caches()
+
+    def test_hooks(self):
+        """Test that hooks get nested spans and counters."""
+        events: list[Event] = []
+        self.assertFalse(is_enabled())
+        with span("ignored"):
+            count("ignored")
+        add_hook(events.append)
+        try:
+            with span("outer"):
+                with span("inner"):
+                    count("things", 2)
+        finally:
+            remove_hook(events.append)
+        self.assertEqual(
+            [("count", "things", ("outer", "inner")), ("span", "inner", ("outer", "inner"))],
+            [(event.kind, event.name, event.path) for event in events[:2]],
+        )
+        self.assertEqual(2, events[0].value)
+        self.assertEqual(
+            ("span", "outer", ("outer",)), (events[2].kind, events[2].name, events[2].path)
+        )
+        self.assertGreaterEqual(events[2].value, events[1].value)
+
+    def test_logging(self):
+        """Test that events are logged with structured extras."""
+        with self.assertLogs("authorship.instrument", level="DEBUG") as logs:
+            with span("stage"):
+                count("things")
+        self.assertEqual(2, len(logs.records))
+        self.assertEqual("things", logs.records[0].authorship_event["name"])
+        self.assertEqual(("stage",), logs.records[1].authorship_event["path"])
+
+    def test_profile(self):
+        """Test the per-stage breakdown of reading and rendering."""
+        reader = SheetReader(self.df)
+        with Profile() as profile:
+            TextWriter().to_str(reader)
+            TextWriter().to_str(reader)
+        self.assertIn(("get_authorship", "authors"), profile.stages)
+        self.assertEqual(2, profile.stages["get_authorship",].calls)
+        self.assertEqual(2, profile.stages["render:TextWriter",].calls)
+        self.assertEqual(4, profile.counters["authors"])
+        self.assertEqual(3, profile.counters["institutions"])
+        self.assertEqual(1, profile.counters["reader_cache_hits"])
+        self.assertEqual(1, profile.counters["render_cache_hits"])
+        lines = profile.to_str().splitlines()
+        self.assertTrue(lines[0].startswith("stage"))
+        self.assertTrue(lines[1].startswith("get_authorship"))
+        self.assertIn("  authors", profile.to_str())
+        self.assertFalse(is_enabled())
+
+    def test_cli(self):
+        """Test profiling the command line interface."""
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory).joinpath("sheet.tsv")
+            path.write_text("Instructions\n" + self.df.to_csv(sep="\t", index=False))
+            output = Path(directory).joinpath("profile.pstats")
+            result = CliRunner().invoke(
+                main, ["--profile", "--profile-output", str(output), "render", str(path)]
+            )
+            self.assertEqual(0, result.exit_code, msg=result.output)
+            self.assertEqual(TextWriter().to_str(SheetReader(self.df)) + "\n", result.stdout)
+            self.assertIn("read_file", result.stderr)
+            self.assertIn("render:TextWriter", result.stderr)
+            self.assertTrue(output.is_file())
@@ -0,0 +1,100 @@
+"""Tests for memoization of parsing and rendering."""
+
+import unittest
+from typing import Iterable
+from unittest import mock
+
+import pandas as pd
+
+from authorship.memo import LRUCache, clear_caches, hash_kwargs, reader_cache, render_cache
+from authorship.models import Authorship, InstitutionRegistry
+from authorship.readers import SheetReader, google_sheets
+from authorship.writers import TextWriter
+from tests.constants import HOYT_COLUMNS, HOYT_ROWS
+
+
+class CountingWriter(TextWriter):
+    """A writer that counts how many times it renders."""
+
+    calls = 0
+
+    def iter_lines(self, authorship: Authorship) -> Iterable[str]:
+        """Iterate over text lines and count the call."""
+        CountingWriter.calls += 1
+        yield from super().iter_lines(authorship)
+
+
+class TestMemo(unittest.TestCase):
+    """Test memoization of parsing and rendering."""
+
+    def setUp(self) -> None:
+        """Set up the test case with empty caches."""
+        clear_caches()
+        CountingWriter.calls = 0
+        self.df = pd.DataFrame(HOYT_ROWS, columns=HOYT_COLUMNS, dtype=str)
+
+    def test_lru(self):
+        """Test the least recently used value is evicted."""
+        cache: LRUCache[str, int] = LRUCache(maxsize=2)
+        self.assertEqual(1, cache.get_or_set("a", lambda: 1))
+        self.assertEqual(2, cache.get_or_set("b", lambda: 2))
+        self.assertEqual(1, cache.get_or_set("a", lambda: -1))
+        self.assertEqual(3, cache.get_or_set("c", lambda: 3))
+        self.assertNotIn("b", cache)
+        self.assertIn("a", cache)
+        self.assertEqual((1, 3), (cache.hits, cache.misses))
+
+    def test_reader(self):
+        """Test equivalent readers only parse once."""
+        with mock.patch.object(
+            google_sheets, "get_values", wraps=google_sheets.get_values
+        ) as get_values:
+            authorship = SheetReader(self.df).get_authorship()
+            self.assertIs(authorship, SheetReader(self.df.copy()).get_authorship())
+            self.assertEqual(1, get_values.call_count)
+
+            unsorted = SheetReader(self.df, sort_middle_authors=False).get_authorship()
+            self.assertIsNot(authorship, unsorted)
+            self.assertEqual(2, get_values.call_count)
+
+            df = self.df.copy()
+            df.iloc[0, 0] = "Zoe"
+            self.assertEqual("Zoe", SheetReader(df).get_authorship().authors[2].first)
+            self.assertEqual(3, get_values.call_count)
+        self.assertEqual(3, len(reader_cache))
+
+    def test_registry(self):
+        """Test readers with different registries don't share authorships."""
+        registry = InstitutionRegistry()
+        authorship = SheetReader(self.df, registry=registry).get_authorship()
+        self.assertIs(authorship, SheetReader(self.df, registry=registry).get_authorship())
+        # a new registry can reuse the memory address of a garbage collected one
+        del registry
+        other = InstitutionRegistry()
+        rv = SheetReader(self.df, registry=other).get_authorship()
+        self.assertIsNot(authorship, rv)
+        self.assertIn(rv.institutions[0], other)
+        self.assertNotIn(" at 0x", hash_kwargs(SheetReader(self.df, registry=other)))
+
+    def test_writer(self):
+        """Test rendering the same authorship twice only renders once."""
+        reader = SheetReader(self.df)
+        writer = CountingWriter()
+        text = writer.to_str(reader)
+        self.assertEqual(text, CountingWriter().to_str(reader.get_authorship().model_copy()))
+        self.assertEqual(1, CountingWriter.calls)
+        self.assertEqual(text, "\n".join(writer.to_lines(reader)))
+        self.assertEqual(2, CountingWriter.calls)
+        self.assertEqual(1, len(render_cache))
+
+    def test_hash(self):
+        """Test the hash of an authorship is computed once, and not copied."""
+        authorship = SheetReader(self.df).get_authorship()
+        with mock.patch.object(
+            Authorship, "model_dump_json", wraps=authorship.model_dump_json
+        ) as model_dump_json:
+            expected = authorship.get_hash()
+            self.assertEqual(expected, authorship.get_hash())
+            self.assertEqual(1, model_dump_json.call_count)
+        copy = authorship.model_copy(update={"authors": authorship.authors[1:]})
+        self.assertNotEqual(expected, copy.get_hash())
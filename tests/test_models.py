@@ -0,0 +1,192 @@
+"""Tests for models."""
+
+import unittest
+
+from pydantic import ValidationError
+
+from authorship.models import (
+    AffiliationIndex,
+    Author,
+    Authorship,
+    Institution,
+    InstitutionRegistry,
+    construct_many,
+)
+
+
+def _author(last: str, institutions: list[Institution]) -> Author:
+    return Author(
+        first="A", last=last, email="a@example.org", orcid="0000", institutions=institutions
+    )
+
+
+class TestAffiliationIndex(unittest.TestCase):
+    """Test the affiliation index."""
+
+    def test_index(self):
+        """Test institutions are numbered in order of first appearance, by name."""
+        a, b, c = (Institution(name=name) for name in "ABC")
+        authorship = Authorship(
+            authors=[
+                _author("X", [b]),
+                _author("Y", [a, Institution(name="B", address="somewhere")]),
+                _author("Z", [c, a]),
+            ],
+            institutions=[a, b, c],
+        )
+        index = authorship.affiliation_index
+        self.assertEqual(
+            AffiliationIndex(institutions=[b, a, c], author_ids=[[0], [1, 0], [2, 1]]), index
+        )
+        self.assertIs(index, authorship.affiliation_index)
+        # the cached index doesn't affect equality
+        self.assertEqual(authorship, Authorship.model_validate(authorship.model_dump()))
+        # copies with other authors get their own index
+        copy = authorship.model_copy(update={"authors": authorship.authors[2:]})
+        self.assertEqual([c, a], copy.affiliation_index.institutions)
+        self.assertEqual([], authorship.model_copy(update={"authors": []}).affiliation_index[0])
+        self.assertIs(index, authorship.affiliation_index)
+
+    def test_assign(self):
+        """Test the cached index and hash are recomputed after a field is assigned."""
+        a, b = Institution(name="A"), Institution(name="B")
+        authorship = Authorship(authors=[_author("X", [a])], institutions=[a, b])
+        index, hash_ = authorship.affiliation_index, authorship.get_hash()
+        authorship.authors = [_author("Y", [b])]
+        self.assertEqual([b], authorship.affiliation_index.institutions)
+        self.assertNotEqual(hash_, authorship.get_hash())
+        self.assertEqual(
+            Authorship.model_validate(authorship.model_dump()).get_hash(), authorship.get_hash()
+        )
+        self.assertIsNot(index, authorship.affiliation_index)
+
+
+class TestConstructMany(unittest.TestCase):
+    """Test constructing models in bulk."""
+
+    def test_construct(self):
+        """Test constructed models are the same as validated ones."""
+        a = Institution(name="A")
+        columns = {
+            "first": ["A", "B"],
+            "middle": [None, "C"],
+            "last": ["X", "Y"],
+            "email": ["a@example.org", "b@example.org"],
+            "orcid": ["0000", "0001"],
+            "institutions": [[a], []],
+        }
+        authors = construct_many(Author, columns)
+        self.assertEqual(
+            [
+                Author(first="A", last="X", email="a@example.org", orcid="0000", institutions=[a]),
+                Author(
+                    first="B",
+                    middle="C",
+                    last="Y",
+                    email="b@example.org",
+                    orcid="0001",
+                    institutions=[],
+                ),
+            ],
+            authors,
+        )
+        self.assertIsNone(authors[0].homepage)
+        self.assertEqual("B C Y", authors[1].name)
+
+        # the constructed models can still be modified
+        authors[0].homepage = "https://example.org"
+        self.assertEqual("https://example.org", authors[0].homepage)
+        self.assertIsNone(authors[1].homepage)
+        self.assertNotIn("homepage", authors[1].model_fields_set)
+
+    def test_dump(self):
+        """Test constructed models dump like validated ones, whatever the column order."""
+        columns = {
+            "orcid": ["0000"],
+            "institutions": [[Institution(name="A")]],
+            "last": ["X"],
+            "first": ["A"],
+            "email": ["a@example.org"],
+        }
+        (author,) = construct_many(Author, columns)
+        self.assertEqual(
+            Author(**{key: values[0] for key, values in columns.items()}).model_dump_json(),
+            author.model_dump_json(),
+        )
+        self.assertEqual(set(columns), author.model_fields_set)
+        authorship = Authorship(authors=[author], institutions=author.institutions)
+        self.assertEqual(
+            Authorship.model_validate(authorship.model_dump()).get_hash(), authorship.get_hash()
+        )
+
+    def test_sharded(self):
+        """Test constructing models in a process pool keeps their order and nested models."""
+        a, b = Institution(name="A"), Institution(name="B")
+        n = 7
+        columns = {
+            "first": [f"F{i}" for i in range(n)],
+            "last": [f"L{i}" for i in range(n)],
+            "email": [f"{i}@example.org" for i in range(n)],
+            "orcid": [f"{i:04}" for i in range(n)],
+            "institutions": [[a, b][: i % 3] for i in range(n)],
+        }
+        authors = construct_many(Author, columns, n_jobs=3)
+        self.assertEqual(construct_many(Author, columns), authors)
+        self.assertEqual(
+            [author.model_dump_json() for author in construct_many(Author, columns)],
+            [author.model_dump_json() for author in authors],
+        )
+        self.assertIs(a, authors[1].institutions[0])
+        self.assertIs(b, authors[5].institutions[1])
+        # values are checked in the processes, and nested models in this process
+        with self.assertRaises(ValidationError):
+            construct_many(Institution, {"name": ["A", None]}, n_jobs=2)
+        with self.assertRaises(ValidationError):
+            construct_many(Author, {**columns, "institutions": [["A"]] * n}, n_jobs=2)
+
+    def test_invalid(self):
+        """Test invalid values fall back to validation, which raises the usual error."""
+        with self.assertRaises(ValidationError):
+            construct_many(Institution, {"name": ["A", None]})
+        with self.assertRaises(ValidationError):
+            construct_many(Institution, {"name": ["A"], "address": [float("nan")]})
+
+
+class TestInstitutionRegistry(unittest.TestCase):
+    """Test interning institutions."""
+
+    def test_intern(self):
+        """Test institutions with the same values are interned as one object."""
+        registry = InstitutionRegistry()
+        a = registry.intern(Institution(name="Inst A", ror="01"))
+        self.assertIs(a, registry.intern(Institution(name="Inst A", ror="01")))
+        # same ROR, but different values aren't merged
+        a2 = registry.intern(Institution(name="Inst  a", ror="01"))
+        self.assertIsNot(a, a2)
+        self.assertEqual(2, len(registry))
+
+        institutions = registry.intern_many(
+            {"name": ["Inst B", "Inst A", "Inst B"], "ror": [None, "01", None]}
+        )
+        self.assertIs(a, institutions[1])
+        self.assertIs(institutions[0], institutions[2])
+        self.assertEqual(Institution(name="Inst B"), institutions[0])
+        self.assertEqual(3, len(registry))
+        self.assertIn(Institution(name="Inst B"), registry)
+
+        self.assertIs(a, registry.lookup(ror="01"))
+        self.assertIs(a, registry.lookup(name=" inst A"))
+        self.assertIs(a, registry.lookup(wikidata="Q1", name="INST a"))
+        self.assertIsNone(registry.lookup(wikidata="Q1"))
+
+    def test_intern_authorship(self):
+        """Test interning the institutions of an authorship."""
+        registry = InstitutionRegistry()
+        a = registry.intern(Institution(name="A"))
+        authorship = Authorship(
+            authors=[_author("X", [Institution(name="A")])], institutions=[Institution(name="A")]
+        )
+        interned = registry.intern_authorship(authorship)
+        self.assertEqual(authorship, interned)
+        self.assertIs(a, interned.institutions[0])
+        self.assertIs(a, interned.authors[0].institutions[0])
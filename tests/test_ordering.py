@@ -0,0 +1,127 @@
+"""Tests for strategies for ordering authors."""
+
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from authorship.constants import hoyt_sort_key
+from authorship.ordering import (
+    CollationSorter,
+    ConsortiumSorter,
+    ContributionSorter,
+    NameSorter,
+    PinnedSorter,
+    sorter_resolver,
+)
+from authorship.readers import SheetReader
+from tests.constants import HOYT_COLUMNS, N
+
+#: Last names, roles, and ORCIDs of a sheet with more middle authors
+ROWS = [
+    ("Zulu", N, "z"),
+    ("Senior", "Senior", "s"),
+    ("álvarez", N, "a"),
+    ("Lead", "Lead", "l"),
+    ("Baker", N, "b"),
+    ("Ávila", N, "v"),
+    (N, N, "n"),
+    ("Baker", N, "c"),
+]
+
+
+def _get_df() -> pd.DataFrame:
+    df = pd.DataFrame(N, index=range(len(ROWS)), columns=HOYT_COLUMNS, dtype=object)
+    df["First Name"] = [f"F{i}" for i in range(len(ROWS))]
+    df["Last Name"], df["Role"], df["ORCID"] = zip(*ROWS)
+    df["Email"] = [f"{orcid}@example.org" for _, _, orcid in ROWS]
+    return df
+
+
+def _get_orcids(sorter, df) -> list[str]:
+    return df["ORCID"].iloc[sorter.get_order(df)].tolist()
+
+
+class TestOrdering(unittest.TestCase):
+    """Test strategies for ordering authors."""
+
+    def setUp(self) -> None:
+        """Set up a sheet."""
+        self.df = _get_df()
+
+    def test_name(self):
+        """Test that the default sorter orders like the row-wise sort key."""
+        self.assertEqual(
+            ["l", "b", "c", "z", "v", "a", "n", "s"], _get_orcids(NameSorter(), self.df)
+        )
+        rng = np.random.default_rng(0)
+        df = pd.DataFrame(
+            {
+                "First Name": N,
+                "Middle Name": N,
+                "Last Name": rng.choice(["A", "B", "b", "C"], size=200),
+                "Role": rng.choice(["Lead", "Senior", "Middle", "Other"], size=200),
+            }
+        )
+        expected = sorted(range(len(df)), key=lambda i: hoyt_sort_key(df.values[i]))
+        self.assertEqual(expected, NameSorter().get_order(df).tolist())
+
+    def test_contribution(self):
+        """Test ordering by contribution, largest first."""
+        sorter = ContributionSorter({"z": 3, "b@example.org": 1, "c": 3, "l": 100})
+        # roles still come first, and ties are broken by last name
+        self.assertEqual(["l", "c", "z", "b", "v", "a", "n", "s"], _get_orcids(sorter, self.df))
+
+    def test_consortium(self):
+        """Test grouping by consortium."""
+        consortia = {"z": "Y", "a": "X", "b": "Y", "n": "W"}
+        self.assertEqual(
+            ["l", "c", "v", "n", "a", "b", "z", "s"],
+            _get_orcids(ConsortiumSorter(consortia), self.df),
+        )
+        self.assertEqual(
+            ["l", "c", "v", "b", "z", "n", "a", "s"],
+            _get_orcids(ConsortiumSorter(consortia, order=["Y"]), self.df),
+        )
+
+    def test_collation(self):
+        """Test ordering without regard to accents and case."""
+        self.assertEqual(
+            ["l", "a", "v", "b", "c", "z", "n", "s"], _get_orcids(CollationSorter(), self.df)
+        )
+        # ties between last names are broken by first name
+        self.df.loc[4, "First Name"] = "G"
+        self.assertEqual(
+            ["l", "a", "v", "c", "b", "z", "n", "s"], _get_orcids(CollationSorter(), self.df)
+        )
+
+    def test_pinned(self):
+        """Test pinning authors to positions."""
+        sorter = PinnedSorter({"z": 2, "s": 1, "n": -2, "missing": 5})
+        self.assertEqual(["s", "z", "l", "b", "c", "v", "n", "a"], _get_orcids(sorter, self.df))
+        sorter = PinnedSorter({"a": 1}, base=CollationSorter())
+        self.assertEqual(["a", "l", "v", "b", "c", "z", "n", "s"], _get_orcids(sorter, self.df))
+        with self.assertRaises(ValueError):
+            PinnedSorter({"a": 9}).get_order(self.df)
+        with self.assertRaises(ValueError):
+            PinnedSorter({"a": 1, "b": -8}).get_order(self.df)
+
+    def test_reader(self):
+        """Test choosing a sorter for a reader."""
+        self.df["Affiliation"] = "Inst"
+        self.df.loc[6, "Last Name"] = "Nu"
+        for sorter in ["collation", CollationSorter()]:
+            with self.subTest(sorter=sorter):
+                authorship = SheetReader(self.df, sorter=sorter).get_authorship()
+                self.assertEqual(
+                    ["l", "a", "v", "b", "c", "n", "z", "s"],
+                    [author.orcid for author in authorship.authors],
+                )
+        authorship = SheetReader(self.df, sort_middle_authors=False).get_authorship()
+        self.assertEqual(
+            [orcid for _, _, orcid in ROWS], [author.orcid for author in authorship.authors]
+        )
+        self.assertIsInstance(sorter_resolver.make("pinned", pins={}), PinnedSorter)
+        # sorters with the same configuration have the same representation
+        self.assertEqual(repr(ContributionSorter({"a": 1})), repr(ContributionSorter({"a": 1})))
+        self.assertNotEqual(repr(ContributionSorter({"a": 1})), repr(ContributionSorter({})))
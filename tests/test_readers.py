@@ -0,0 +1,216 @@
+"""Tests for readers."""
+
+import tempfile
+import unittest
+from pathlib import Path
+
+import pandas as pd
+
+from authorship.cache import SheetCache
+from authorship.memo import clear_caches
+from authorship.models import Author, Institution, InstitutionRegistry
+from authorship.readers import (
+    GoogleSheetReader,
+    OboSheetFileReader,
+    OboSheetReader,
+    SheetFileReader,
+    SheetReader,
+)
+from authorship.readers.obo_sheet import COLUMNS as OBO_COLUMNS
+from authorship.readers.obo_sheet import MissingAffiliationError
+from tests.constants import HOYT_COLUMNS, HOYT_ROWS, OBO_ROWS, N
+from tests.utils import MockSheetServer
+
+
+class TestSheetReader(unittest.TestCase):
+    """Test the Hoyt-style sheet reader."""
+
+    def setUp(self) -> None:
+        """Set up the test case with a small sheet."""
+        self.df = pd.DataFrame(HOYT_ROWS, columns=HOYT_COLUMNS, dtype=str)
+
+    def test_get_authorship(self):
+        """Test getting authors and institutions from a sheet."""
+        authorship = SheetReader(self.df).get_authorship()
+        self.assertEqual(
+            ["Lead", "Alpha", "Zulu", "Senior"],
+            [author.last for author in authorship.authors],
+        )
+        inst_a = Institution(name="Inst A", address="Address 2", ror="02")
+        inst_b = Institution(name="Inst B")
+        inst_c = Institution(name="Inst C", wikidata="")
+        self.assertEqual([inst_a, inst_c, inst_b], authorship.institutions)
+        self.assertEqual(
+            Author(
+                first="Al",
+                middle="B.",
+                last="Alpha",
+                email="a@example.org",
+                orcid="0000-0000-0000-0002",
+                wikidata="Q2",
+                institutions=[inst_c, inst_a],
+            ),
+            authorship.authors[1],
+        )
+        senior = authorship.authors[3]
+        self.assertEqual("Senior", senior.role)
+        self.assertEqual("sam", senior.twitter)
+        self.assertEqual("Nothing", senior.conflict)
+        self.assertIsNone(senior.middle)
+        self.assertIsNone(senior.wikidata)
+
+    def test_unsorted(self):
+        """Test the original row order is kept when middle authors aren't sorted."""
+        authorship = SheetReader(self.df, sort_middle_authors=False).get_authorship()
+        self.assertEqual(
+            ["Zulu", "Senior", "Alpha", "Lead"],
+            [author.last for author in authorship.authors],
+        )
+        self.assertEqual(
+            ["Inst B", "Inst A", "Inst C"],
+            [institution.name for institution in authorship.institutions],
+        )
+
+    def test_registry(self):
+        """Test institutions are shared between readers through a registry."""
+        registry = InstitutionRegistry()
+        first = SheetReader(self.df, registry=registry).get_authorship()
+        second = SheetReader(self.df.iloc[:2], registry=registry).get_authorship()
+        self.assertEqual(3, len(registry))
+        for institution in second.institutions:
+            self.assertIn(institution, registry)
+            self.assertTrue(any(institution is other for other in first.institutions))
+        self.assertIs(registry.lookup(ror="02"), first.authors[1].institutions[1])
+
+    def test_n_jobs(self):
+        """Test sharding the authors between processes gives the same authorship."""
+        expected = SheetReader(self.df).get_authorship()
+        clear_caches()
+        authorship = SheetReader(self.df, n_jobs=2).get_authorship()
+        self.assertIsNot(expected, authorship)
+        self.assertEqual(expected, authorship)
+        self.assertEqual(expected.get_hash(), authorship.get_hash())
+        self.assertIs(authorship.institutions[0], authorship.authors[0].institutions[0])
+
+
+class TestOboSheetReader(unittest.TestCase):
+    """Test the OBO community-style sheet reader."""
+
+    def test_get_authorship(self):
+        """Test getting authors and institutions from a sheet."""
+        df = pd.DataFrame(OBO_ROWS, columns=[*OBO_COLUMNS, "Code", "Organization"], dtype=str)
+        with self.assertLogs("authorship.readers.obo_sheet", level="WARNING") as logs:
+            authorship = OboSheetReader(df).get_authorship()
+        self.assertEqual(1, len(logs.records))
+        self.assertIn("Bo Beta (9)", logs.output[0])
+
+        org_one, org_two, org_three = (
+            Institution(name=name) for name in ["Org One", "Org Two", "Org Three"]
+        )
+        self.assertEqual([org_one, org_two, org_three], authorship.institutions)
+        self.assertEqual(
+            [
+                Author(
+                    first="Al",
+                    middle="B.",
+                    last="Alpha",
+                    email="a@example.org",
+                    orcid="0000-0000-0000-0001",
+                    wikidata="Q1",
+                    twitter="al",
+                    institutions=[org_one, org_two],
+                ),
+                Author(
+                    first="Bo",
+                    last="Beta",
+                    email="b@example.org",
+                    orcid="0000-0000-0000-0002",
+                    institutions=[org_two],
+                ),
+            ],
+            authorship.authors,
+        )
+
+    def test_missing_affiliations(self):
+        """Test all authors without affiliations are reported at once."""
+        rows = [
+            *OBO_ROWS,
+            ["Cy", N, "Gamma", "3", "y", "c@example.org", "0000-0000-0000-0003", N, N, "9", N, N],
+            ["Di", N, "Delta", "4", "y", "d@example.org", "0000-0000-0000-0004", N, N, N, N, N],
+            ["Cy", N, "Gamma", "5", "y", "e@example.org", "0000-0000-0000-0005", N, N, "8", N, N],
+        ]
+        df = pd.DataFrame(rows, columns=[*OBO_COLUMNS, "Code", "Organization"], dtype=str)
+        with (
+            self.assertRaises(MissingAffiliationError) as context,
+            self.assertLogs("authorship.readers.obo_sheet", level="WARNING"),
+        ):
+            OboSheetReader(df).get_authorship()
+        self.assertEqual(["Cy Gamma", "Di Delta", "Cy Gamma"], context.exception.unaffiliated)
+        # authors with the same name are reported separately
+        self.assertEqual(
+            {1: ("Bo Beta", [9]), 2: ("Cy Gamma", [9]), 4: ("Cy Gamma", [8])},
+            context.exception.missing_codes,
+        )
+
+
+class TestLazyReader(unittest.TestCase):
+    """Test that readers for google sheets download lazily."""
+
+    def test_lazy(self):
+        """Test the sheet is only downloaded when needed."""
+        df = pd.DataFrame(HOYT_ROWS, columns=HOYT_COLUMNS, dtype=str)
+        content = "Title\n" + df.to_csv(sep="\t", index=False)
+        with tempfile.TemporaryDirectory() as directory, MockSheetServer() as server:
+            server.set_sheet("sheet", content)
+            cache = SheetCache(directory, url_template=server.url_template)
+
+            reader = GoogleSheetReader("sheet", cache=cache)
+            self.assertEqual(0, server.count("sheet"))
+            authorship = reader.get_authorship()
+            self.assertEqual(1, server.count("sheet"))
+            self.assertEqual(SheetReader(df).get_authorship(), authorship)
+            self.assertIs(authorship, reader.get_authorship())
+            self.assertEqual(1, server.count("sheet"))
+
+            reader.invalidate()
+            self.assertEqual(1, server.count("sheet"))
+            reader.prefetch()
+            self.assertEqual(2, server.count("sheet"))
+            self.assertEqual(authorship, reader.get_authorship())
+            self.assertEqual(2, server.count("sheet"))
+
+
+class TestFileReaders(unittest.TestCase):
+    """Test reading local exports of sheets."""
+
+    def test_sheet_file(self):
+        """Test reading a hoyt-style sheet from files, skipping unused columns."""
+        df = pd.DataFrame(HOYT_ROWS, columns=HOYT_COLUMNS, dtype=str)
+        expected = SheetReader(df).get_authorship()
+        wide = df.assign(Notes="something")
+        with tempfile.TemporaryDirectory() as directory:
+            for name, sep in [("sheet.tsv", "\t"), ("sheet.csv", ",")]:
+                with self.subTest(name=name):
+                    path = Path(directory).joinpath(name)
+                    path.write_text("Instructions\n" + wide.to_csv(sep=sep, index=False))
+                    reader = SheetFileReader(path)
+                    self.assertEqual(HOYT_COLUMNS, list(reader.df.columns))
+                    self.assertEqual(expected, reader.get_authorship())
+
+            path = Path(directory).joinpath("sheet.xlsx")
+            wide.to_excel(path, index=False, startrow=1)
+            reader = SheetFileReader(path)
+            self.assertEqual(HOYT_COLUMNS, list(reader.df.columns))
+            self.assertEqual(expected, reader.get_authorship())
+
+    def test_obo_sheet_file(self):
+        """Test reading an OBO-style sheet from a file, skipping unused columns."""
+        df = pd.DataFrame(OBO_ROWS, columns=[*OBO_COLUMNS, "Code", "Organization"], dtype=str)
+        expected = OboSheetReader(df).get_authorship()
+        df.insert(len(OBO_COLUMNS), "Notes", "something")
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory).joinpath("sheet.tsv")
+            df.to_csv(path, sep="\t", index=False)
+            reader = OboSheetFileReader(path)
+            self.assertEqual([*OBO_COLUMNS, "Code", "Organization"], list(reader.df.columns))
+            self.assertEqual(expected, reader.get_authorship())
@@ -0,0 +1,111 @@
+"""Tests for the render server."""
+
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+from urllib.error import HTTPError
+from urllib.parse import urlencode
+from urllib.request import Request, urlopen
+
+import pandas as pd
+
+from authorship.readers import SheetReader
+from authorship.server import RenderService, make_server
+from authorship.writers import BiorxivWriter, TextWriter
+from tests.constants import HOYT_COLUMNS, HOYT_ROWS
+
+
+class TestServer(unittest.TestCase):
+    """Test the render server on a local export of a sheet."""
+
+    def setUp(self) -> None:
+        """Set up the test case with a local export and a server on a free port."""
+        self.directory = tempfile.TemporaryDirectory()
+        self.root = Path(self.directory.name)
+        self.df = pd.DataFrame(HOYT_ROWS, columns=HOYT_COLUMNS, dtype=str)
+        self.path = self.root.joinpath("sheet.tsv")
+        self.path.write_text("Instructions\n" + self.df.to_csv(sep="\t", index=False))
+        self.service = RenderService(root_directory=self.root)
+        self.server = make_server(self.service, port=0)
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+        self.url = f"http://127.0.0.1:{self.server.server_address[1]}"
+
+    def tearDown(self) -> None:
+        """Stop the server and clean up the temporary directory."""
+        self.server.shutdown()
+        self.server.server_close()
+        self.thread.join()
+        self.directory.cleanup()
+
+    def request(self, path: str, method: str = "GET", **params) -> tuple[int, str]:
+        """Make a request to the server, returning the status and the text."""
+        url = f"{self.url}{path}"
+        if params:
+            url = f"{url}?{urlencode(params)}"
+        try:
+            with urlopen(Request(url, method=method)) as response:  # noqa:S310
+                return response.status, response.read().decode("utf-8")
+        except HTTPError as e:
+            return e.code, e.read().decode("utf-8")
+
+    def test_render(self):
+        """Test rendering, which reuses the reader between requests."""
+        self.assertEqual((200, "ok"), self.request("/health"))
+
+        reader = SheetReader(self.df)
+        expected = TextWriter().to_str(reader)
+        self.assertEqual((200, expected), self.request("/render", sheet=self.path))
+        self.assertEqual(
+            (200, BiorxivWriter().to_str(reader)),
+            self.request("/render", sheet=self.path, writer="biorxiv", skiprows=1),
+        )
+        self.assertEqual(2, len(self.service._readers))
+        self.assertEqual((200, expected), self.request("/render", sheet=self.path))
+        self.assertEqual(2, len(self.service._readers))
+
+    def test_invalidate(self):
+        """Test that invalidating a source reads it again."""
+        self.request("/render", sheet=self.path)
+        df = self.df.iloc[:2]
+        self.path.write_text("Instructions\n" + df.to_csv(sep="\t", index=False))
+        # the old data is still served until it's invalidated
+        self.assertEqual(
+            TextWriter().to_str(SheetReader(self.df)), self.request("/render", sheet=self.path)[1]
+        )
+        self.assertEqual(
+            (200, "invalidated 1 readers"), self.request("/invalidate", "POST", sheet=self.path)
+        )
+        self.assertEqual(
+            (200, TextWriter().to_str(SheetReader(df))), self.request("/render", sheet=self.path)
+        )
+        self.assertEqual((200, "invalidated 1 readers"), self.request("/invalidate", "POST"))
+        self.assertEqual(0, len(self.service._readers))
+
+    def test_errors(self):
+        """Test the status codes of bad requests."""
+        self.assertEqual(404, self.request("/nope")[0])
+        self.assertEqual(400, self.request("/render")[0])
+        self.assertEqual(400, self.request("/render", sheet=self.path, writer="nope")[0])
+        self.assertEqual(500, self.request("/render", sheet=self.root.joinpath("nope.tsv"))[0])
+
+    def test_root(self):
+        """Test local files are only read from inside the root directory."""
+        expected = TextWriter().to_str(SheetReader(self.df))
+        self.assertEqual((200, expected), self.request("/render", sheet="sheet.tsv"))
+        self.assertEqual(403, self.request("/render", sheet="../sheet.tsv")[0])
+        self.assertEqual(403, self.request("/render", sheet="/etc/passwd.txt")[0])
+        self.assertEqual(403, self.request("/render", sheet="/etc/passwd", reader="sheet_file")[0])
+        with self.assertRaises(PermissionError):
+            RenderService().get_reader(str(self.path))
+
+    def test_max_readers(self):
+        """Test only the most recently used readers are kept."""
+        service = RenderService(root_directory=self.root, max_readers=2)
+        service.render("sheet.tsv")
+        service.render("sheet.tsv", reader="sheet_file")
+        service.render("sheet.tsv", reader_kwargs={"skiprows": 1})
+        self.assertEqual(2, len(service._readers))
+        self.assertEqual(0, service.invalidate("nope"))
+        self.assertEqual(2, service.invalidate("sheet.tsv"))
@@ -0,0 +1,128 @@
+"""Tests for validating sheets."""
+
+import tempfile
+import unittest
+from pathlib import Path
+
+import pandas as pd
+from click.testing import CliRunner
+
+from authorship.cli import main
+from authorship.models import Author, Authorship, Institution
+from authorship.readers import OboSheetReader, PreparedReader, SheetReader
+from authorship.readers.obo_sheet import COLUMNS as OBO_COLUMNS
+from authorship.validate import Issue, is_valid_email, is_valid_orcid
+from tests.constants import HOYT_COLUMNS, HOYT_ROWS, OBO_ROWS, N
+
+#: ORCIDs with valid checksums
+ORCIDS = ["0000-0003-4423-4370", "0000-0002-1825-0097", "0000-0002-1694-233X"]
+
+
+class TestValidate(unittest.TestCase):
+    """Test reporting all the problems in a sheet at once."""
+
+    def test_orcid(self):
+        """Test checking the format and checksum of ORCIDs."""
+        values = pd.Series([*ORCIDS, "0000-0002-1825-0098", "0000-0002-1825-009", N, "x"])
+        self.assertEqual(
+            [True, True, True, False, False, False, False], is_valid_orcid(values).tolist()
+        )
+        self.assertEqual([], is_valid_orcid(pd.Series([], dtype=object)).tolist())
+
+    def test_email(self):
+        """Test checking the syntax of emails."""
+        values = pd.Series(["a@example.org", "a@example", "a example.org", "a @example.org", N])
+        self.assertEqual([True, False, False, False, False], is_valid_email(values).tolist())
+
+    def test_sheet(self):
+        """Test validating a Hoyt-style sheet."""
+        df = pd.DataFrame(HOYT_ROWS, columns=HOYT_COLUMNS, dtype=str)
+        df["ORCID"] = [ORCIDS[0], ORCIDS[1], "0000-0000-0000-0002", ORCIDS[1]]
+        df.loc[0, "Email"] = "L@example.org"
+        df.loc[3, "Role"] = "Middle"
+        df.loc[2, "First Name"] = N
+        df.loc[0, "Affiliation"] = N
+        report = SheetReader(df).validate()
+        self.assertEqual(
+            [
+                (0, "Email", "duplicate", "L@example.org"),
+                (0, "Affiliation", "missing_affiliation", None),
+                (1, "ORCID", "duplicate", ORCIDS[1]),
+                (2, "First Name", "missing", None),
+                (2, "ORCID", "invalid_orcid", "0000-0000-0000-0002"),
+                (3, "Role", "unknown_role", "Middle"),
+                (3, "Email", "duplicate", "l@example.org"),
+                (3, "ORCID", "duplicate", ORCIDS[1]),
+            ],
+            [(issue.row, issue.column, issue.issue, issue.value) for issue in report.issues],
+        )
+        self.assertEqual("also in row 4", report.issues[0].detail)
+        self.assertEqual(4, report.n_rows)
+        self.assertFalse(report.is_valid())
+        lines = report.to_str().splitlines()
+        self.assertEqual("row 1, Email: duplicate 'L@example.org' (also in row 4)", lines[0])
+        self.assertEqual("8 problems in 4 of 4 rows", lines[-1])
+
+    def test_obo_sheet(self):
+        """Test validating an OBO community-style sheet, including organization codes."""
+        rows = [
+            *OBO_ROWS,
+            ["Cy", N, "Gamma", "3", "y", "c@example", ORCIDS[0], N, N, "x, 3", N, N],
+            ["Di", N, "Delta", "4", "y", "d@example.org", N, N, N, N, N, N],
+        ]
+        df = pd.DataFrame(rows, columns=[*OBO_COLUMNS, "Code", "Organization"], dtype=str)
+        df["ORCID"] = [ORCIDS[0], "0000-0000-0000-0003", N, ORCIDS[0], N]
+        report = OboSheetReader(df).validate()
+        self.assertEqual(
+            [
+                (0, "ORCID", "duplicate", ORCIDS[0]),
+                (1, "ORCID", "invalid_orcid", "0000-0000-0000-0003"),
+                (1, OBO_COLUMNS[-1], "unknown_affiliation_code", "9"),
+                (3, "Email", "invalid_email", "c@example"),
+                (3, "ORCID", "duplicate", ORCIDS[0]),
+                (3, OBO_COLUMNS[-1], "invalid_affiliation_code", "x"),
+                (4, "ORCID", "missing", None),
+                (4, OBO_COLUMNS[-1], "missing_affiliation", None),
+            ],
+            [(issue.row, issue.column, issue.issue, issue.value) for issue in report.issues],
+        )
+        self.assertEqual(4, report.n_rows)
+
+    def test_authorship(self):
+        """Test validating an authorship that was already constructed."""
+        institution = Institution(name="A")
+        authors = [
+            Author(
+                first="A",
+                last="A",
+                email="a@example.org",
+                orcid=ORCIDS[0],
+                role="Lead",
+                institutions=[institution],
+            ),
+            Author(first="B", last="B", email="b@", orcid=ORCIDS[1], institutions=[]),
+        ]
+        report = PreparedReader(Authorship(authors=authors, institutions=[institution])).validate()
+        self.assertEqual(
+            [
+                Issue(row=1, column="email", issue="invalid_email", value="b@"),
+                Issue(row=1, column="institutions", issue="missing_affiliation"),
+            ],
+            report.issues,
+        )
+
+    def test_cli(self):
+        """Test validating from the command line."""
+        df = pd.DataFrame(HOYT_ROWS, columns=HOYT_COLUMNS, dtype=str)
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory).joinpath("sheet.tsv")
+            path.write_text("Instructions\n" + df.to_csv(sep="\t", index=False))
+            result = CliRunner().invoke(main, ["validate", str(path)])
+            self.assertEqual(1, result.exit_code, msg=result.output)
+            self.assertIn("3 problems in 3 of 4 rows", result.stdout)
+
+            df["ORCID"] = [*ORCIDS, "0000-0000-0000-0001"]
+            path.write_text("Instructions\n" + df.to_csv(sep="\t", index=False))
+            result = CliRunner().invoke(main, ["validate", str(path), "--json"])
+            self.assertEqual(0, result.exit_code, msg=result.output)
+            self.assertIn('"issues": []', result.stdout)
@@ -1,9 +1,25 @@
 """Tests for writers."""
 
+import io
+import tempfile
 import unittest
+from pathlib import Path
+from unittest import mock
+
+import pandas as pd
 
 from authorship import writer_resolver
-from authorship.readers import GoogleSheetReader, Reader
+from authorship.readers import GoogleSheetReader, Reader, SheetReader
+from authorship.writers import (
+    ArrowWriter,
+    BiorxivWriter,
+    CitationCFFWriter,
+    ParquetWriter,
+    ScientificDataWriter,
+    TextWriter,
+    _get_writer_resolver,
+)
+from tests.constants import HOYT_COLUMNS, HOYT_ROWS
 
 
 class TestWriters(unittest.TestCase):
@@ -20,3 +36,133 @@ class TestWriters(unittest.TestCase):
         for writer_cls in writer_resolver:
             with self.subTest(writer=writer_resolver.normalize_cls(writer_cls)):
                 self.reader.print(writer_cls)
+
+
+class TestExport(unittest.TestCase):
+    """Test exporting with several writers at once."""
+
+    def setUp(self) -> None:
+        """Set up the test case with a reader for a small sheet."""
+        self.reader = SheetReader(pd.DataFrame(HOYT_ROWS, columns=HOYT_COLUMNS, dtype=str))
+
+    def test_resolver(self):
+        """Test the writers are resolved from an explicit list, in a stable order."""
+
+        class _Writer(TextWriter):
+            pass
+
+        # a resolver built after another subclass is defined is the same
+        resolver = _get_writer_resolver.__wrapped__()
+        self.assertEqual(
+            [
+                TextWriter,
+                BiorxivWriter,
+                ScientificDataWriter,
+                CitationCFFWriter,
+                ArrowWriter,
+                ParquetWriter,
+            ],
+            list(resolver),
+        )
+        self.assertEqual(list(writer_resolver), list(resolver))
+
+    def test_export_all(self):
+        """Test exporting with all writers."""
+        with tempfile.TemporaryDirectory() as directory:
+            rv = self.reader.export_all(directory=directory, max_workers=2)
+            self.assertEqual(set(writer_resolver.lookup_dict), set(rv))
+            for writer_cls in writer_resolver:
+                key = writer_resolver.normalize_cls(writer_cls)
+                with self.subTest(writer=key):
+                    path = Path(directory).joinpath(writer_cls.file_name)
+                    if writer_cls.binary:
+                        self.assertTrue(path.is_dir())
+                    else:
+                        self.assertEqual(rv[key], path.read_text())
+                    self.assertEqual(rv[key], writer_cls().to_str(self.reader))
+
+        # writers whose optional packages are missing are skipped by default
+        with (
+            tempfile.TemporaryDirectory() as directory,
+            mock.patch.object(ArrowWriter, "requires", ("not_an_installed_package",)),
+        ):
+            rv = self.reader.export_all(directory=directory)
+            self.assertNotIn("arrow", rv)
+            self.assertNotIn("parquet", rv)
+            self.assertIn("text", rv)
+            self.assertFalse(Path(directory).joinpath(ArrowWriter.file_name).exists())
+
+        self.assertEqual(
+            [
+                "Lee Lead¹",
+                "Al B. Alpha²𝄒¹",
+                "Zed Zulu³",
+                "Sam Senior¹",
+                "",
+                "1. Inst A",
+                "2. Inst C",
+                "3. Inst B",
+            ],
+            rv["text"].splitlines(),
+        )
+        self.assertEqual(
+            [
+                r"\author[1]{Lee Lead}",
+                r"\author[2,1]{Al B. Alpha}",
+                r"\author[3]{Zed Zulu}",
+                r"\author[1,*]{Sam Senior}",
+                r"\affil[1]{Inst A}",
+                r"\affil[2]{Inst C}",
+                r"\affil[3]{Inst B}",
+                r"\affil[*]{corresponding author(s): Sam Senior (s@example.org)}",
+            ],
+            rv["scientificdata"].splitlines(),
+        )
+
+    def test_export_some(self):
+        """Test exporting with a subset of writers."""
+        rv = self.reader.export_all(["text", BiorxivWriter])
+        self.assertEqual({"text", "biorxiv"}, set(rv))
+
+
+class RecordingFile(io.StringIO):
+    """A file-like object that counts writes."""
+
+    writes = 0
+
+    def write(self, s: str) -> int:
+        """Write a string and count the write."""
+        self.writes += 1
+        return super().write(s)
+
+
+class TestStreaming(unittest.TestCase):
+    """Test streaming output to files."""
+
+    def setUp(self) -> None:
+        """Set up the test case with a reader for a small sheet."""
+        self.reader = SheetReader(pd.DataFrame(HOYT_ROWS, columns=HOYT_COLUMNS, dtype=str))
+
+    def test_dump(self):
+        """Test streaming gives the same content as building the string."""
+        for writer_cls in writer_resolver:
+            with self.subTest(writer=writer_resolver.normalize_cls(writer_cls)):
+                writer = writer_cls()
+                expected = writer.to_str(self.reader)
+
+                file = RecordingFile()
+                writer.dump(self.reader, file, chunk_size=2)
+                self.assertEqual(expected, file.getvalue())
+                self.assertLess(1, file.writes)
+
+                file = io.StringIO()
+                self.reader.print(writer_cls, file=file)
+                self.assertEqual(expected + "\n", file.getvalue())
+
+                with tempfile.TemporaryDirectory() as directory:
+                    path = Path(directory).joinpath(writer_cls.file_name)
+                    writer.write(self.reader, path=path)
+                    if writer_cls.binary:
+                        self.assertTrue(path.is_dir())
+                    else:
+                        self.assertEqual(expected, path.read_text())
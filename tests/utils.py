@@ -0,0 +1,98 @@
+"""Utilities for tests."""
+
+import hashlib
+import threading
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Optional
+
+__all__ = [
+    "MockSheetServer",
+]
+
+
+class _Handler(BaseHTTPRequestHandler):
+    server: "_Server"
+    protocol_version = "HTTP/1.1"
+
+    def setup(self):
+        """Count connections, to check that clients reuse them."""
+        super().setup()
+        self.server.connections += 1
+
+    def do_GET(self):  # noqa:N802
+        """Serve a sheet export, honoring conditional requests."""
+        key = self.path.strip("/")
+        self.server.requests[key] += 1
+        failures = self.server.failures.get(key, 0)
+        if failures:
+            self.server.failures[key] = failures - 1
+            self.send_error(503)
+            return
+        content = self.server.sheets.get(key)
+        if content is None:
+            self.send_error(404)
+            return
+        etag = f'"{hashlib.sha1(content).hexdigest()}"'  # noqa:S324
+        if self.headers.get("If-None-Match") == etag:
+            self.send_response(304)
+            self.send_header("ETag", etag)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        self.send_response(200)
+        self.send_header("Content-Type", "text/tab-separated-values")
+        self.send_header("Content-Length", str(len(content)))
+        self.send_header("ETag", etag)
+        self.end_headers()
+        self.wfile.write(content)
+
+    def log_message(self, format, *args):  # noqa:A002
+        """Don't log requests."""
+
+
+class _Server(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self):
+        super().__init__(("127.0.0.1", 0), _Handler)
+        self.sheets: dict[str, bytes] = {}
+        self.failures: dict[str, int] = {}
+        self.requests: Counter[str] = Counter()
+        self.connections = 0
+
+
+class MockSheetServer:
+    """A local stand-in for the Google Sheets export endpoint."""
+
+    def __init__(self):
+        """Initialize the server on a free port."""
+        self._server = _Server()
+        self._thread: Optional[threading.Thread] = None
+        self.url_template = f"http://127.0.0.1:{self._server.server_port}/{{google_sheet}}/{{gid}}"
+
+    def set_sheet(self, google_sheet: str, content: str, gid: int = 0) -> None:
+        """Set the TSV content served for a sheet."""
+        self._server.sheets[f"{google_sheet}/{gid}"] = content.encode("utf-8")
+
+    def set_failures(self, google_sheet: str, failures: int, gid: int = 0) -> None:
+        """Make the next given number of requests for a sheet fail with a 503."""
+        self._server.failures[f"{google_sheet}/{gid}"] = failures
+
+    def count(self, google_sheet: str, gid: int = 0) -> int:
+        """Count the number of requests made for a sheet."""
+        return self._server.requests[f"{google_sheet}/{gid}"]
+
+    @property
+    def connections(self) -> int:
+        """Get the number of connections opened to the server."""
+        return self._server.connections
+
+    def __enter__(self) -> "MockSheetServer":
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def __exit__(self, *args) -> None:
+        self._server.shutdown()
+        self._server.server_close()